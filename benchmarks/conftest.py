@@ -0,0 +1,322 @@
+"""
+Configurations for the masci_tools benchmarks
+
+The inputs for the benchmarks are generated from the files of the test suite
+and scaled to the requested size (number of iterations, atoms, kpoints, ...)
+"""
+from __future__ import annotations
+
+import copy
+import inspect
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pytest
+from lxml import etree
+
+TEST_FILES = Path(__file__).parent.parent.resolve() / 'tests' / 'files'
+
+OUTXML_TEMPLATE = TEST_FILES / 'fleur' / 'Max-R6' / 'out.xml'
+INPXML_TEMPLATE = TEST_FILES / 'fleur' / 'Max-R6' / 'inp.xml'
+BANDS_TEMPLATE = TEST_FILES / 'hdf5_reader' / 'banddos_bands.hdf'
+DOS_TEMPLATE = TEST_FILES / 'hdf5_reader' / 'banddos_dos.hdf'
+GREENSF_TEMPLATE = TEST_FILES / 'fleur' / 'greensf' / 'greensf_sphavg.hdf'
+KKR_TEMPLATE = TEST_FILES / 'kkr' / 'kkr_run_slab_soc_simple'
+
+
+def _measure_peak_rss(connection: Any, func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+    """
+    Call the function (in the forked child process) and send the increase of the peak RSS to the parent
+    """
+    import resource
+
+    #The peak RSS of a forked process starts at the RSS at the time of the fork
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        func(*args, **kwargs)
+    except BaseException:  #pylint: disable=broad-except
+        connection.send(None)
+        raise
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    #ru_maxrss is given in kilobytes on Linux and in bytes on macOS
+    connection.send(peak if sys.platform == 'darwin' else peak * 1024)
+
+
+def peak_memory(func: Callable[..., Any], *args: Any, **kwargs: Any) -> int | None:
+    """
+    Measure the increase of the peak resident set size (in bytes) during one call of the given function.
+    The function is called in a forked child process, so that the peak of the benchmark process does not
+    influence the measurement. In contrast to tracemalloc this also includes the memory allocated
+    by C libraries (e.g. libxml2 and HDF5)
+
+    :returns: the peak memory or None if it cannot be measured on this platform (no fork or resource module)
+    """
+    import multiprocessing
+
+    try:
+        import resource  #pylint: disable=unused-import
+        context = multiprocessing.get_context('fork')
+    except (ImportError, ValueError):
+        return None
+
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_measure_peak_rss, args=(sender, func, args, kwargs))
+    process.start()
+    sender.close()
+    try:
+        peak = receiver.recv()
+    except EOFError:
+        peak = None
+    finally:
+        receiver.close()
+        process.join()
+    return peak
+
+
+@pytest.fixture
+def run_benchmark(benchmark):
+    """
+    Benchmark the given function and record the peak memory (RSS) of an additional call
+    in the extra_info of the benchmark (``peak_memory``)
+
+    If setup is given, it is called before each round and has to return the
+    args and kwargs for the function (for functions modifying their inputs)
+    """
+
+    def _run_benchmark(func: Callable[..., Any],
+                       *args: Any,
+                       setup: Callable[[], tuple[tuple[Any, ...], dict[str, Any]]] | None = None,
+                       rounds: int = 5,
+                       **kwargs: Any) -> Any:
+        if setup is None:
+            result = benchmark(func, *args, **kwargs)
+        else:
+            result = benchmark.pedantic(func, setup=setup, rounds=rounds)
+            args, kwargs = setup()
+        benchmark.extra_info['peak_memory'] = peak_memory(func, *args, **kwargs)
+        return result
+
+    return _run_benchmark
+
+
+@pytest.fixture
+def require_parameters():
+    """
+    Skip the benchmark if the given function does not accept all of the given parameters,
+    e.g. when the benchmarks are run against older commits with ``utils/compare_benchmarks.py``
+    """
+
+    def _require_parameters(func: Callable[..., Any], *names: str) -> None:
+        missing = [name for name in names if name not in inspect.signature(func).parameters]
+        if missing:
+            pytest.skip(f"{func.__name__} does not support the parameter(s) {', '.join(missing)}")
+
+    return _require_parameters
+
+
+@pytest.fixture(scope='session')
+def benchmark_dir(tmp_path_factory):
+    """Directory for the generated inputs of the benchmarks"""
+    return tmp_path_factory.mktemp('benchmark_inputs')
+
+
+def _generate_once(directory: Path, name: str, generator: Callable[[Path], None]) -> Path:
+    """
+    Generate the file/folder with the given name in the directory if it does not exist yet
+    """
+    path = directory / name
+    if not path.exists():
+        generator(path)
+    return path
+
+
+@pytest.fixture(scope='session')
+def outxml_file(benchmark_dir):
+    """
+    Generate an out.xml file with the given number of iterations by repeating
+    the last iteration of the template file
+    """
+
+    def _generate(path: Path, n_iterations: int) -> None:
+        xmltree = etree.parse(os.fspath(OUTXML_TEMPLATE))
+        iterations = xmltree.xpath('/fleurOutput/scfLoop/iteration')
+        scf_loop = iterations[0].getparent()
+        template = iterations[-1]
+        for iteration in iterations:
+            scf_loop.remove(iteration)
+        for index in range(1, n_iterations + 1):
+            iteration = copy.deepcopy(template)
+            iteration.set('numberForCurrentRun', f'{index:5d}')
+            iteration.set('overallNumber', f'{index:5d}')
+            scf_loop.append(iteration)
+        xmltree.write(os.fspath(path), encoding='utf-8')
+
+    def _outxml_file(n_iterations: int) -> Path:
+        return _generate_once(benchmark_dir, f'out_{n_iterations}.xml', lambda path: _generate(path, n_iterations))
+
+    return _outxml_file
+
+
+@pytest.fixture(scope='session')
+def inpxml_file(benchmark_dir):
+    """
+    Generate an inp.xml file with the given number of atoms (random positions in the atom group
+    of the template file) and an explicit list with the given number of kpoints
+    """
+    from masci_tools.io.fleur_xml import load_inpxml
+    from masci_tools.util.xml.common_functions import clear_xml
+    from masci_tools.util.xml.xml_setters_names import set_kpointlist
+
+    def _generate(path: Path, n_atoms: int, n_kpoints: int) -> None:
+        rng = np.random.default_rng(42)
+        xmltree, schema_dict = load_inpxml(os.fspath(INPXML_TEMPLATE))
+        xmltree, _ = clear_xml(xmltree)
+
+        atomgroup = xmltree.xpath('/fleurInput/atomGroups/atomGroup')[0]
+        positions = atomgroup.xpath('relPos')
+        for position in positions:
+            atomgroup.remove(position)
+        for index, coordinates in enumerate(rng.random((n_atoms, 3))):
+            position = copy.deepcopy(positions[0])
+            position.set('label', f'{index+1:20d}')
+            position.text = ' '.join(f'{coord:.10f}' for coord in coordinates)
+            atomgroup.insert(index, position)
+
+        kpoints = rng.random((n_kpoints, 3))
+        weights = np.full(n_kpoints, 1 / n_kpoints)
+        set_kpointlist(xmltree, schema_dict, kpoints, weights, name='benchmark', switch=True)
+
+        etree.indent(xmltree)
+        xmltree.write(os.fspath(path), encoding='utf-8')
+
+    def _inpxml_file(n_atoms: int, n_kpoints: int = 10) -> Path:
+        return _generate_once(benchmark_dir, f'inp_{n_atoms}_{n_kpoints}.xml',
+                              lambda path: _generate(path, n_atoms, n_kpoints))
+
+    return _inpxml_file
+
+
+def _scale_hdf_file(template: Path, path: Path, axes: dict[str, int], repeats: int) -> None:
+    """
+    Copy the given hdf file and repeat the datasets along the given axis.
+    The axes are given for dataset names or groups (the longest matching name is used).
+    All attributes are copied unchanged
+    """
+    import h5py
+
+    with h5py.File(template, 'r') as source, h5py.File(path, 'w') as target:
+
+        def copy_item(name: str, item: Any) -> None:
+            if isinstance(item, h5py.Group):
+                target.require_group(name).attrs.update(item.attrs)
+                return
+            data = item[()]
+            matches = [key for key in axes if name == key or name.startswith(f'{key}/')]
+            if matches:
+                data = np.concatenate([data] * repeats, axis=axes[max(matches, key=len)])
+            target.create_dataset(name, data=data)
+            target[name].attrs.update(item.attrs)
+
+        source.visititems(copy_item)
+
+
+@pytest.fixture(scope='session')
+def bands_file(benchmark_dir):
+    """
+    Generate a banddos.hdf file for bandstructures with the kpoints of the template file repeated
+    """
+
+    def _generate(path: Path, repeats: int) -> None:
+        import h5py
+
+        _scale_hdf_file(BANDS_TEMPLATE, path, {
+            'Local/BS': 1,
+            'Local/BS/kpts': 0,
+            'kpts/coordinates': 0,
+            'kpts/weights': 0
+        }, repeats)
+        with h5py.File(path, 'a') as file:
+            file['kpts'].attrs['nkpt'] = np.array([file['kpts/weights'].shape[0]], dtype=np.int32)
+
+    def _bands_file(repeats: int) -> Path:
+        return _generate_once(benchmark_dir, f'banddos_bands_{repeats}.hdf', lambda path: _generate(path, repeats))
+
+    return _bands_file
+
+
+@pytest.fixture(scope='session')
+def dos_file(benchmark_dir):
+    """
+    Generate a banddos.hdf file for DOS with the energy grid of the template file repeated
+    """
+
+    def _dos_file(repeats: int) -> Path:
+        return _generate_once(benchmark_dir, f'banddos_dos_{repeats}.hdf',
+                              lambda path: _scale_hdf_file(DOS_TEMPLATE, path, {'Local/DOS': -1}, repeats))
+
+    return _dos_file
+
+
+@pytest.fixture(scope='session')
+def kkr_folder(benchmark_dir):
+    """
+    Generate a folder with the output files of a KKR calculation with the given number
+    of iterations by repeating the last iteration in the ``out_kkr`` file of the template
+    """
+
+    def _generate(path: Path, n_iterations: int) -> None:
+        shutil.copytree(KKR_TEMPLATE, path)
+
+        with open(KKR_TEMPLATE / 'out_kkr', encoding='utf-8') as file:
+            lines = file.read().split('\n')
+
+        finished = [index for index, line in enumerate(lines) if line.startswith('Iteration finished')]
+        header = lines[:finished[0] + 1]
+        iteration = lines[finished[-3] + 1:finished[-2] + 1]
+        footer = lines[finished[-2] + 1:]
+
+        def renumber(lines: list[str], index: int) -> list[str]:
+            return [
+                f'      ITERATION{index:4d}{line[19:]}' if line.startswith('      ITERATION') else line
+                for line in lines
+            ]
+
+        #The header contains the first iteration and the footer the last one
+        content = header
+        for index in range(2, n_iterations):
+            content.extend(renumber(iteration, index))
+        content.extend(renumber(footer, n_iterations))
+
+        with open(path / 'out_kkr', 'w', encoding='utf-8') as file:
+            file.write('\n'.join(content))
+
+    def _kkr_folder(n_iterations: int) -> Path:
+        return _generate_once(benchmark_dir, f'kkr_{n_iterations}', lambda path: _generate(path, n_iterations))
+
+    return _kkr_folder
+
+
+@pytest.fixture(scope='session')
+def intersite_greensfunctions():
+    """
+    Create a list of intersite Green's functions for the given number of shells
+    (each with six neighbours) from the element in the template file
+    """
+    from masci_tools.tools.greensfunction import GreensFunction
+
+    template = GreensFunction.fromFile(GREENSF_TEMPLATE, index=1)
+
+    def _intersite_greensfunctions(n_shells: int) -> list[GreensFunction]:
+        greensfunctions = []
+        for shell in range(1, n_shells + 1):
+            for direction in np.concatenate([np.eye(3), -np.eye(3)]):
+                greensfunction = copy.deepcopy(template)
+                greensfunction.element = template.element._replace(onsite=False, atomDiff=shell * direction)
+                greensfunctions.append(greensfunction)
+        return greensfunctions
+
+    return _intersite_greensfunctions
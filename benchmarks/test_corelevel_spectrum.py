@@ -0,0 +1,37 @@
+"""
+Benchmarks for the construction of corelevel spectra with many inequivalent atoms
+"""
+import pytest
+
+
+def corelevels(n_atoms):
+    """Corelevel dict and number of atoms for the given number of inequivalent atoms"""
+    import numpy as np
+
+    rng = np.random.default_rng(42)
+    return {'Be': {'1s1/2': list(rng.uniform(-5, 5, n_atoms))}}, {'Be': [1] * n_atoms}
+
+
+@pytest.mark.parametrize('method', ['direct', 'fft'])
+@pytest.mark.parametrize('peakfunction', ['voigt', 'asymmetric_lorentz_gauss_conv'])
+@pytest.mark.parametrize('n_atoms', [10, 1000])
+def test_construct_corelevel_spectrum(run_benchmark, require_parameters, n_atoms, peakfunction, method):
+    """
+    Benchmark of the construction of corelevel spectra on a fine energy grid
+    """
+    from masci_tools.vis.plot_methods import construct_corelevel_spectrum
+
+    #The direct method is the default, so it can also be compared to versions without the method parameter
+    kwargs = {}
+    if method != 'direct':
+        require_parameters(construct_corelevel_spectrum, 'method', 'single_peaks')
+        kwargs = {'method': method, 'single_peaks': False}
+
+    coreleveldict, natom_typesdict = corelevels(n_atoms)
+    result = run_benchmark(construct_corelevel_spectrum,
+                           coreleveldict,
+                           natom_typesdict,
+                           peakfunction=peakfunction,
+                           energy_grid=0.01,
+                           **kwargs)
+    assert len(result[1]) == len(result[0])
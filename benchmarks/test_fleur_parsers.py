@@ -0,0 +1,51 @@
+"""
+Benchmarks for the fleur XML file parsers
+"""
+import pytest
+
+
+@pytest.mark.parametrize('n_iterations', [10, 100])
+def test_outxml_parser(run_benchmark, outxml_file, n_iterations):
+    """
+    Benchmark of the outxml_parser for files with many iterations
+    """
+    from masci_tools.io.parsers.fleur import outxml_parser
+
+    result = run_benchmark(outxml_parser, outxml_file(n_iterations), iteration_to_parse='all')
+    assert len(result['energy']) == n_iterations
+
+
+@pytest.mark.parametrize('iteration_output', ['numpy', 'pandas'])
+def test_outxml_parser_iteration_output(run_benchmark, require_parameters, outxml_file, iteration_output):
+    """
+    Benchmark of the outxml_parser with the columnar output of the iteration quantities
+    """
+    from masci_tools.io.parsers.fleur import outxml_parser
+
+    require_parameters(outxml_parser, 'iteration_output')
+
+    result = run_benchmark(outxml_parser, outxml_file(100), iteration_to_parse='all', iteration_output=iteration_output)
+    assert result['number_of_iterations_total'] == 100
+
+
+@pytest.mark.parametrize('n_atoms', [10, 100, 1000])
+def test_inpxml_parser_atoms(run_benchmark, inpxml_file, n_atoms):
+    """
+    Benchmark of the inpxml_parser for files with many atoms
+    """
+    from masci_tools.io.parsers.fleur import inpxml_parser
+
+    result = run_benchmark(inpxml_parser, inpxml_file(n_atoms))
+    assert len(result['atomGroups'][0]['relPos']) == n_atoms
+
+
+@pytest.mark.parametrize('n_kpoints', [100, 1000, 10000])
+def test_inpxml_parser_kpoints(run_benchmark, inpxml_file, n_kpoints):
+    """
+    Benchmark of the inpxml_parser for files with explicit lists of many kpoints
+    """
+    from masci_tools.io.parsers.fleur import inpxml_parser
+
+    result = run_benchmark(inpxml_parser, inpxml_file(2, n_kpoints))
+    kpoint_list = [kpts for kpts in result['cell']['bzIntegration']['kPointLists'] if kpts['name'] == 'benchmark'][0]
+    assert len(kpoint_list['kPoint']) == n_kpoints
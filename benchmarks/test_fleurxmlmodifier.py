@@ -0,0 +1,44 @@
+"""
+Benchmarks for the FleurXMLModifier
+"""
+import pytest
+
+
+@pytest.mark.parametrize('n_atoms', [10, 100, 1000])
+def test_modify_xmlfile(run_benchmark, inpxml_file, n_atoms):
+    """
+    Benchmark of modify_xmlfile with typical changes for input files with many atoms
+    """
+    import numpy as np
+    from masci_tools.io.fleurxmlmodifier import FleurXMLModifier
+
+    fm = FleurXMLModifier()
+    fm.set_inpchanges({'itmax': 30, 'Kmax': 4.0, 'Gmax': 12.0})
+    fm.set_species('all', {'lo': [{'n': 3, 'l': 0, 'type': 'SCLO'}]})
+    fm.set_atomgroup({'force': {'calculate': True, 'relaxXYZ': 'TTF'}}, position='all')
+    fm.set_kpointlist(np.full((1000, 3), 0.25), np.full(1000, 1e-3), name='modified', switch=True)
+
+    xmltree, _ = run_benchmark(fm.modify_xmlfile, inpxml_file(n_atoms))
+    assert len(xmltree.xpath('//relPos')) == n_atoms
+
+
+@pytest.mark.parametrize('n_variants', [10, 50])
+def test_modify_many(run_benchmark, inpxml_file, n_variants):
+    """
+    Benchmark of modify_many for a scan over many variants
+    """
+    from masci_tools.io.fleurxmlmodifier import FleurXMLModifier
+
+    if not hasattr(FleurXMLModifier, 'modify_many'):
+        pytest.skip('FleurXMLModifier.modify_many is not available')
+
+    fm = FleurXMLModifier()
+    fm.set_inpchanges({'itmax': 1})
+
+    variants = [[('set_inpchanges', {'changes': {'Kmax': 3.0 + 0.05 * index}})] for index in range(n_variants)]
+
+    def modify_many(inpxmlfile):
+        return list(fm.modify_many(inpxmlfile, variants))
+
+    result = run_benchmark(modify_many, inpxml_file(100))
+    assert len(result) == n_variants
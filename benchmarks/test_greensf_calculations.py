@@ -0,0 +1,22 @@
+"""
+Benchmarks for the calculations with Green's functions
+"""
+import pytest
+
+
+@pytest.mark.parametrize('n_shells', [5, 20])
+def test_calculate_heisenberg_jij(run_benchmark, intersite_greensfunctions, n_shells):
+    """
+    Benchmark of the Jij calculation for many Green's function elements
+    """
+    import numpy as np
+    from masci_tools.tools.greensf_calculations import calculate_heisenberg_jij
+
+    onsite_delta = np.array([[None, None, 1.8348, None]])
+
+    #The Green's functions are modified during the calculation, so they are recreated for each round
+    def setup():
+        return (intersite_greensfunctions(n_shells),), {'reference_atom': 1, 'onsite_delta': onsite_delta}
+
+    jij_constants = run_benchmark(calculate_heisenberg_jij, setup=setup)
+    assert len(jij_constants) == 6 * n_shells
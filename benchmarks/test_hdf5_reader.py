@@ -0,0 +1,34 @@
+"""
+Benchmarks for the HDF5Reader with the fleur recipes for the banddos.hdf files
+"""
+import pytest
+
+
+def read_file(path, recipe):
+    """Read the given file with the given recipe"""
+    from masci_tools.io.parsers.hdf5 import HDF5Reader
+
+    with HDF5Reader(path) as reader:
+        return reader.read(recipe=recipe)
+
+
+@pytest.mark.parametrize('repeats', [10, 100, 1000])
+def test_read_bands(run_benchmark, bands_file, repeats):
+    """
+    Benchmark of reading bandstructures with many kpoints
+    """
+    from masci_tools.io.parsers.hdf5.recipes import FleurBands
+
+    data, _ = run_benchmark(read_file, bands_file(repeats), FleurBands)
+    assert len(data['kpath']) == 20 * repeats * 18
+
+
+@pytest.mark.parametrize('repeats', [10, 100])
+def test_read_dos(run_benchmark, dos_file, repeats):
+    """
+    Benchmark of reading DOS with many energy points
+    """
+    from masci_tools.io.parsers.hdf5.recipes import FleurDOS
+
+    data, _ = run_benchmark(read_file, dos_file(repeats), FleurDOS)
+    assert len(data['energy_grid']) == 1321 * repeats
@@ -0,0 +1,23 @@
+"""
+Benchmarks for the KKR output parser
+"""
+import pytest
+
+
+@pytest.mark.parametrize('n_iterations', [10, 100, 1000])
+def test_parse_kkr_outputfile(run_benchmark, kkr_folder, n_iterations):
+    """
+    Benchmark of parse_kkr_outputfile for calculations with many iterations
+    """
+    import os
+    from masci_tools.io.parsers.kkrparser_functions import parse_kkr_outputfile
+
+    folder = kkr_folder(n_iterations)
+    files = [
+        os.fspath(folder / name) for name in ('out_kkr', 'output.0.txt', 'output.000.txt', 'out_timing.000.txt',
+                                              'out_potential', 'nonco_angle_out.dat')
+    ]
+
+    success, msg_list, out_dict = run_benchmark(lambda: parse_kkr_outputfile({}, *files))
+    assert success, msg_list
+    assert len(out_dict['convergence_group']['rms_all_iterations']) == n_iterations
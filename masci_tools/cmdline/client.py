@@ -0,0 +1,96 @@
+"""
+Thin client for the ``masci-tools serve`` command. Sends the given command to the server
+listening on a Unix socket and prints its output. Only modules from the standard library
+are imported, so that the startup is fast
+
+Usage::
+
+    masci-tools-client [--socket PATH] parse constants inp.xml
+
+The socket can also be given with the environment variable ``MASCI_TOOLS_SOCKET``.
+If no server is available the command is run in this process (like ``masci-tools``)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+SOCKET_ENV_VARIABLE = 'MASCI_TOOLS_SOCKET'
+
+
+def send_request(socket_path: os.PathLike | str, request: dict[str, Any]) -> dict[str, Any]:
+    """
+    Send the request to the server listening on the given socket
+
+    :param socket_path: path of the Unix socket of the server
+    :param request: dict with the request (see :py:mod:`masci_tools.cmdline.commands.serve`)
+
+    :returns: dict with the response of the server
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(os.fspath(socket_path))
+        sock.sendall(f'{json.dumps(request)}\n'.encode('utf-8'))
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile('r', encoding='utf-8') as response:
+            return json.loads(response.readline())
+
+
+def run_local(args: list[str]) -> int:
+    """
+    Run the command in this process, if no server is available
+
+    :param args: arguments of the command
+
+    :returns: exit code of the command
+    """
+    from masci_tools.cmdline.commands.root import cli
+
+    try:
+        cli.main(args, prog_name='masci-tools')
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point of the client
+
+    :param argv: list of the command line arguments (by default ``sys.argv``)
+
+    :returns: exit code of the command
+    """
+    parser = argparse.ArgumentParser(prog='masci-tools-client',
+                                     description='Run masci-tools parse/validate commands on a masci-tools server')
+    parser.add_argument('--socket',
+                        default=os.environ.get(SOCKET_ENV_VARIABLE),
+                        help=f'Unix socket of the server (default: environment variable {SOCKET_ENV_VARIABLE})')
+    parser.add_argument('--shutdown', action='store_true', help='Stop the server')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Arguments of the masci-tools command')
+    options = parser.parse_args(argv)
+
+    if options.shutdown:
+        if options.socket is None:
+            parser.error('No socket given')
+        send_request(options.socket, {'shutdown': True})
+        return 0
+
+    if options.socket is None:
+        return run_local(options.args)
+
+    try:
+        response = send_request(options.socket, {'args': options.args, 'cwd': os.getcwd()})
+    except (OSError, ValueError):
+        return run_local(options.args)
+
+    sys.stdout.write(response.get('stdout', ''))
+    sys.stderr.write(response.get('stderr', ''))
+    return response.get('exit_code', 1)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
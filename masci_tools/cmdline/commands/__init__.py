@@ -1,4 +1,4 @@
 """
-Import all the command groups to include in the cli
+Command groups included in the cli. The modules are imported lazily
+when the commands are invoked (see ``SUBCOMMANDS`` in :py:mod:`masci_tools.cmdline.commands.root`)
 """
-from . import (convert_inpgen, fleur_schema, parse, plot, tools)
@@ -1,7 +1,6 @@
 """
 CLI commands for converting common structure definition formats to fleur inpgen files
 """
-from .root import cli
 import click
 
 from pathlib import Path
@@ -22,7 +21,7 @@ except ImportError:
     ase = None
 
 
-@cli.command('convert-inpgen')
+@click.command('convert-inpgen')
 @click.argument('input-file', type=click.Path(exists=True, path_type=Path, resolve_path=True))
 @click.argument('output-file', type=click.Path(path_type=Path, resolve_path=True))
 @click.option('-c',
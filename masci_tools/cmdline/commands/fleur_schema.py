@@ -1,7 +1,6 @@
 """
 CLI commands for interacting with the fleur schemas in the masci-tools repository
 """
-from .root import cli
 import click
 
 import masci_tools
@@ -28,7 +27,7 @@ except ImportError:
     gitlab = None
 
 
-@cli.group('fleur-schema')
+@click.group('fleur-schema')
 def fleur_schema():
     """Commands related to the Fleur XML Schemas"""
 
@@ -129,7 +128,7 @@ def add_fleur_schema(schema_file, test_xml_file, overwrite, branch, api_key, fro
         echo.echo_success('Download successful')
 
     xmlschema = etree.parse(schema_file)
-    xmlschema, _ = clear_xml(xmlschema)
+    xmlschema, _ = clear_xml(xmlschema, inplace=True)
 
     namespaces = {'xsd': 'http://www.w3.org/2001/XMLSchema'}
     schema_version = xmlschema.xpath('/xsd:schema/@version', namespaces=namespaces)[0]
@@ -261,3 +260,33 @@ def list_available_schemas():
     echo.echo(
         tabulate.tabulate(list(zip(all_versions, input_versions, output_versions)),
                           headers=['Version', 'Input Schema available', 'Output Schema available']))
+
+
+@fleur_schema.command('build-cache')
+@click.option('--cache-dir',
+              type=click.Path(file_okay=False, path_type=Path, resolve_path=True),
+              default=None,
+              help='Directory of the cache (defaults to the location given by get_schema_cache_directory)')
+def build_schema_cache(cache_dir):
+    """
+    Create the schema dictionaries for all available fleur schemas
+    and store them in the persistent on-disk cache
+    """
+    from masci_tools.io.parsers.fleur_schema import get_schema_cache_directory
+    from masci_tools.io.parsers.fleur_schema.schema_dict import SCHEMA_CACHE_ENV_VARIABLE
+
+    if cache_dir is not None:
+        os.environ[SCHEMA_CACHE_ENV_VARIABLE] = os.fspath(cache_dir)
+
+    cache_dir = get_schema_cache_directory()
+    if cache_dir is None:
+        echo.echo_critical(f'The on-disk cache is disabled ({SCHEMA_CACHE_ENV_VARIABLE} is empty)')
+
+    echo.echo_info(f'Building schema dictionary cache in {cache_dir}')
+    InputSchemaDict.clear_cache()
+    OutputSchemaDict.clear_cache()
+    for version in sorted(list_available_versions(output_schema=False), key=convert_str_version_number):
+        InputSchemaDict.fromVersion(version)
+    for version in sorted(list_available_versions(output_schema=True), key=convert_str_version_number):
+        OutputSchemaDict.fromVersion(version)
+    echo.echo_success('Created schema dictionaries for all available versions')
@@ -1,13 +1,12 @@
 """
 Commands for parsing information from KKR/Fleur files
 """
-from .root import cli
 
 import click
 from masci_tools.cmdline.utils import echo
 
 
-@cli.group('parse')
+@click.group('parse')
 def parse():
     """Commands for parsing information from KKR/Fleur files"""
 
@@ -29,44 +28,62 @@ def _load_xml_file(xml_file):
             schema_dict = InputSchemaDict.fromVersion(FALLBACK_VERSION)
             parser = etree.XMLParser(attribute_defaults=True, encoding='utf-8')
             xmltree = etree.parse(xml_file, parser)
-            xmltree, _ = clear_xml(xmltree)
+            xmltree, _ = clear_xml(xmltree, inplace=True)
 
     return xmltree, schema_dict
 
 
+def _echo_parser_results(parser_dict, parser_info):
+    """
+    Print the output and information of the parser. If timings were
+    recorded, they are printed as a summary at the end
+    """
+    from masci_tools.util.parser_timings import format_timings
+
+    timings = parser_info.pop('timings', None)
+
+    echo.echo_info('Parser output:')
+    echo.echo_dictionary(parser_dict)
+    echo.echo_info('Parser warnings/information:')
+    echo.echo_dictionary(parser_info)
+
+    if timings is not None:
+        echo.echo_info('Parser timings:')
+        echo.echo(format_timings(timings))
+
+
 @parse.command('inp-file')
 @click.argument('xml-file', type=click.Path(exists=True))
-def parse_inp_file(xml_file):
+@click.option('--profile', is_flag=True, help='Print the timings of the parsing phases')
+def parse_inp_file(xml_file, profile):
     """
     Parse the Fleur inp.xml into a python dictionary
     """
     from masci_tools.io.parsers.fleur import inpxml_parser
 
     parser_info = {}
-    parser_dict = inpxml_parser(xml_file, parser_info_out=parser_info)
+    parser_dict = inpxml_parser(xml_file, parser_info_out=parser_info, profile=profile)
 
-    echo.echo_info('Parser output:')
-    echo.echo_dictionary(parser_dict)
-    echo.echo_info('Parser warnings/information:')
-    echo.echo_dictionary(parser_info)
+    _echo_parser_results(parser_dict, parser_info)
 
 
 @parse.command('out-file')
 @click.argument('xml-file', type=click.Path(exists=True))
 @click.option('--ignore-validation', is_flag=True)
-def parse_out_file(xml_file, ignore_validation):
+@click.option('--profile', is_flag=True, help='Print the timings of the parsing phases, tasks and conversions')
+def parse_out_file(xml_file, ignore_validation, profile):
     """
     Parse the Fleur out.xml into a python dictionary
     """
     from masci_tools.io.parsers.fleur import outxml_parser
 
     parser_info = {}
-    parser_dict = outxml_parser(xml_file, parser_info_out=parser_info, ignore_validation=ignore_validation)
+    parser_dict = outxml_parser(xml_file,
+                                parser_info_out=parser_info,
+                                ignore_validation=ignore_validation,
+                                profile=profile)
 
-    echo.echo_info('Parser output:')
-    echo.echo_dictionary(parser_dict)
-    echo.echo_info('Parser warnings/information:')
-    echo.echo_dictionary(parser_info)
+    _echo_parser_results(parser_dict, parser_info)
 
 
 @parse.command('constants')
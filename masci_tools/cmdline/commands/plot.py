@@ -1,13 +1,12 @@
 """
 Commands for plotting
 """
-from .root import cli
 import click
 
 from masci_tools.cmdline.utils import echo
 
 
-@cli.group('plot')
+@click.group('plot')
 def plot():
     """Commands for visualizing data"""
 
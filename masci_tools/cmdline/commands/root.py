@@ -1,17 +1,36 @@
 """
 Main module defining the CLI for parts of the masci-tools repository
 """
+import os
+
 import click
-import click_completion
 from masci_tools import __version__
+from masci_tools.cmdline.utils.lazy_group import LazyGroup
 
-click_completion.init()
+COMPLETION_ENV_VARIABLE = '_MASCI_TOOLS_COMPLETE'
 
 # Activate the completion of parameter types provided by the click_completion package
 # for bash: eval "$(_MASCI_TOOLS_COMPLETE=source masci-tools)"
+# Only done when the completion is requested, to keep the startup of the other commands fast
+if COMPLETION_ENV_VARIABLE in os.environ:
+    import click_completion
+    click_completion.init()
+
+#The modules of the subcommands are only imported, when they are used
+SUBCOMMANDS = {
+    'convert-inpgen': 'masci_tools.cmdline.commands.convert_inpgen:convert_inpgen',
+    'fleur-schema': 'masci_tools.cmdline.commands.fleur_schema:fleur_schema',
+    'inpxml': 'masci_tools.tools.fleur_inpxml_converter:inpxml',
+    'parse': 'masci_tools.cmdline.commands.parse:parse',
+    'plot': 'masci_tools.cmdline.commands.plot:plot',
+    'serve': 'masci_tools.cmdline.commands.serve:serve',
+}
 
 
-@click.group('masci-tools', context_settings={'help_option_names': ['-h', '--help']})
+@click.group('masci-tools',
+             cls=LazyGroup,
+             lazy_subcommands=SUBCOMMANDS,
+             context_settings={'help_option_names': ['-h', '--help']})
 @click.version_option(__version__, '-v', '--version', message='masci-tools version %(version)s')
 def cli():
     """CLI for the `masci-tools` library."""
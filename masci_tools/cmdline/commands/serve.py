@@ -0,0 +1,243 @@
+"""
+Command for running a persistent process answering parse and validate requests.
+The schema dictionaries stay loaded between the requests, avoiding the startup cost of
+the cli for each call (see :py:mod:`masci_tools.cmdline.client` for the client)
+
+Requests and responses are JSON objects, each on one line. A request contains the arguments
+of the command (``args``, e.g. ``["parse", "constants", "inp.xml"]``) and optionally
+the working directory to run the command in (``cwd``). The response contains the
+``exit_code``, ``stdout`` and ``stderr`` of the command. A request with ``{"shutdown": true}``
+stops the server
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import traceback
+from typing import Any, IO
+
+import click
+from click.testing import CliRunner
+
+from masci_tools.cmdline.utils import echo
+
+ALLOWED_COMMANDS = (('parse',), ('fleur-schema', 'validate-input'), ('fleur-schema', 'validate-output'))
+"""Prefixes of the arguments of the commands, which can be run by the server"""
+
+#Unix sockets are not available on all platforms (only the stdin mode can be used there)
+_UnixStreamServer = getattr(socketserver, 'UnixStreamServer', socketserver.TCPServer)
+
+
+def _create_runner() -> CliRunner:
+    """
+    Create the runner for invoking the commands, keeping stdout and stderr separate
+    """
+    try:
+        return CliRunner(mix_stderr=False)  #type: ignore[call-arg]
+    except TypeError:  #The output streams are always separate for click>=8.2
+        return CliRunner()
+
+
+def _error_response(message: str, exit_code: int = 2) -> dict[str, Any]:
+    """
+    Create the response for a request, which could not be run
+    """
+    return {'exit_code': exit_code, 'stdout': '', 'stderr': f'Error: {message}\n'}
+
+
+def handle_request(request: Any, runner: CliRunner | None = None) -> dict[str, Any]:
+    """
+    Run the command of the given request in this process
+
+    :param request: dict with the arguments of the command (``args``) and
+                    optionally the working directory (``cwd``)
+    :param runner: CliRunner to use for invoking the command
+
+    :returns: dict with the ``exit_code``, ``stdout`` and ``stderr`` of the command
+    """
+    from masci_tools.cmdline.commands.root import cli
+
+    if runner is None:
+        runner = _create_runner()
+
+    if not isinstance(request, dict):
+        return _error_response('The request has to be a JSON object')
+    args = request.get('args')
+    if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+        return _error_response("The request has to contain the arguments of the command as a list of strings ('args')")
+    if not any(tuple(args[:len(prefix)]) == prefix for prefix in ALLOWED_COMMANDS):
+        allowed = ', '.join(' '.join(prefix) for prefix in ALLOWED_COMMANDS)
+        return _error_response(f"Command '{' '.join(args)}' is not supported by the server. Supported are: {allowed}")
+
+    cwd = os.getcwd()
+    try:
+        if request.get('cwd') is not None:
+            os.chdir(request['cwd'])
+        result = runner.invoke(cli, args)
+    except OSError as err:
+        return _error_response(str(err))
+    finally:
+        os.chdir(cwd)
+
+    stderr = result.stderr
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        stderr += ''.join(traceback.format_exception(*result.exc_info))
+    return {'exit_code': result.exit_code, 'stdout': result.stdout, 'stderr': stderr}
+
+
+def _process_line(line: str | bytes, runner: CliRunner) -> tuple[dict[str, Any], bool]:
+    """
+    Decode the request in the given line and run it
+
+    :returns: the response and whether the server should be stopped
+    """
+    try:
+        request = json.loads(line)
+    except ValueError as err:
+        return _error_response(f'Invalid JSON: {err}'), False
+
+    if isinstance(request, dict) and request.get('shutdown'):
+        return {'exit_code': 0, 'stdout': '', 'stderr': ''}, True
+    return handle_request(request, runner=runner), False
+
+
+def serve_lines(infile: IO[str], outfile: IO[str]) -> None:
+    """
+    Answer the requests read from the given file (one JSON object per line) until
+    the end of the file or a shutdown request is reached
+
+    :param infile: file to read the requests from
+    :param outfile: file to write the responses to
+    """
+    runner = _create_runner()
+    for line in infile:
+        if not line.strip():
+            continue
+        response, shutdown = _process_line(line, runner)
+        outfile.write(f'{json.dumps(response)}\n')
+        outfile.flush()
+        if shutdown:
+            break
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Answer all requests sent over one connection
+    """
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response, shutdown = _process_line(line, self.server.runner)  #type: ignore[attr-defined]
+            self.wfile.write(f'{json.dumps(response)}\n'.encode('utf-8'))
+            self.wfile.flush()
+            if shutdown:
+                self.server.stop = True  #type: ignore[attr-defined]
+                break
+
+
+class ParseServer(_UnixStreamServer):  #type: ignore[valid-type,misc]
+    """
+    Server answering the requests sent to the given Unix socket until a shutdown request is received.
+    The requests are handled one after another. The socket is only accessible for the current user
+    and is removed when the server is closed
+
+    :param socket_path: path of the Unix socket
+
+    :raises ValueError: if another server is already listening on the socket or the
+                        path exists and is not a socket
+    """
+
+    def __init__(self, socket_path: os.PathLike | str) -> None:
+        socket_path = os.fspath(socket_path)
+        if os.path.exists(socket_path):
+            if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                raise ValueError(f'{socket_path} exists and is not a socket')
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(socket_path)
+                except OSError:
+                    os.unlink(socket_path)  #Left over from a server, which was not stopped properly
+                else:
+                    raise ValueError(f'A server is already listening on {socket_path}')
+
+        #The socket is created with the restricted permissions, so that it is never accessible for other users
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        os.chmod(socket_path, 0o600)
+        self.socket_path = socket_path
+        self.runner = _create_runner()
+        self.stop = False
+
+    def serve_until_shutdown(self) -> None:
+        """
+        Handle requests until a shutdown request is received
+        """
+        while not self.stop:
+            self.handle_request()
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+@click.command('serve')
+@click.option('--socket',
+              'socket_path',
+              type=click.Path(path_type=Path, resolve_path=True),
+              default=None,
+              help='Unix socket to listen on. If not given the requests are read from stdin '
+              'and the responses written to stdout')
+@click.option('--warmup/--no-warmup',
+              default=True,
+              help='Create the schema dictionaries for all available versions on startup')
+def serve(socket_path, warmup):
+    """
+    Run a persistent process answering parse and validate requests
+
+    The requests are JSON objects (one per line) with the arguments of the command (args)
+    and the working directory (cwd), e.g. {"args": ["parse", "constants", "inp.xml"], "cwd": "/path"}.
+    The responses contain the exit_code, stdout and stderr of the command.
+    Supported are the parse commands and fleur-schema validate-input/validate-output.
+    Use masci-tools-client to send requests from the shell
+    """
+    if warmup:
+        from masci_tools.io.parsers.fleur_schema import InputSchemaDict, OutputSchemaDict
+        InputSchemaDict.warmup()
+        OutputSchemaDict.warmup()
+
+    if socket_path is None:
+        serve_lines(sys.stdin, sys.stdout)
+        return
+
+    if not hasattr(socket, 'AF_UNIX'):
+        echo.echo_critical('Unix sockets are not supported on this platform. Use the stdin mode instead')
+
+    if threading.current_thread() is threading.main_thread():
+        #Make sure that the socket is removed when the server is terminated
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    try:
+        server = ParseServer(socket_path)
+    except ValueError as err:
+        echo.echo_critical(str(err))
+
+    echo.echo_info(f'Listening on {socket_path}', err=True)
+    try:
+        server.serve_until_shutdown()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,46 @@
+"""
+Click group, which imports the modules of its subcommands only when they are used
+"""
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    Click group with subcommands, which are only imported when they are invoked
+    (or listed, e.g. in the help message)
+
+    :param lazy_subcommands: dict mapping the names of the subcommands to the import path
+                             of the command in the form ``module.name:command``
+    """
+
+    def __init__(self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """
+        Import the subcommand with the given name
+
+        :param cmd_name: name of the subcommand
+
+        :returns: the click command
+        """
+        module_name, command_name = self.lazy_subcommands[cmd_name].split(':')
+        command = getattr(importlib.import_module(module_name), command_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(f'Lazy loading of {self.lazy_subcommands[cmd_name]} failed: '
+                             f'Expected a click command, got {type(command)}')
+        return command
@@ -17,6 +17,7 @@ from __future__ import annotations
 import logging
 
 from lxml import etree
+import io
 import warnings
 import os
 from pathlib import Path
@@ -27,10 +28,10 @@ from contextlib import _GeneratorContextManager, contextmanager
 
 from masci_tools.io.parsers import fleur_schema
 from masci_tools.util.typing import XMLFileLike, XMLLike
-from masci_tools.util.xml.common_functions import eval_xpath_one, normalize_xmllike
+from masci_tools.util.xml.common_functions import eval_xpath_one, normalize_xmllike, XINCLUDE_TAG
 
 __all__ = ('load_inpxml', 'load_outxml', 'FleurXMLContext', 'get_constants', 'load_outxml_and_check_for_broken_xml',
-           '_EvalContext')
+           'read_outxml_header', '_EvalContext')
 
 
 def load_inpxml(inpxmlfile: XMLFileLike,
@@ -183,9 +184,97 @@ def load_outxml_and_check_for_broken_xml(
             logger.error('No XML tree generated. Check that the given file exists')
         raise ValueError('No XML tree generated. Check that the given file exists')
 
-    out_version = eval_xpath_one(xmltree, '//@fleurOutputVersion', str)
+    out_version, inp_version = _get_outxml_versions(xmltree, logger=logger)
+    schema_dict = OutputSchemaDict.fromVersion(out_version, inp_version=inp_version, logger=logger)
+
+    return xmltree, schema_dict, outfile_broken
+
+
+def read_outxml_header(outxmlfile: XMLFileLike) -> etree._ElementTree | None:
+    """
+    Reads only the part of a out.xml file before the first iteration (input file, general
+    information about the calculation, ...) with :py:func:`lxml.etree.iterparse()`.
+    The file is only read until the start of the first ``iteration`` element, so this is
+    independent of the number of iterations in the file
+
+    :param outxmlfile: either path to the out.xml file, opened file handle (in bytes modes i.e. rb)
+                       or the content of the file as str/bytes
+
+    :returns: partial XML tree containing everything before the first iteration or None if the
+              header cannot be read this way (already parsed XML trees, file handles that are not seekable
+              or not in binary mode, XML errors or xinclude tags before the first iteration)
+    """
+    if isinstance(outxmlfile, (etree._ElementTree, etree._Element)):
+        return None
+
+    if isinstance(outxmlfile, (str, bytes, Path)):
+        if os.path.isfile(outxmlfile):
+            with open(outxmlfile, 'rb') as file:
+                return read_outxml_header(file)
+        if isinstance(outxmlfile, str):
+            outxmlfile = outxmlfile.encode('utf-8')
+        return read_outxml_header(io.BytesIO(outxmlfile))  #type:ignore[arg-type]
+
+    try:
+        position = outxmlfile.tell()
+    except (AttributeError, OSError):
+        return None
+
+    events = etree.iterparse(outxmlfile,
+                             events=('start',),
+                             tag='iteration',
+                             attribute_defaults=True,
+                             remove_comments=True,
+                             encoding='utf-8')
+    try:
+        for _, element in events:
+            #The file is read in chunks, so more than the start of the first iteration
+            #might be in the tree at this point
+            scf_loop = element.getparent()
+            for iteration in scf_loop.findall('iteration'):
+                scf_loop.remove(iteration)
+            root = scf_loop.getroottree().getroot()
+            break
+        else:
+            #No iterations in the file
+            root = events.root
+    except (etree.XMLSyntaxError, TypeError):
+        #TypeError is raised for file handles not opened in binary mode
+        return None
+    finally:
+        outxmlfile.seek(position)
+
+    if next(root.iter(XINCLUDE_TAG), None) is not None:
+        #The included files might only be resolvable relative to the file
+        return None
+    return root.getroottree()
+
+
+def _get_outxml_versions(xmltree: XMLLike, logger: Logger | None = None) -> tuple[str, str]:
+    """
+    Determine the output and input version of the given out.xml tree.
+    For files with the output version '0.27' the program version is used to determine
+    the actual file versions
+
+    The versions are read from their fixed positions below the root element. Only if they
+    are not found there, the whole tree is searched for them
+
+    :param xmltree: XML tree of the out.xml file. Only the parts before the
+                    first iteration need to be present
+    :param logger: logger object for logging warnings, errors
+
+    :returns: tuple of the output and input version strings
+    """
+    root = xmltree.getroot() if isinstance(xmltree, etree._ElementTree) else xmltree
+
+    def get_version(element: etree._Element | None, attribute: str, xpath: str) -> str:
+        if element is not None and element.get(attribute) is not None:
+            return element.get(attribute)
+        return eval_xpath_one(xmltree, xpath, str)
+
+    out_version = get_version(root, 'fleurOutputVersion', '//@fleurOutputVersion')
     if out_version == '0.27':
-        program_version = eval_xpath_one(xmltree, '//programVersion/@version', str)
+        program_version = get_version(root.find('programVersion'), 'version', '//programVersion/@version')
         if program_version == 'fleur 32':
             #Max5 release (before bugfix)
             out_version = '0.33'
@@ -225,11 +314,9 @@ def load_outxml_and_check_for_broken_xml(
                              program_version)
             raise ValueError(f"Unknown fleur version: File-version '{out_version}' Program-version '{program_version}'")
     else:
-        inp_version = eval_xpath_one(xmltree, '//@fleurInputVersion', str)
+        inp_version = get_version(root.find('fleurInput'), 'fleurInputVersion', '//@fleurInputVersion')
 
-    schema_dict = OutputSchemaDict.fromVersion(out_version, inp_version=inp_version, logger=logger)
-
-    return xmltree, schema_dict, outfile_broken
+    return out_version, inp_version
 
 
 class _EvalContext:
@@ -242,13 +329,17 @@ class _EvalContext:
         :param schema_dict: The corresponding SchemaDict
         :param constants: The dictionary containing the defined mathematical constants
         :param logger: The configured logger instance
+        :param header: Optional partial XML tree of the out.xml file containing only the parts
+                       before the first iteration (see :py:func:`read_outxml_header()`). If given,
+                       the metadata of the file (constants, fleur modes) is evaluated on this tree
     """
 
     def __init__(self,
                  etree_or_element: XMLLike | etree.XPathElementEvaluator,
                  schema_dict: fleur_schema.InputSchemaDict | fleur_schema.OutputSchemaDict,
                  constants: dict[str, float] | None = None,
-                 logger: logging.Logger | None = None) -> None:
+                 logger: logging.Logger | None = None,
+                 header: XMLLike | None = None) -> None:
 
         self.node: etree._Element | etree.XPathElementEvaluator
         if not isinstance(etree_or_element, etree.XPathElementEvaluator):
@@ -257,7 +348,25 @@ class _EvalContext:
             self.node = etree_or_element
         self.schema_dict = schema_dict
         self.logger = logger
-        self.constants = constants or get_constants(self.node, self.schema_dict, self.logger)
+        self.header = header
+        self.constants = constants or get_constants(self.header if self.header is not None else self.node,
+                                                    self.schema_dict, self.logger)
+        #Metadata of the file shared between all nested contexts
+        self._metadata: dict[str, Any] = {}
+
+    @property
+    def fleur_modes(self) -> dict[str, Any]:
+        """
+        The fleur modes of the file (see :py:func:`~masci_tools.util.xml.xml_getters.get_fleur_modes()`).
+        They are determined only once (on the header of the file if available) and
+        cached for this context and all nested contexts
+        """
+        if 'fleur_modes' not in self._metadata:
+            from masci_tools.util.xml.xml_getters import get_fleur_modes
+            self._metadata['fleur_modes'] = get_fleur_modes(self.header if self.header is not None else self.node,
+                                                            self.schema_dict,
+                                                            logger=self.logger)
+        return self._metadata['fleur_modes']
 
     def attribute(self, name: str, default: Any | None = None, **kwargs: Any) -> Any:
         """
@@ -532,7 +641,13 @@ class _EvalContext:
 
         :param etree_or_element: Element to use for evaluation in the nested context
         """
-        yield _EvalContext(etree_or_element, self.schema_dict, self.constants, logger=self.logger)
+        context = _EvalContext(etree_or_element,
+                               self.schema_dict,
+                               self.constants,
+                               logger=self.logger,
+                               header=self.header)
+        context._metadata = self._metadata
+        yield context
 
     def iter(self, name: str, **kwargs: Any) -> Generator[_EvalContext, None, None]:
         """
@@ -572,7 +687,8 @@ class _EvalContext:
 def FleurXMLContext(etree_or_element: XMLLike | etree.XPathElementEvaluator,
                     schema_dict: fleur_schema.InputSchemaDict | fleur_schema.OutputSchemaDict,
                     constants: dict[str, float] | None = None,
-                    logger: logging.Logger | None = None) -> Generator[_EvalContext, None, None]:
+                    logger: logging.Logger | None = None,
+                    header: XMLLike | None = None) -> Generator[_EvalContext, None, None]:
     """
     Contextmanager to hold the relevant datastructures for evaluating values from XML files
 
@@ -582,6 +698,8 @@ def FleurXMLContext(etree_or_element: XMLLike | etree.XPathElementEvaluator,
         :param schema_dict: The corresponding SchemaDict
         :param constants: The dictionary containing the defined mathematical constants
         :param logger: The configured logger instance
+        :param header: Optional partial XML tree of the out.xml file before the first iteration
+                       (see :py:func:`read_outxml_header()`) used for evaluating the metadata of the file
 
     The following methods are available:
         - :py:meth:`_EvalContext.attribute()`: Evaluate attribute values
@@ -594,6 +712,7 @@ def FleurXMLContext(etree_or_element: XMLLike | etree.XPathElementEvaluator,
         - :py:meth:`_EvalContext.number_nodes()`: Evaluate how many elements of the tag are present
         - :py:meth:`_EvalContext.attribute_exists()`: Evaluate whether an attribute exists
         - :py:meth:`_EvalContext.simple_xpath()`: Evaluate the simple xpath expression for a given tag
+        - :py:attr:`_EvalContext.fleur_modes`: The fleur modes of the file (evaluated once and cached)
         - *Nested Context* :py:meth:`_EvalContext.find()`: Find the first occurrence of the tag and provide a nested
           context to that element
         - *Nested Context* :py:meth:`_EvalContext.iter()`: Find all occurrences of the tag and provide a nested
@@ -623,7 +742,7 @@ def FleurXMLContext(etree_or_element: XMLLike | etree.XPathElementEvaluator,
                 mt_radii.append(species.attribute('radius'))
 
     """
-    yield _EvalContext(etree_or_element, schema_dict, constants=constants, logger=logger)
+    yield _EvalContext(etree_or_element, schema_dict, constants=constants, logger=logger, header=header)
 
 
 def get_constants(xmltree: XMLLike | etree.XPathElementEvaluator,
@@ -22,7 +22,7 @@ Essentially a low-level version of the FleurinpModifier in aiida_fleur.
 """
 from __future__ import annotations
 
-from typing import Any, Callable, NamedTuple
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
 try:
     from typing import Literal
 except ImportError:
@@ -30,12 +30,16 @@ except ImportError:
 
 from masci_tools.util.xml.collect_xml_setters import XPATH_SETTERS, SCHEMA_DICT_SETTERS, NMMPMAT_SETTERS
 from masci_tools.util.xml.xml_setters_names import set_attrib_value
+from masci_tools.util.xml.xml_setters_basic import track_modifications, deferred_indentation
 from masci_tools.util.xml.common_functions import clear_xml, eval_xpath_one, get_inpgen_comments, readd_inpgen_comments
 from masci_tools.util.schema_dict_util import ensure_relaxation_xinclude
 from masci_tools.io.fleur_xml import load_inpxml
+from masci_tools.io.parsers.fleur_schema import InputSchemaDict
 from masci_tools.util.typing import XMLFileLike, FileLike
 from pathlib import Path
 from lxml import etree
+from collections import deque
+import copy
 import warnings
 #Enable warnings for missing docstrings
 #pylint: enable=missing-function-docstring
@@ -219,7 +223,9 @@ class FleurXMLModifier:
                             nmmp_lines: list[str] | None,
                             modification_tasks: list[ModifierTask],
                             validate_changes: bool = True,
-                            adjust_version_for_dev_version: bool = True) -> tuple[etree._ElementTree, list[str] | None]:
+                            adjust_version_for_dev_version: bool = True,
+                            inplace: bool = False,
+                            incremental_validation: bool = False) -> tuple[etree._ElementTree, list[str] | None]:
         """
         Applies given modifications to the fleurinp lxml tree.
         It also checks if a new lxml tree is validated against schema.
@@ -234,40 +240,37 @@ class FleurXMLModifier:
                                                and file version differ, e.g. a development version is used
                                                the version is temporarily modified to swallow the validation
                                                error that would occur
+        :param inplace: bool optional (default False), if True the given xmltree is not copied
+                        before performing the modifications. Only use this if the tree is owned
+                        by the caller and not needed anymore
+        :param incremental_validation: bool optional (default False), if True the elements modified by
+                                       the tasks are recorded and only the affected sections of the xmltree
+                                       are validated. This assumes that the xmltree was valid before the
+                                       modifications. Falls back to validating the complete xmltree
+                                       if this is not possible
 
         :returns: a modified lxml tree and a modified n_mmp_mat file
         """
         from masci_tools.util.xml.xml_setters_nmmpmat import validate_nmmpmat
 
         xmltree, schema_dict = load_inpxml(xmltree)
-        xmltree, _ = clear_xml(xmltree)
+        xmltree, _ = clear_xml(xmltree, inplace=inplace)
 
         file_version = eval_xpath_one(xmltree, '//@fleurInputVersion', str)
-        is_dev_version = schema_dict['inp_version'] != file_version
-
-        for task in modification_tasks:
-            if task.name in cls.xpath_functions:
-                action = cls.xpath_functions[task.name]
-                xmltree = action(xmltree, *task.args, **task.kwargs)
-
-            elif task.name in cls.schema_dict_functions:
-                action = cls.schema_dict_functions[task.name]
-                xmltree = action(xmltree, schema_dict, *task.args, **task.kwargs)
 
-            elif task.name in cls.nmmpmat_functions:
-                action = cls.nmmpmat_functions[task.name]
-                nmmp_lines = action(xmltree, nmmp_lines, schema_dict, *task.args, **task.kwargs)
-
-            else:
-                raise ValueError(f'Unknown task {task.name}')
+        modified_elements = None
+        if validate_changes and incremental_validation:
+            xmltree, nmmp_lines, modified_elements = cls._apply_tasks_tracked(xmltree, nmmp_lines, schema_dict,
+                                                                              modification_tasks)
+        else:
+            xmltree, nmmp_lines = cls._apply_tasks(xmltree, nmmp_lines, schema_dict, modification_tasks)
 
         if validate_changes:
-            if is_dev_version and adjust_version_for_dev_version:
-                set_attrib_value(xmltree, schema_dict, 'fleurinputversion', schema_dict['inp_version'])
-                schema_dict.validate(xmltree, header='Changes were not valid')
-                set_attrib_value(xmltree, schema_dict, 'fleurinputversion', file_version)
-            else:
-                schema_dict.validate(xmltree, header='Changes were not valid')
+            cls._validate_xmltree(xmltree,
+                                  schema_dict,
+                                  file_version,
+                                  adjust_version_for_dev_version=adjust_version_for_dev_version,
+                                  modified_elements=modified_elements)
             try:
                 validate_nmmpmat(xmltree, nmmp_lines, schema_dict)
             except ValueError as exc:
@@ -276,6 +279,90 @@ class FleurXMLModifier:
 
         return xmltree, nmmp_lines
 
+    @classmethod
+    def _apply_tasks(cls, xmltree: etree._ElementTree, nmmp_lines: list[str] | None, schema_dict: InputSchemaDict,
+                     modification_tasks: list[ModifierTask]) -> tuple[etree._ElementTree, list[str] | None]:
+        """
+        Perform the given modifications on the already cleaned up xmltree (IS MODIFIED INPLACE)
+
+        :param xmltree: a lxml tree to be modified
+        :param nmmp_lines: a n_mmp_mat file to be modified
+        :param schema_dict: InputSchemaDict for the xmltree
+        :param modification_tasks: a list of modification tuples
+
+        :returns: a modified lxml tree and a modified n_mmp_mat file
+        """
+        #The tree is only indented once after all tasks
+        with deferred_indentation():
+            for task in modification_tasks:
+                if task.name in cls.xpath_functions:
+                    action = cls.xpath_functions[task.name]
+                    xmltree = action(xmltree, *task.args, **task.kwargs)
+
+                elif task.name in cls.schema_dict_functions:
+                    action = cls.schema_dict_functions[task.name]
+                    xmltree = action(xmltree, schema_dict, *task.args, **task.kwargs)
+
+                elif task.name in cls.nmmpmat_functions:
+                    action = cls.nmmpmat_functions[task.name]
+                    nmmp_lines = action(xmltree, nmmp_lines, schema_dict, *task.args, **task.kwargs)
+
+                else:
+                    raise ValueError(f'Unknown task {task.name}')
+
+        return xmltree, nmmp_lines
+
+    @classmethod
+    def _apply_tasks_tracked(
+        cls, xmltree: etree._ElementTree, nmmp_lines: list[str] | None, schema_dict: InputSchemaDict,
+        modification_tasks: list[ModifierTask]
+    ) -> tuple[etree._ElementTree, list[str] | None, list[etree._Element] | None]:
+        """
+        Perform the given modifications like :py:meth:`_apply_tasks()` and record the modified elements
+
+        :returns: a modified lxml tree, a modified n_mmp_mat file and the list of modified elements
+                  (None if the modifications cannot be tracked, i.e. additionally registered setter functions
+                  are used, which might not record their modifications)
+        """
+        extra_functions = {name for functions in cls._extra_functions.values() for name in functions}
+        if any(task.name in extra_functions for task in modification_tasks):
+            xmltree, nmmp_lines = cls._apply_tasks(xmltree, nmmp_lines, schema_dict, modification_tasks)
+            return xmltree, nmmp_lines, None
+
+        with track_modifications() as modified_elements:
+            xmltree, nmmp_lines = cls._apply_tasks(xmltree, nmmp_lines, schema_dict, modification_tasks)
+        return xmltree, nmmp_lines, modified_elements
+
+    @staticmethod
+    def _validate_xmltree(xmltree: etree._ElementTree,
+                          schema_dict: InputSchemaDict,
+                          file_version: str,
+                          adjust_version_for_dev_version: bool = True,
+                          modified_elements: list[etree._Element] | None = None) -> None:
+        """
+        Validate the modified xmltree against the schema
+
+        :param xmltree: the modified lxml tree
+        :param schema_dict: InputSchemaDict for the xmltree
+        :param file_version: version of the input file before the modifications
+        :param adjust_version_for_dev_version: bool optional (default True), if True and the schema_dict
+                                               and file version differ, e.g. a development version is used
+                                               the version is temporarily modified to swallow the validation
+                                               error that would occur
+        :param modified_elements: optional list of the modified elements. If given only the
+                                  affected sections of the xmltree are validated if possible
+
+        :raises ValueError: if the xmltree is not valid
+        """
+        is_dev_version = schema_dict['inp_version'] != file_version
+
+        if is_dev_version and adjust_version_for_dev_version:
+            set_attrib_value(xmltree, schema_dict, 'fleurinputversion', schema_dict['inp_version'])
+            schema_dict.validate(xmltree, header='Changes were not valid', modified_elements=modified_elements)
+            set_attrib_value(xmltree, schema_dict, 'fleurinputversion', file_version)
+        else:
+            schema_dict.validate(xmltree, header='Changes were not valid', modified_elements=modified_elements)
+
     @property
     def task_list(self) -> list[tuple[str, dict[str, Any]]]:
         """
@@ -365,7 +452,8 @@ class FleurXMLModifier:
                        original_nmmp_file: FileLike | list[str] | None = None,
                        validate_changes: bool = True,
                        adjust_version_for_dev_version: bool = True,
-                       keep_inpgen_comments: bool = True) -> tuple[etree._ElementTree, dict[str, str]]:
+                       keep_inpgen_comments: bool = True,
+                       incremental_validation: bool = False) -> tuple[etree._ElementTree, dict[str, str]]:
         """
         Applies the registered modifications to a given inputfile
 
@@ -373,6 +461,9 @@ class FleurXMLModifier:
                                     or a xml etree to be parsed
         :param original_nmmp_file: path or list of str to a corresponding density matrix
                                    file
+        :param incremental_validation: bool optional (default False), if True only the sections
+                                       of the input file affected by the modifications are validated.
+                                       Only use this for input files, which are known to be valid
 
         :raises ValueError: if the parsing of the input file
 
@@ -380,36 +471,235 @@ class FleurXMLModifier:
         """
         original_xmltree, schema_dict = load_inpxml(original_inpxmlfile)
         comments = get_inpgen_comments(original_xmltree)
-
-        if original_nmmp_file is not None:
-            if isinstance(original_nmmp_file, str) and not Path(original_nmmp_file).is_file():
-                original_nmmp_lines = original_nmmp_file.split('\n')
-            elif isinstance(original_nmmp_file, (str, Path)):
-                with open(original_nmmp_file, encoding='utf-8') as n_mmp_file:
-                    original_nmmp_lines = n_mmp_file.read().split('\n')
-            else:
-                original_nmmp_lines = original_nmmp_file  #type:ignore[assignment]
-        else:
-            original_nmmp_lines = None
+        original_nmmp_lines = self._read_nmmp_lines(original_nmmp_file)
 
         new_xmltree, new_nmmp_lines = self.apply_modifications(
             original_xmltree,
             original_nmmp_lines,
             self._tasks,
             validate_changes=validate_changes,
-            adjust_version_for_dev_version=adjust_version_for_dev_version)
+            adjust_version_for_dev_version=adjust_version_for_dev_version,
+            inplace=not isinstance(original_inpxmlfile, (etree._ElementTree, etree._Element)),
+            incremental_validation=incremental_validation)
+
+        return self._finalize_xmltree(new_xmltree, new_nmmp_lines, schema_dict,
+                                      comments if keep_inpgen_comments else None)
+
+    def modify_many(self,
+                    original_inpxmlfile: XMLFileLike,
+                    variants: Iterable[FleurXMLModifier | list[tuple[str, dict[str, Any]]]],
+                    original_nmmp_file: FileLike | list[str] | None = None,
+                    validate_changes: bool = True,
+                    adjust_version_for_dev_version: bool = True,
+                    keep_inpgen_comments: bool = True,
+                    processes: int | None = None) -> Iterator[tuple[etree._ElementTree, dict[str, str]]]:
+        """
+        Applies the registered modifications followed by the modifications of each of the given
+        variants to a given inputfile (e.g. for convergence scans)
+
+        The input file is only parsed once and the modifications registered on this instance
+        are only performed once. For each variant a copy of the resulting tree is modified further.
+        The results are returned one after the other as a generator, so that many variants can be
+        written out without keeping all of them in memory. If the modifications registered on this instance
+        result in a valid input file, only the parts of the input file modified by each variant are validated
+
+        .. code-block:: python
+
+            from itertools import product
+
+            fmode = FleurXMLModifier()
+            fmode.set_inpchanges({'itmax': 1})
 
-        ensure_relaxation_xinclude(new_xmltree, schema_dict)
+            variants = []
+            for kmax, mesh in product([3.5, 4.0, 4.5], [(4, 4, 4), (8, 8, 8)]):
+                variant = FleurXMLModifier()
+                variant.set_inpchanges({'kmax': kmax, 'gmax': 3 * kmax})
+                variant.set_kpointmesh(mesh)
+                variants.append(variant)
 
-        if keep_inpgen_comments:
-            readd_inpgen_comments(new_xmltree, comments)
+            for indx, (xmltree, additional_files) in enumerate(fmode.modify_many('inp.xml', variants, processes=4)):
+                xmltree.write(f'inp_{indx}.xml', encoding='utf-8', pretty_print=True)
+
+        :param original_inpxmlfile: either path to the inp.xml file, opened file handle
+                                    or a xml etree to be parsed
+        :param variants: iterable of the modifications for each variant. Either a :py:class:`FleurXMLModifier`
+                         or a list of tasks in the format accepted by :py:meth:`fromList()`
+        :param original_nmmp_file: path or list of str to a corresponding density matrix
+                                   file
+        :param processes: int optional, if given the validation of the complete variants against the schema
+                          is done in a pool of processes of this size. Otherwise the variants are
+                          validated in the current process
 
-        etree.indent(new_xmltree)
+        :raises ValueError: if the parsing of the input file or the validation of one of the variants fails
+
+        :returns: generator of the modified xmltrees and if existent the modified density matrix files
+                  for each variant (in the order of the given variants)
+        """
+        original_xmltree, schema_dict = load_inpxml(original_inpxmlfile)
+        comments = get_inpgen_comments(original_xmltree) if keep_inpgen_comments else None
+        nmmp_lines = self._read_nmmp_lines(original_nmmp_file)
+
+        xmltree, _ = clear_xml(original_xmltree,
+                               inplace=not isinstance(original_inpxmlfile, (etree._ElementTree, etree._Element)))
+        file_version = eval_xpath_one(xmltree, '//@fleurInputVersion', str)
+        xmltree, nmmp_lines = self._apply_tasks(xmltree, nmmp_lines, schema_dict, self._tasks)
+
+        incremental_validation = False
+        if validate_changes:
+            #If the common modifications are valid only the parts
+            #modified by the variants have to be validated
+            try:
+                self._validate_xmltree(xmltree,
+                                       schema_dict,
+                                       file_version,
+                                       adjust_version_for_dev_version=adjust_version_for_dev_version)
+            except ValueError:
+                pass
+            else:
+                incremental_validation = True
+
+        modified_variants = self._modify_variants(xmltree,
+                                                  nmmp_lines,
+                                                  schema_dict,
+                                                  variants,
+                                                  track_changes=incremental_validation)
+
+        if validate_changes:
+            finished_variants = self._validate_variants(modified_variants,
+                                                        schema_dict,
+                                                        file_version,
+                                                        adjust_version_for_dev_version=adjust_version_for_dev_version,
+                                                        processes=processes)
+        else:
+            finished_variants = (
+                (new_xmltree, new_nmmp_lines) for new_xmltree, new_nmmp_lines, _, _ in modified_variants)
+
+        #The comments are moved into the xmltree, so each variant gets a copy
+        return (self._finalize_xmltree(new_xmltree, new_nmmp_lines, schema_dict, copy.deepcopy(comments))
+                for new_xmltree, new_nmmp_lines in finished_variants)
+
+    def _modify_variants(
+        self,
+        xmltree: etree._ElementTree,
+        nmmp_lines: list[str] | None,
+        schema_dict: InputSchemaDict,
+        variants: Iterable[FleurXMLModifier | list[tuple[str, dict[str, Any]]]],
+        track_changes: bool = False
+    ) -> Iterator[tuple[etree._ElementTree, list[str] | None, list[ModifierTask], list[etree._Element] | None]]:
+        """
+        Perform the modifications of each variant on a copy of the given xmltree
+
+        :param track_changes: bool, if True the elements modified by each variant are recorded
+
+        :returns: generator of the modified xmltree, n_mmp_mat file, all
+                  performed modifications and the modified elements (or None) for each variant
+        """
+        for variant in variants:
+            if not isinstance(variant, FleurXMLModifier):
+                variant = self.fromList(variant, validate_signatures=self.validate_signatures)
+
+            new_nmmp_lines = list(nmmp_lines) if nmmp_lines is not None else None
+            modified_elements = None
+            if track_changes:
+                new_xmltree, new_nmmp_lines, modified_elements = self._apply_tasks_tracked(
+                    copy.deepcopy(xmltree), new_nmmp_lines, schema_dict, variant._tasks)
+            else:
+                new_xmltree, new_nmmp_lines = self._apply_tasks(copy.deepcopy(xmltree), new_nmmp_lines, schema_dict,
+                                                                variant._tasks)
+            yield new_xmltree, new_nmmp_lines, [*self._tasks, *variant._tasks], modified_elements
+
+    def _validate_variants(self,
+                           modified_variants: Iterator[tuple[etree._ElementTree, list[str] | None, list[ModifierTask],
+                                                             list[etree._Element] | None]],
+                           schema_dict: InputSchemaDict,
+                           file_version: str,
+                           adjust_version_for_dev_version: bool = True,
+                           processes: int | None = None) -> Iterator[tuple[etree._ElementTree, list[str] | None]]:
+        """
+        Validate the modified variants and yield the valid xmltrees and n_mmp_mat files in order.
+        Variants with recorded modified elements are validated incrementally in the current process.
+        If processes is given, the validation of the other variants against the schema is done in a process pool
+        """
+        from masci_tools.util.xml.xml_setters_nmmpmat import validate_nmmpmat
+        from concurrent.futures import ProcessPoolExecutor, Future
+
+        def finish_variant(
+                future: Future | None, new_xmltree: etree._ElementTree, new_nmmp_lines: list[str] | None,
+                modification_tasks: list[ModifierTask],
+                modified_elements: list[etree._Element] | None) -> tuple[etree._ElementTree, list[str] | None]:
+            if future is None:
+                self._validate_xmltree(new_xmltree,
+                                       schema_dict,
+                                       file_version,
+                                       adjust_version_for_dev_version=adjust_version_for_dev_version,
+                                       modified_elements=modified_elements)
+            else:
+                future.result()
+            try:
+                validate_nmmpmat(new_xmltree, new_nmmp_lines, schema_dict)
+            except ValueError as exc:
+                msg = f'Changes were not valid (n_mmp_mat file is not compatible): {modification_tasks}'
+                raise ValueError(msg) from exc
+            return new_xmltree, new_nmmp_lines
+
+        if processes is None:
+            for variant in modified_variants:
+                yield finish_variant(None, *variant)
+            return
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending: deque = deque()
+            for new_xmltree, new_nmmp_lines, modification_tasks, modified_elements in modified_variants:
+                future = None
+                if modified_elements is None:
+                    future = executor.submit(_validate_xmlstring, etree.tostring(new_xmltree),
+                                             schema_dict['inp_version'], file_version, adjust_version_for_dev_version)
+                pending.append((future, new_xmltree, new_nmmp_lines, modification_tasks, modified_elements))
+                #Only keep a limited number of variants in flight
+                if len(pending) >= 2 * processes:
+                    yield finish_variant(*pending.popleft())
+
+            while pending:
+                yield finish_variant(*pending.popleft())
+
+    @staticmethod
+    def _read_nmmp_lines(original_nmmp_file: FileLike | list[str] | None) -> list[str] | None:
+        """
+        Read in the lines of the given density matrix file
+
+        :param original_nmmp_file: path or list of str to a corresponding density matrix
+                                   file
+        """
+        if original_nmmp_file is None:
+            return None
+
+        if isinstance(original_nmmp_file, str) and not Path(original_nmmp_file).is_file():
+            return original_nmmp_file.split('\n')
+        if isinstance(original_nmmp_file, (str, Path)):
+            with open(original_nmmp_file, encoding='utf-8') as n_mmp_file:
+                return n_mmp_file.read().split('\n')
+        return original_nmmp_file  #type:ignore[return-value]
+
+    @staticmethod
+    def _finalize_xmltree(xmltree: etree._ElementTree, nmmp_lines: list[str] | None, schema_dict: InputSchemaDict,
+                          comments: list[etree._Element] | None) -> tuple[etree._ElementTree, dict[str, str]]:
+        """
+        Add the xinclude for the relaxation and the inpgen comments to the modified xmltree
+        and format it
+
+        :returns: the xmltree and the additional files
+        """
+        ensure_relaxation_xinclude(xmltree, schema_dict)
+
+        if comments is not None:
+            readd_inpgen_comments(xmltree, comments)
+
+        etree.indent(xmltree)
 
         additional_files = {}
-        if new_nmmp_lines is not None:
-            additional_files['n_mmp_mat'] = '\n'.join(new_nmmp_lines)
-        return new_xmltree, additional_files
+        if nmmp_lines is not None:
+            additional_files['n_mmp_mat'] = '\n'.join(nmmp_lines)
+        return xmltree, additional_files
 
     def set_inpchanges(self, *args: Any, **kwargs: Any) -> None:
         """
@@ -1338,3 +1628,24 @@ class FleurXMLModifier:
         """
         self._validate_arguments('set_xcfunctional', args, kwargs)
         self._tasks.append(ModifierTask('set_xcfunctional', args, kwargs))
+
+
+def _validate_xmlstring(xmlstring: bytes,
+                        inp_version: str,
+                        file_version: str,
+                        adjust_version_for_dev_version: bool = True) -> None:
+    """
+    Validate the serialized xmltree against the schema for the given version.
+    Used by :py:meth:`FleurXMLModifier.modify_many()` to validate variants in other processes
+
+    :raises ValueError: if the xmltree is not valid
+    """
+    from masci_tools.io.parsers.fleur_schema import InputSchemaDict
+
+    schema_dict = InputSchemaDict.fromVersion(inp_version)
+    xmltree = etree.ElementTree(etree.fromstring(xmlstring))
+    FleurXMLModifier._validate_xmltree(  #pylint: disable=protected-access
+        xmltree,
+        schema_dict,
+        file_version,
+        adjust_version_for_dev_version=adjust_version_for_dev_version)
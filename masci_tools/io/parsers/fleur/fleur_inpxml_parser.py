@@ -22,6 +22,7 @@ from masci_tools.util.xml.common_functions import clear_xml
 from masci_tools.util.xml.converters import convert_from_xml
 from masci_tools.util.schema_dict_util import evaluate_attribute
 from masci_tools.util.logging_util import DictHandler
+from masci_tools.util.parser_timings import collect_timings, timed, timings_enabled
 from masci_tools.util.typing import XMLFileLike
 import logging
 from typing import Any
@@ -32,7 +33,8 @@ def inpxml_parser(inpxmlfile: XMLFileLike,
                   parser_info_out: dict[str, Any] | None = None,
                   strict: bool = False,
                   debug: bool = False,
-                  base_url: str | None = None) -> dict[str, Any]:
+                  base_url: str | None = None,
+                  profile: bool = False) -> dict[str, Any]:
     """
     Parses the given inp.xml file to a python dictionary utilizing the schema
     defined by the version number to validate and correctly convert to the dictionary
@@ -41,6 +43,10 @@ def inpxml_parser(inpxmlfile: XMLFileLike,
                        or a xml etree to be parsed
     :param parser_info_out: dict, with warnings, info, errors, ...
     :param strict: bool if True  and no parser_info_out is provided any encountered error will immediately be raised
+    :param profile: bool, if True the wall times, number of calls and XPath evaluations of the parsing
+                    phases are recorded in ``parser_info_out['timings']``
+                    (see :py:mod:`~masci_tools.util.parser_timings`). Can also be enabled with
+                    the environment variable ``MASCI_TOOLS_PARSER_TIMINGS``
 
     :return: python dictionary with the parsed inp.xml
 
@@ -80,24 +86,34 @@ def inpxml_parser(inpxmlfile: XMLFileLike,
     if logger is not None:
         logger.info('Masci-Tools Fleur inp.xml Parser v%s', __parser_version__)
 
-    xmltree, schema_dict = load_inpxml(inpxmlfile, logger=logger, base_url=base_url)
-    actual_inp_version = evaluate_attribute(xmltree, schema_dict, 'fleurInputVersion', logger=logger)
-    ignore_validation = schema_dict['inp_version'] != actual_inp_version
-
-    xmltree, _ = clear_xml(xmltree)
-    root = xmltree.getroot()
-
-    constants = get_constants(root, schema_dict, logger=logger)
-
-    try:
-        schema_dict.validate(xmltree, logger=logger)
-    except ValueError as err:
-        if not ignore_validation:
-            if logger is not None:
-                logger.exception(err)
-            raise
-
-    inp_dict = inpxml_todict(root, schema_dict, constants, logger=logger)
+    with collect_timings(timings_enabled(profile)) as timings:
+        with timed('load'):
+            xmltree, schema_dict = load_inpxml(inpxmlfile, logger=logger, base_url=base_url)
+        actual_inp_version = evaluate_attribute(xmltree, schema_dict, 'fleurInputVersion', logger=logger)
+        ignore_validation = schema_dict['inp_version'] != actual_inp_version
+
+        #If the tree was parsed here it is owned by the parser and does not need to be copied
+        with timed('clear_xml'):
+            xmltree, _ = clear_xml(xmltree, inplace=not isinstance(inpxmlfile, (etree._ElementTree, etree._Element)))
+        root = xmltree.getroot()
+
+        with timed('constants'):
+            constants = get_constants(root, schema_dict, logger=logger)
+
+        try:
+            with timed('validation'):
+                schema_dict.validate(xmltree, logger=logger)
+        except ValueError as err:
+            if not ignore_validation:
+                if logger is not None:
+                    logger.exception(err)
+                raise
+
+        with timed('inpxml_todict'):
+            inp_dict = inpxml_todict(root, schema_dict, constants, logger=logger)
+
+    if timings is not None and parser_info_out is not None:
+        parser_info_out['timings'] = timings.to_dict()
 
     if parser_log_handler is not None:
         if logger is not None:
@@ -21,13 +21,20 @@ from masci_tools.util.xml.converters import convert_str_version_number
 from masci_tools.util.xml import xml_getters
 from masci_tools.util.xml.xpathbuilder import FilterType
 from masci_tools.util.parse_utils import Conversion
-from masci_tools.io.fleur_xml import FleurXMLContext, load_outxml_and_check_for_broken_xml, _EvalContext
+from masci_tools.io.fleur_xml import FleurXMLContext, load_outxml_and_check_for_broken_xml, read_outxml_header, _EvalContext, _get_outxml_versions
+from masci_tools.io.parsers.fleur_schema import OutputSchemaDict, NoPathFound, NoUniquePathFound
 from masci_tools.util.logging_util import DictHandler, OutParserLogAdapter
+from masci_tools.util.parser_timings import collect_timings, timed, timings_enabled
 from masci_tools.util.typing import XMLFileLike
+from lxml import etree
+import numpy as np
 import copy
+import io
+import os
 import warnings
 import logging
-from typing import Any, Callable, Iterable, TypeVar
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TypeVar, TYPE_CHECKING
 try:
     from typing import Literal
 except ImportError:
@@ -37,8 +44,10 @@ if sys.version_info >= (3, 10):
     from typing import TypeAlias
 else:
     from typing_extensions import TypeAlias
+if TYPE_CHECKING:
+    import pandas as pd
 
-__all__ = ('outxml_parser', 'conversion_function', 'register_migration')
+__all__ = ('outxml_parser', 'outxml_parser_many', 'conversion_function', 'register_migration')
 
 
 def outxml_parser(outxmlfile: XMLFileLike,
@@ -53,7 +62,10 @@ def outxml_parser(outxmlfile: XMLFileLike,
                   strict: bool = False,
                   debug: bool = False,
                   ignore_validation: bool = False,
-                  base_url: str | None = None) -> dict[str, Any]:
+                  base_url: str | None = None,
+                  streaming: bool = False,
+                  profile: bool = False,
+                  iteration_output: Literal['list', 'numpy', 'pandas'] = 'list') -> dict[str, Any]:
     """
     Parses the out.xml file to a dictionary based on the version and the given tasks
 
@@ -77,6 +89,23 @@ def outxml_parser(outxmlfile: XMLFileLike,
     :param strict: bool if True  and no parser_info_out is provided any encountered error will immediately be raised
     :param debug: bool if True additional information is printed out in the logs
     :param ignore_validation: bool, if True schema validation errors are only logged
+    :param streaming: bool, if True the file is parsed incrementally with :py:func:`lxml.etree.iterparse()`.
+                      Each iteration is parsed when it is complete and freed afterwards, so that the
+                      memory usage is bounded by the size of a few iterations instead of the whole file.
+                      Iterations, which are not selected via `iteration_to_parse` are never fully
+                      kept in memory. In this mode the file is not validated against the schema
+                      and XInclude tags are not resolved. Ignored if an already parsed XML tree is given
+    :param profile: bool, if True the wall times, number of calls and XPath evaluations of the parsing
+                    phases, tasks and conversions are recorded in ``parser_info_out['timings']``
+                    (see :py:mod:`~masci_tools.util.parser_timings`). Can also be enabled with
+                    the environment variable ``MASCI_TOOLS_PARSER_TIMINGS``
+    :param iteration_output: str, determines how the quantities parsed for each iteration are returned.
+                             ``list`` (default) gives lists with one entry per iteration.
+                             ``numpy`` stores them in preallocated numpy arrays (first axis is the iteration,
+                             missing values are ``NaN``), quantities, which cannot be represented as numerical
+                             arrays are returned as lists. These are not converted to single values, regardless
+                             of ``list_return``. ``pandas`` returns all iteration quantities in a
+                             :py:class:`pandas.DataFrame` under the key ``iterations`` (one row per iteration)
 
     :return: python dictionary with the information parsed from the out.xml
 
@@ -116,122 +145,858 @@ def outxml_parser(outxmlfile: XMLFileLike,
     if logger is not None:
         logger.info('Masci-Tools Fleur out.xml Parser v%s', __parser_version__)
 
-    try:
-        xmltree, schema_dict, outfile_broken = load_outxml_and_check_for_broken_xml(outxmlfile,
-                                                                                    logger=logger,
-                                                                                    base_url=base_url)
-    except ValueError as err:
+    if streaming and isinstance(outxmlfile, etree._ElementTree):
+        if logger is not None:
+            logger.info('Streaming mode is not possible for an already parsed XML tree')
+        streaming = False
+
+    if iteration_output not in ('list', 'numpy', 'pandas'):
         if logger is not None:
-            logger.error(str(err))
-        if 'Skipping the parsing of the XML file' in str(err):
-            return {}
-        raise
-    xmltree, _ = clear_xml(xmltree)
+            logger.error("Invalid value for iteration_output: Got '%s'", iteration_output)
+        raise ValueError(f"Invalid value for iteration_output: Got '{iteration_output}' "
+                         "Valid values are: 'list', 'numpy' or 'pandas'")
+
+    columns: _IterationColumns | None = None
+    if streaming and iteration_output != 'list':
+        #The number of iterations is not known in advance
+        columns = _IterationColumns(_STREAMING_COLUMN_SIZE if iteration_to_parse == 'all' else 1)
+
+    with collect_timings(timings_enabled(profile)) as timings:
+        if streaming:
+            try:
+                out_dict = _outxml_parser_streaming(outxmlfile,
+                                                    iteration_to_parse=iteration_to_parse,
+                                                    minimal_mode=minimal_mode,
+                                                    additional_tasks=additional_tasks,
+                                                    optional_tasks=optional_tasks,
+                                                    overwrite=overwrite,
+                                                    append=append,
+                                                    logger=logger,
+                                                    columns=columns)
+            except ValueError as err:
+                if 'Skipping the parsing of the XML file' not in str(err):
+                    raise
+                if logger is not None:
+                    logger.error(str(err))
+                return {}
+        else:
+            with timed('read_header'):
+                #Only the part before the first iteration is needed to determine the metadata of the file
+                header = read_outxml_header(outxmlfile)
+            try:
+                with timed('load'):
+                    xmltree, schema_dict, outfile_broken = load_outxml_and_check_for_broken_xml(outxmlfile,
+                                                                                                logger=logger,
+                                                                                                base_url=base_url)
+            except ValueError as err:
+                if logger is not None:
+                    logger.error(str(err))
+                if 'Skipping the parsing of the XML file' in str(err):
+                    return {}
+                raise
+            #If the tree was parsed here it is owned by the parser and does not need to be copied
+            with timed('clear_xml'):
+                xmltree, _ = clear_xml(xmltree,
+                                       inplace=not isinstance(outxmlfile, (etree._ElementTree, etree._Element)))
+
+            with FleurXMLContext(xmltree, schema_dict, logger=logger, header=header) as root:
+
+                out_version, versions_match = _check_out_versions(root, schema_dict, logger)
+                if not versions_match:
+                    ignore_validation = True
+
+                try:
+                    with timed('validation'):
+                        schema_dict.validate(xmltree, logger=logger)
+                except ValueError as err:
+                    if not ignore_validation:
+                        if logger is not None:
+                            logger.exception(err)
+                        raise
+
+                parser, fleur_modes = _create_task_parser(root,
+                                                          out_version,
+                                                          additional_tasks=additional_tasks,
+                                                          optional_tasks=optional_tasks,
+                                                          overwrite=overwrite,
+                                                          append=append,
+                                                          minimal_mode=minimal_mode,
+                                                          iteration_to_parse=iteration_to_parse)
+
+                out_dict = {'input_file_version': schema_dict['inp_version'], 'fleur_modes': fleur_modes}
+                out_dict = _perform_general_tasks(parser, root, out_dict)
+
+                n_iters = root.number_nodes('iteration')
+                iteration_filter = _determine_iteration_condition(iteration_to_parse, n_iters, outfile_broken, logger)
+                if iteration_output != 'list':
+                    columns = _IterationColumns(n_iters if iteration_to_parse == 'all' else 1)
+
+                logger_info: dict[str, Any] = {}
+                iteration_logger: logging.LoggerAdapter | None = None
+                if logger is not None:
+                    iteration_logger = OutParserLogAdapter(logger, logger_info)
+
+                for iteration in root.iter('iteration', filters=iteration_filter):
+                    with timed('iteration_tasks'):
+                        if columns is None:
+                            out_dict = _perform_iteration_tasks(parser,
+                                                                iteration,
+                                                                out_dict,
+                                                                minimal_mode=minimal_mode,
+                                                                iteration_logger=iteration_logger,
+                                                                logger_info=logger_info)
+                        else:
+                            columns.add(
+                                _perform_iteration_tasks(parser,
+                                                         iteration, {},
+                                                         minimal_mode=minimal_mode,
+                                                         iteration_logger=iteration_logger,
+                                                         logger_info=logger_info))
 
-    with FleurXMLContext(xmltree, schema_dict, logger=logger) as root:
+    if not list_return:
+        #Convert one item lists to simple values
+        for key, value in out_dict.items():
+            if isinstance(value, list) and len(value) == 1:
+                out_dict[key] = value[0]
+            elif isinstance(value, dict):
+                for subkey, subvalue in value.items():
+                    if isinstance(subvalue, list) and len(subvalue) == 1:
+                        out_dict[key][subkey] = subvalue[0]
 
-        out_version = root.attribute('fleurOutputVersion')
-        if out_version == '0.27':
-            inp_version = out_version
+    if columns is not None:
+        if iteration_output == 'pandas':
+            out_dict['iterations'], iteration_dict = columns.to_dataframe()
         else:
-            inp_version = root.attribute('fleurInputVersion')
+            iteration_dict = columns.to_dict()
+        _merge_iteration_results(out_dict, iteration_dict)
 
-        if schema_dict['out_version'] != out_version or \
-           schema_dict['inp_version'] != inp_version:
-            ignore_validation = True
-            out_version = schema_dict['out_version']
-            inp_version = schema_dict['inp_version']
+    if timings is not None and parser_info_out is not None:
+        parser_info_out['timings'] = timings.to_dict()
 
+    if parser_log_handler is not None:
         if logger is not None:
-            logger.info('Found fleur out file with the versions out: %s; inp: %s', out_version, inp_version)
+            logger.removeHandler(parser_log_handler)
+
+    return out_dict
+
+
+def outxml_parser_many(files: Iterable[str | os.PathLike],
+                       workers: int | None = None,
+                       chunksize: int = 1,
+                       iteration_to_parse: Literal['all', 'last', 'first'] | int = 'last',
+                       minimal_mode: bool = False,
+                       optional_tasks: Iterable[str] | None = None,
+                       schema_versions: Iterable[str] | None = None,
+                       strict: bool = False,
+                       **kwargs: Any) -> Iterator[tuple[str | os.PathLike, dict[str, Any], dict[str, Any]]]:
+    """
+    Parses many out.xml files in parallel with the :py:func:`outxml_parser()` using
+    a :py:class:`~concurrent.futures.ProcessPoolExecutor`
+
+    The results are yielded in the order in which they are completed, not in the order
+    of the given files
+
+    :param files: Iterable of paths to the out.xml files
+    :param workers: int, number of worker processes (default is the number of CPUs)
+    :param chunksize: int, number of files sent to a worker process at once. Larger chunks
+                      reduce the communication overhead for many small files
+    :param iteration_to_parse: either str or int, (optional, default 'last')
+                               determines which iteration should be parsed.
+                               Accepted are 'all', 'first', 'last' or an index for the iteration
+    :param minimal_mode: bool, if True only total Energy, iteration number and distances are parsed
+    :param optional_tasks: Iterable of strings, defines additional tasks to perform.
+                           See :py:mod:`~masci_tools.io.parsers.fleur.default_parse_tasks` for examples.
+    :param schema_versions: Iterable of the output versions for which the schema dictionaries are
+                            created once in each worker process before parsing. By default all
+                            available versions are loaded
+    :param strict: bool, if True any exception raised for a file is raised again when its result is
+                   retrieved. Otherwise it is added to the `parser_critical` entry of the
+                   `parser_info_out` for this file and an empty dictionary is returned
+
+    Additional keyword arguments are passed on to :py:func:`outxml_parser()`
+
+    :returns: generator of tuples with the path, the parsed dictionary and
+              the `parser_info_out` dictionary for each file
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from masci_tools.io.parsers.fleur_schema import list_available_versions
+
+    if 'parser_info_out' in kwargs:
+        raise ValueError('parser_info_out cannot be given for outxml_parser_many. '
+                         'It is returned for each file separately')
+    if chunksize < 1:
+        raise ValueError(f'chunksize has to be a positive integer. Got: {chunksize}')
+
+    if schema_versions is None:
+        schema_versions = list_available_versions(output_schema=True)
+
+    kwargs['iteration_to_parse'] = iteration_to_parse
+    kwargs['minimal_mode'] = minimal_mode
+    if optional_tasks is not None:
+        kwargs['optional_tasks'] = list(optional_tasks)
+
+    files = list(files)
+    chunks = [files[start:start + chunksize] for start in range(0, len(files), chunksize)]
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_outxml_parser_worker,
+                             initargs=(list(schema_versions),)) as executor:
+        futures = [executor.submit(_parse_outxml_chunk, chunk, kwargs, strict) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def _init_outxml_parser_worker(schema_versions: list[str]) -> None:
+    """
+    Initializer for the worker processes of :py:func:`outxml_parser_many()`.
+    Creates the schema dictionaries for the given versions, so that they are cached
+    for all files parsed in this process
+    """
+    OutputSchemaDict.warmup(schema_versions)
+
 
+def _parse_outxml_chunk(files: list[str | os.PathLike], kwargs: dict[str, Any],
+                        strict: bool) -> list[tuple[str | os.PathLike, dict[str, Any], dict[str, Any]]]:
+    """
+    Parse a list of files with the :py:func:`outxml_parser()` in a worker process
+    of :py:func:`outxml_parser_many()`
+
+    :param files: list of paths to the out.xml files
+    :param kwargs: keyword arguments for the :py:func:`outxml_parser()`
+    :param strict: bool, if False exceptions are added to the `parser_info_out`
+
+    :returns: list of tuples with the path, the parsed dictionary and
+              the `parser_info_out` dictionary for each file
+    """
+    logger = logging.getLogger(__name__)
+
+    results = []
+    for file in files:
+        parser_info_out: dict[str, Any] = {}
+        handlers = list(logger.handlers)
         try:
-            schema_dict.validate(xmltree, logger=logger)
-        except ValueError as err:
-            if not ignore_validation:
-                if logger is not None:
-                    logger.exception(err)
+            out_dict = outxml_parser(file, parser_info_out=parser_info_out, **kwargs)
+        except Exception as exc:  #pylint: disable=broad-except
+            if strict:
                 raise
+            parser_info_out.setdefault('parser_critical', []).append(f'{type(exc).__name__}: {exc}')
+            out_dict = {}
+        finally:
+            #The log handler of the parser is not removed if an exception occurs
+            for handler in logger.handlers:
+                if handler not in handlers:
+                    logger.removeHandler(handler)
+        results.append((file, out_dict, parser_info_out))
+    return results
+
+
+def _check_out_versions(root: _EvalContext, schema_dict: OutputSchemaDict,
+                        logger: logging.Logger | None) -> tuple[str, bool]:
+    """
+    Compare the versions stated in the out.xml file with the versions of the used
+    schema dictionary
 
-        parser = _TaskParser(out_version)
-        if additional_tasks is None:
-            additional_tasks = {}
-        for task_name, task_definition in additional_tasks.items():
-            parser.add_task(task_name, task_definition, overwrite=overwrite, append=append)
+    :param root: evaluation context for the root of the out.xml file
+    :param schema_dict: OutputSchemaDict used for parsing
+    :param logger: logger for information
 
-        if logger is not None:
-            logger.info('The following defined constants were found: %s', root.constants)
+    :returns: the output version to use for the parsing tasks and a bool, whether the versions
+              in the file match the schema dictionary
+    """
+    out_version = root.attribute('fleurOutputVersion')
+    if out_version == '0.27':
+        inp_version = out_version
+    else:
+        inp_version = root.attribute('fleurInputVersion')
 
-        fleur_modes = xml_getters.get_fleur_modes(xmltree, schema_dict, logger=logger)
-        if logger is not None:
-            logger.info('The following Fleur modes were found: %s', fleur_modes)
+    versions_match = True
+    if schema_dict['out_version'] != out_version or \
+       schema_dict['inp_version'] != inp_version:
+        versions_match = False
+        out_version = schema_dict['out_version']
+        inp_version = schema_dict['inp_version']
+
+    if logger is not None:
+        logger.info('Found fleur out file with the versions out: %s; inp: %s', out_version, inp_version)
+
+    return out_version, versions_match
+
+
+def _create_task_parser(
+        root: _EvalContext, out_version: str, additional_tasks: dict[str, dict[str, Any]] | None,
+        optional_tasks: Iterable[str] | None, overwrite: bool, append: bool, minimal_mode: bool,
+        iteration_to_parse: Literal['all', 'last', 'first'] | int) -> tuple[_TaskParser, dict[str, Any]]:
+    """
+    Set up the :py:class:`_TaskParser` with the tasks to perform for the given out.xml file
+
+    :param root: evaluation context for the root of the out.xml file
+    :param out_version: output version of the file
+
+    All other arguments are the same as in :py:func:`outxml_parser()`
+
+    :returns: the task parser and the determined fleur modes
+    """
+    parser = _TaskParser(out_version)
+    if additional_tasks is None:
+        additional_tasks = {}
+    for task_name, task_definition in additional_tasks.items():
+        parser.add_task(task_name, task_definition, overwrite=overwrite, append=append)
+
+    if root.logger is not None:
+        root.logger.info('The following defined constants were found: %s', root.constants)
+
+    with timed('fleur_modes'):
+        fleur_modes = root.fleur_modes
+    if root.logger is not None:
+        root.logger.info('The following Fleur modes were found: %s', fleur_modes)
+    with timed('determine_tasks'):
         parser.determine_tasks(fleur_modes, optional_tasks, minimal=minimal_mode, iteration_to_parse=iteration_to_parse)
 
-        out_dict = {'input_file_version': schema_dict['inp_version'], 'fleur_modes': fleur_modes}
-        if logger is not None:
-            logger.debug('The following tasks are performed on the root: %s', parser.general_tasks)
+    return parser, fleur_modes
+
+
+def _perform_general_tasks(parser: _TaskParser, root: _EvalContext, out_dict: dict[str, Any]) -> dict[str, Any]:
+    """
+    Perform all general (not iteration specific) tasks on the root of the out.xml file
+
+    :param parser: task parser with the determined tasks
+    :param root: evaluation context for the root of the out.xml file
+    :param out_dict: dict, output will be put in this dictionary
+
+    :returns: the output dictionary
+    """
+    if root.logger is not None:
+        root.logger.debug('The following tasks are performed on the root: %s', parser.general_tasks)
+    with timed('general_tasks'):
         for task in parser.general_tasks:
 
-            if logger is not None:
-                logger.debug('Performing task: %s', task)
-            out_dict = parser.perform_task(task, root, out_dict, use_lists=False)
+            if root.logger is not None:
+                root.logger.debug('Performing task: %s', task)
+            with timed(task, 'tasks'):
+                out_dict = parser.perform_task(task, root, out_dict, use_lists=False)
+    return out_dict
 
-        iteration_filter = _determine_iteration_condition(iteration_to_parse, root.number_nodes('iteration'),
-                                                          outfile_broken, logger)
 
-        logger_info: dict[str, Any] = {}
-        iteration_logger: logging.LoggerAdapter | None = None
-        if logger is not None:
-            iteration_logger = OutParserLogAdapter(logger, logger_info)
+def _perform_iteration_tasks(parser: _TaskParser, iteration: _EvalContext, out_dict: dict[str, Any], minimal_mode: bool,
+                             iteration_logger: logging.LoggerAdapter | None, logger_info: dict[str,
+                                                                                               Any]) -> dict[str, Any]:
+    """
+    Perform all iteration tasks on the given iteration
 
-        for iteration in root.iter('iteration', filters=iteration_filter):
-            iteration.logger = iteration_logger  #type:ignore[assignment] #TODO: Should this be allowed to be overwritten in iter?
-            logger_info['iteration'] = iteration.attribute('numberForCurrentRun', default='unknown')
+    :param parser: task parser with the determined tasks
+    :param iteration: evaluation context for the iteration element
+    :param out_dict: dict, output will be put in this dictionary
+    :param minimal_mode: bool, if True only the minimal tasks are performed
+    :param iteration_logger: logger adapter adding the iteration information
+    :param logger_info: dict with the extra information for the iteration_logger
 
-            iteration_tasks = parser.iteration_tasks
-            #If the iteration is a forcetheorem calculation
-            #Replace all tasks with the given tasks for the calculation
-            forcetheorem_tags = ['Forcetheorem_DMI', 'Forcetheorem_SSDISP', 'Forcetheorem_JIJ', 'Forcetheorem_MAE']
-            for tag in forcetheorem_tags:
-                if iteration.tag_exists(tag):
-                    if minimal_mode:
-                        iteration_tasks = []
-                    else:
-                        iteration_tasks = [tag.lower()]
-                    break
+    :returns: the output dictionary
+    """
+    iteration.logger = iteration_logger  #type:ignore[assignment] #TODO: Should this be allowed to be overwritten in iter?
+    logger_info['iteration'] = iteration.attribute('numberForCurrentRun', default='unknown')
+
+    iteration_tasks = parser.iteration_tasks
+    #If the iteration is a forcetheorem calculation
+    #Replace all tasks with the given tasks for the calculation
+    forcetheorem_tags = ['Forcetheorem_DMI', 'Forcetheorem_SSDISP', 'Forcetheorem_JIJ', 'Forcetheorem_MAE']
+    for tag in forcetheorem_tags:
+        if iteration.tag_exists(tag):
+            if minimal_mode:
+                iteration_tasks = []
+            else:
+                iteration_tasks = [tag.lower()]
+            break
 
-            if iteration.logger is not None:
-                iteration.logger.debug('The following tasks are performed for the iteration: %s', iteration_tasks)
+    if iteration.logger is not None:
+        iteration.logger.debug('The following tasks are performed for the iteration: %s', iteration_tasks)
 
-            for task in iteration_tasks:
+    for task in iteration_tasks:
 
-                if iteration.logger is not None:
-                    iteration.logger.debug('Performing task: %s', task)
+        if iteration.logger is not None:
+            iteration.logger.debug('Performing task: %s', task)
 
-                try:
-                    out_dict = parser.perform_task(task, iteration, out_dict)
-                except KeyError:
-                    if logger is not None:
-                        logger.exception("Unknown task: '%s'. Skipping this one", task)
-                    raise
+        try:
+            with timed(task, 'tasks'):
+                out_dict = parser.perform_task(task, iteration, out_dict)
+        except KeyError:
+            if iteration_logger is not None:
+                iteration_logger.logger.exception("Unknown task: '%s'. Skipping this one", task)
+            raise
+    return out_dict
 
-    if not list_return:
-        #Convert one item lists to simple values
-        for key, value in out_dict.items():
-            if isinstance(value, list) and len(value) == 1:
-                out_dict[key] = value[0]
-            elif isinstance(value, dict):
-                for subkey, subvalue in value.items():
-                    if isinstance(subvalue, list) and len(subvalue) == 1:
-                        out_dict[key][subkey] = subvalue[0]
 
-    if parser_log_handler is not None:
+def _outxml_parser_streaming(outxmlfile: XMLFileLike,
+                             iteration_to_parse: Literal['all', 'last', 'first'] | int,
+                             minimal_mode: bool,
+                             additional_tasks: dict[str, dict[str, Any]] | None,
+                             optional_tasks: Iterable[str] | None,
+                             overwrite: bool,
+                             append: bool,
+                             logger: logging.Logger | None,
+                             columns: _IterationColumns | None = None) -> dict[str, Any]:
+    """
+    Parse the out.xml file incrementally using :py:func:`lxml.etree.iterparse()`
+
+    The general information (versions, fleur modes, ...) is determined when the first
+    iteration starts, i.e. all of the input section is available. Each completed
+    iteration is either parsed or discarded as soon as it is clear, whether it is selected
+    by `iteration_to_parse`. Afterwards only a stub of the iteration element is kept in the tree,
+    so that the general tasks can be performed on the remaining tree at the end.
+
+    :param columns: optional :py:class:`_IterationColumns` collecting the results of the iterations
+                    instead of the returned dictionary
+
+    All other arguments are the same as in :py:func:`outxml_parser()`
+
+    :returns: python dictionary with the information parsed from the out.xml
+    """
+    if not isinstance(iteration_to_parse, int) and iteration_to_parse not in ('all', 'first', 'last'):
+        _determine_iteration_condition(iteration_to_parse, 1, False, logger)
+
+    if isinstance(outxmlfile, (str, bytes, Path)) and not os.path.isfile(outxmlfile):
+        if isinstance(outxmlfile, str):
+            outxmlfile = outxmlfile.encode('utf-8')
+        outxmlfile = io.BytesIO(outxmlfile)  #type:ignore[arg-type]
+    elif isinstance(outxmlfile, Path):
+        outxmlfile = os.fspath(outxmlfile)
+
+    events = etree.iterparse(outxmlfile,
+                             events=('start', 'end'),
+                             tag=('fleurOutput', 'iteration'),
+                             attribute_defaults=True,
+                             remove_comments=True,
+                             encoding='utf-8')
+
+    logger_info: dict[str, Any] = {}
+    iteration_logger: logging.LoggerAdapter | None = None
+    if logger is not None:
+        iteration_logger = OutParserLogAdapter(logger, logger_info)
+
+    root_element: etree._Element | None = None
+    root: _EvalContext | None = None
+    parser: _TaskParser | None = None
+    fleur_modes: dict[str, Any] = {}
+    window: _IterationWindow | None = None
+    iteration_dict: dict[str, Any] = {}
+    current_iteration: etree._Element | None = None
+
+    def setup() -> None:
+        nonlocal root, parser, fleur_modes, window
+        if root_element is None:
+            raise ValueError('Skipping the parsing of the XML file. Repairing was not possible.')
+        xmltree = root_element.getroottree()
+
+        out_version, inp_version = _get_outxml_versions(xmltree, logger=logger)
+        schema_dict = OutputSchemaDict.fromVersion(out_version, inp_version=inp_version, logger=logger)
+
+        #Use the root element directly since the tree is still being built
+        root = _EvalContext(root_element, schema_dict, logger=logger)
+        out_version, _ = _check_out_versions(root, schema_dict, logger)
         if logger is not None:
-            logger.removeHandler(parser_log_handler)
+            logger.info('Streaming mode: The file is not validated against the schema')
+
+        parser, fleur_modes = _create_task_parser(root,
+                                                  out_version,
+                                                  additional_tasks=additional_tasks,
+                                                  optional_tasks=optional_tasks,
+                                                  overwrite=overwrite,
+                                                  append=append,
+                                                  minimal_mode=minimal_mode,
+                                                  iteration_to_parse=iteration_to_parse)
+
+        def process(element: etree._Element) -> None:
+            nonlocal iteration_dict
+            with root.nested(element) as iteration, timed('iteration_tasks'):  #type:ignore[union-attr]
+                result = _perform_iteration_tasks(
+                    parser,  #type:ignore[arg-type]
+                    iteration,
+                    iteration_dict if columns is None else {},
+                    minimal_mode=minimal_mode,
+                    iteration_logger=iteration_logger,
+                    logger_info=logger_info)
+            if columns is None:
+                iteration_dict = result
+            else:
+                columns.add(result)
+
+        window = _IterationWindow(iteration_to_parse, process, _required_iteration_tags(parser, schema_dict))
+
+    broken = False
+    try:
+        for event, element in events:
+            if element.tag == 'fleurOutput':
+                if event == 'start':
+                    root_element = element
+                continue
+
+            if event == 'start':
+                if window is None:
+                    setup()
+                current_iteration = element
+            else:
+                current_iteration = None
+                window.add(element)  #type:ignore[union-attr]
+    except etree.XMLSyntaxError:
+        broken = True
+        if logger is None:
+            warnings.warn('The out.xml file is broken I try to repair it.')
+        else:
+            logger.warning('The out.xml file is broken I try to repair it.')
+
+    if window is None:
+        setup()
+    if current_iteration is not None:
+        #The iteration, which is broken off, is treated as the last iteration
+        window.add(current_iteration)  #type:ignore[union-attr]
+    window.finish(broken, logger)  #type:ignore[union-attr]
+
+    out_dict = {
+        'input_file_version': root.schema_dict['inp_version'],
+        'fleur_modes': fleur_modes
+    }  #type:ignore[union-attr]
+    out_dict = _perform_general_tasks(parser, root, out_dict)  #type:ignore[arg-type]
+
+    _merge_iteration_results(out_dict, iteration_dict)
 
     return out_dict
 
 
+def _merge_iteration_results(out_dict: dict[str, Any], iteration_dict: dict[str, Any]) -> None:
+    """
+    Add the results of the iteration tasks to the output dictionary
+
+    :param out_dict: dict with the results of the general tasks
+    :param iteration_dict: dict with the results of the iteration tasks
+    """
+    for key, value in iteration_dict.items():
+        if isinstance(value, dict) and isinstance(out_dict.get(key), dict):
+            out_dict[key].update(value)
+        else:
+            out_dict[key] = value
+
+
+def _required_iteration_tags(parser: _TaskParser, schema_dict: OutputSchemaDict) -> set[str]:
+    """
+    Determine the tags directly below the iteration elements, which are needed
+    for evaluating the general tasks (tasks with ``iteration_path=True``)
+
+    :param parser: task parser with the determined tasks
+    :param schema_dict: OutputSchemaDict used for parsing
+
+    :returns: set of the tag names, which should be kept when discarding an iteration
+    """
+    iteration_xpath = schema_dict.tag_xpath('iteration')
+
+    required_tags = set()
+    for task_name in parser.general_tasks:
+        for task_key, spec in parser.tasks[task_name].items():
+            if task_key.startswith('_') or spec['parse_type'] == 'xmlGetter':
+                continue
+            if not spec.get('kwargs', {}).get('iteration_path', False):
+                continue
+
+            try:
+                if spec['parse_type'] in ('attrib', 'attrib_exists'):
+                    xpath = schema_dict.iteration_attrib_xpath(**spec['path_spec'])
+                else:
+                    xpath = schema_dict.iteration_tag_xpath(**spec['path_spec'])
+            except (NoPathFound, NoUniquePathFound):
+                continue
+
+            tag_name = xpath[len(iteration_xpath):].strip('/').split('/')[0]
+            if tag_name and not tag_name.startswith('@'):
+                required_tags.add(tag_name)
+
+    return required_tags
+
+
+_STREAMING_COLUMN_SIZE = 64
+"""Initial number of iterations for the columns of the iteration quantities in streaming mode"""
+
+
+class _IterationColumn:
+    """
+    Values of one quantity for all parsed iterations. Numerical and boolean values
+    of a fixed shape are stored in a preallocated numpy array, whose first axis is the
+    iteration. All other values (strings, nested lists of varying shape, ...) are stored in a list
+
+    :param size: expected number of iterations (the array grows if more are added)
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = max(size, 1)
+        self.values: np.ndarray | list[Any] | None = None
+        self.present = np.zeros(self.size, dtype=bool)
+
+    def _grow(self, size: int) -> None:
+        """
+        Increase the number of available iterations to at least the given size
+        """
+        new_size = max(size, 2 * self.size)
+        self.present = np.concatenate([self.present, np.zeros(new_size - self.size, dtype=bool)])
+        if isinstance(self.values, np.ndarray):
+            values = np.empty((new_size, *self.values.shape[1:]), dtype=self.values.dtype)
+            values[:self.size] = self.values
+            self.values = values
+        elif self.values is not None:
+            self.values.extend([None] * (new_size - self.size))
+        self.size = new_size
+
+    def _to_list(self) -> list[Any]:
+        """
+        Switch from the array to the list representation
+        """
+        if isinstance(self.values, np.ndarray):
+            self.values = [row.tolist() if present else None for row, present in zip(self.values, self.present)]
+        elif self.values is None:
+            self.values = [None] * self.size
+        return self.values
+
+    def set(self, index: int, value: Any) -> None:
+        """
+        Set the value for the iteration with the given index. None is treated as a missing value
+
+        :param index: index of the iteration
+        :param value: parsed value
+        """
+        if index >= self.size:
+            self._grow(index + 1)
+        if value is None:
+            return
+
+        array_value = None
+        if not isinstance(self.values, list):
+            try:
+                array_value = np.asarray(value)
+            except ValueError:
+                #Inhomogeneous nested lists
+                pass
+            if array_value is not None and array_value.dtype.kind not in 'biuf':
+                array_value = None
+
+        if array_value is not None:
+            if self.values is None:
+                self.values = np.empty((self.size, *array_value.shape), dtype=array_value.dtype)
+            if array_value.shape == self.values.shape[1:]:
+                if not np.can_cast(array_value.dtype, self.values.dtype):
+                    self.values = self.values.astype(np.result_type(self.values.dtype, array_value.dtype))
+                self.values[index] = array_value
+                self.present[index] = True
+                return
+
+        self._to_list()[index] = value
+        self.present[index] = True
+
+    def finalize(self, count: int) -> np.ndarray | list[Any]:
+        """
+        Get the values for the given number of parsed iterations. Missing values
+        are represented by ``NaN`` in numerical arrays and ``None`` otherwise
+
+        :param count: number of parsed iterations
+
+        :returns: numpy array or list with the values
+        """
+        if count > self.size:
+            self._grow(count)
+        present = self.present[:count]
+        if not isinstance(self.values, np.ndarray):
+            return self._to_list()[:count]
+
+        values = self.values[:count] if count == self.size else self.values[:count].copy()
+        if not present.all():
+            if values.dtype.kind in 'iu':
+                values = values.astype(float)
+            elif values.dtype.kind != 'f':
+                values = values.astype(object)
+                values[~present] = None
+                return values
+            values[~present] = np.nan
+        return values
+
+
+class _IterationColumns:
+    """
+    Collects the results of the iteration tasks for all parsed iterations
+    in :py:class:`_IterationColumn` objects (one for each quantity).
+
+    :param size: expected number of parsed iterations
+
+    The dictionaries passed to :py:meth:`add()` contain the results of the tasks
+    for one iteration, i.e. one item lists for each quantity. All other values
+    (e.g. units) are not treated as iteration quantities and the last value (not None) is kept
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.count = 0
+        self.data: dict[str, Any] = {}
+
+    def add(self, iteration_dict: dict[str, Any]) -> None:
+        """
+        Add the results for the next iteration
+
+        :param iteration_dict: dict with the results of the iteration tasks
+        """
+        self._add(self.data, iteration_dict)
+        self.count += 1
+
+    def _add(self, target: dict[str, Any], values: dict[str, Any]) -> None:
+        for key, value in values.items():
+            if isinstance(value, dict):
+                if not isinstance(target.get(key), dict):
+                    target[key] = {}
+                self._add(target[key], value)
+            elif isinstance(value, list) and len(value) == 1:
+                column = target.get(key)
+                if not isinstance(column, _IterationColumn):
+                    column = target[key] = _IterationColumn(self.size)
+                column.set(self.count, value[0])
+            elif value is not None or key not in target:
+                #Same as overwrite_last in the parse tasks
+                target[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Get the collected quantities
+
+        :returns: dict with numpy arrays/lists for the iteration quantities
+        """
+
+        def finalize(data: dict[str, Any]) -> dict[str, Any]:
+            result: dict[str, Any] = {}
+            for key, value in data.items():
+                if isinstance(value, _IterationColumn):
+                    result[key] = value.finalize(self.count)
+                elif isinstance(value, dict):
+                    result[key] = finalize(value)
+                else:
+                    result[key] = value
+            return result
+
+        return finalize(self.data)
+
+    def to_dataframe(self) -> tuple[pd.DataFrame, dict[str, Any]]:
+        """
+        Get the collected quantities as a :py:class:`pandas.DataFrame` with one row
+        for each iteration. Quantities in nested dictionaries are added with the keys
+        joined by ``.``. For multidimensional quantities each entry contains the
+        array for the corresponding iteration
+
+        :returns: the dataframe and a dict with all other values, which are not iteration quantities
+        """
+        import pandas as pd
+
+        columns: dict[str, Any] = {}
+
+        def flatten(data: dict[str, Any], prefix: str = '') -> dict[str, Any]:
+            other: dict[str, Any] = {}
+            for key, value in data.items():
+                if isinstance(value, _IterationColumn):
+                    values = value.finalize(self.count)
+                    if isinstance(values, np.ndarray) and values.ndim > 1:
+                        values = list(values)
+                    columns[f'{prefix}{key}'] = values
+                elif isinstance(value, dict):
+                    nested = flatten(value, prefix=f'{prefix}{key}.')
+                    if nested:
+                        other[key] = nested
+                else:
+                    other[key] = value
+            return other
+
+        other = flatten(self.data)
+        return pd.DataFrame(columns, index=pd.RangeIndex(self.count), copy=False), other
+
+
+class _IterationWindow:
+    """
+    Keeps track of the completed iteration elements when parsing an out.xml file
+    in streaming mode and decides, which iterations are parsed
+
+    Only the iterations, which might still be selected, are kept. All other iteration elements
+    are reduced to stubs, i.e. only the attributes and the tags needed for general tasks are kept
+
+    :param iteration_to_parse: either str or int, determines which iteration should be parsed.
+                               Accepted are 'all', 'first', 'last' or an index for the iteration
+    :param process: function called for each iteration to parse
+    :param required_tags: names of the tags directly below the iteration element, which should be kept
+    """
+
+    def __init__(self, iteration_to_parse: Literal['all', 'last', 'first'] | int,
+                 process: Callable[[etree._Element], None], required_tags: set[str]) -> None:
+        self.iteration_to_parse = iteration_to_parse
+        self.process = process
+        self.required_tags = required_tags
+        self.pending: list[etree._Element] = []
+        self.number_iterations = 0
+
+        self.window_size = 0
+        if iteration_to_parse == 'all':
+            self.window_size = 1
+        elif iteration_to_parse == 'last':
+            #Broken files parse the second to last iteration
+            self.window_size = 2
+        elif isinstance(iteration_to_parse, int) and iteration_to_parse < 0:
+            self.window_size = -iteration_to_parse
+
+    def add(self, element: etree._Element) -> None:
+        """
+        Add the next completed iteration
+
+        :param element: the iteration element
+        """
+        index = self.number_iterations
+        self.number_iterations += 1
+
+        if self.iteration_to_parse == 'first' or \
+           (isinstance(self.iteration_to_parse, int) and self.iteration_to_parse >= 0):
+            target = 0 if self.iteration_to_parse == 'first' else self.iteration_to_parse
+            if index == target:
+                self.process(element)
+            self.discard(element)
+            return
+
+        self.pending.append(element)
+        if len(self.pending) > self.window_size:
+            oldest = self.pending.pop(0)
+            if self.iteration_to_parse == 'all':
+                self.process(oldest)
+            self.discard(oldest)
+
+    def finish(self, broken: bool, logger: logging.Logger | None) -> None:
+        """
+        Process the remaining iterations, after the end of the file was reached
+
+        :param broken: if True the last iteration is assumed to be broken
+        :param logger: logger for warnings
+        """
+        n_iters = self.number_iterations
+        #Raises errors for invalid selections and logs the same information as the non-streaming mode
+        _determine_iteration_condition(self.iteration_to_parse, n_iters, broken, logger)
+
+        if self.pending:
+            if self.iteration_to_parse == 'all':
+                if not (broken and n_iters >= 2):
+                    self.process(self.pending[-1])
+            elif self.iteration_to_parse == 'last':
+                self.process(self.pending[-2] if broken and n_iters >= 2 else self.pending[-1])
+            else:
+                self.process(self.pending[0])
+
+        for element in self.pending:
+            self.discard(element)
+        self.pending.clear()
+
+    def discard(self, element: etree._Element) -> None:
+        """
+        Free the content of the given iteration element
+
+        :param element: the iteration element
+        """
+        element[:] = [child for child in element if child.tag in self.required_tags]
+        element.text = None
+
+
 def _determine_iteration_condition(iteration_to_parse: Literal['all', 'first', 'last'] | int, n_iters: int,
                                    broken: bool, logger: logging.Logger | None) -> FilterType:
     """
@@ -689,7 +1454,8 @@ class _TaskParser:
                 conversion = Conversion(name=conversion)
 
             action = self.conversion_functions[conversion.name]
-            out_dict = action(out_dict, *conversion.args, logger=context.logger, **conversion.kwargs)
+            with timed(conversion.name, 'conversions'):
+                out_dict = action(out_dict, *conversion.args, logger=context.logger, **conversion.kwargs)
 
         return out_dict
 
@@ -13,10 +13,12 @@
 Load all fleur schema related functions
 """
 from .schema_dict import (InputSchemaDict, OutputSchemaDict, SchemaDict, schema_dict_version_dispatch, NoPathFound,
-                          NoUniquePathFound, IncompatibleSchemaVersions, list_available_versions, EMPTY_TAG_INFO)
+                          NoUniquePathFound, IncompatibleSchemaVersions, list_available_versions, EMPTY_TAG_INFO,
+                          get_schema_cache_directory, SchemaDictCache)
 from .fleur_schema_parser_functions import AttributeType
 
 __all__ = [
     'InputSchemaDict', 'OutputSchemaDict', 'schema_dict_version_dispatch', 'AttributeType', 'NoPathFound',
-    'NoUniquePathFound', 'IncompatibleSchemaVersions', 'SchemaDict', 'list_available_versions', 'EMPTY_TAG_INFO'
+    'NoUniquePathFound', 'IncompatibleSchemaVersions', 'SchemaDict', 'list_available_versions', 'EMPTY_TAG_INFO',
+    'get_schema_cache_directory', 'SchemaDictCache'
 ]
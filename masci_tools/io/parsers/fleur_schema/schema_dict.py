@@ -20,6 +20,11 @@ import warnings
 import tempfile
 import shutil
 import copy
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
 from functools import update_wrapper, wraps
 from pathlib import Path
 from typing import Callable, Iterable, TypeVar, Any, cast
@@ -36,12 +41,18 @@ from lxml import etree
 
 from masci_tools.util.lockable_containers import LockableDict, LockableList
 from masci_tools.util.case_insensitive_dict import CaseInsensitiveFrozenSet, CaseInsensitiveDict
-from masci_tools.util.xml.common_functions import abs_to_rel_xpath, clear_xml, split_off_tag, contains_tag, validate_xml
+from masci_tools.util.xml.common_functions import abs_to_rel_xpath, clear_xml, requires_clearing, split_off_tag, contains_tag, validate_xml
 from .inpschema_todict import create_inpschema_dict, InputSchemaData
 from .outschema_todict import create_outschema_dict, merge_schema_dicts
 
 PACKAGE_DIRECTORY = Path(__file__).parent.resolve()
 
+SCHEMA_CACHE_ENV_VARIABLE = 'MASCI_TOOLS_SCHEMA_CACHE'
+"""Name of the environment variable to set the location of the persistent schema dictionary cache"""
+
+SCHEMA_DICT_CACHE_SIZE = 16
+"""Default maximum number of schema dictionaries kept in memory for each class"""
+
 EMPTY_TAG_INFO: TagInfo = {
     'name': None,  #type: ignore[typeddict-item]
     'attribs': CaseInsensitiveFrozenSet(),
@@ -210,6 +221,152 @@ def _get_latest_available_version(output_schema: bool) -> str:
     return max(versions, key=convert_str_version_number)
 
 
+def get_schema_cache_directory() -> Path | None:
+    """
+    Get the directory used for the persistent (on-disk) cache of the schema dictionaries
+
+    The location can be changed by setting the environment variable ``MASCI_TOOLS_SCHEMA_CACHE``.
+    If it is set to an empty string the on-disk cache is disabled. By default
+    ``$XDG_CACHE_HOME/masci-tools/schema_dicts`` (or ``~/.cache/masci-tools/schema_dicts``) is used
+
+    :returns: path to the cache directory or None if the cache is disabled
+    """
+    cache_dir = os.environ.get(SCHEMA_CACHE_ENV_VARIABLE)
+    if cache_dir is None:
+        cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        return Path(cache_home) / 'masci-tools' / 'schema_dicts'
+    if not cache_dir:
+        return None
+    return Path(cache_dir)
+
+
+def _hash_files(*paths: os.PathLike | str) -> str:
+    """
+    Compute a hash of the content of the given files
+
+    :param paths: paths of the files to hash
+
+    :returns: hex digest of the sha256 hash over the content of all files
+    """
+    sha = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as file:
+            sha.update(file.read())
+    return sha.hexdigest()
+
+
+class SchemaDictCache:
+    """
+    Thread-safe in-memory LRU cache for the schema dictionaries created by the ``fromVersion``
+    methods. Each entry is only built once, i.e. if multiple threads request the same missing
+    entry at the same time, one thread builds it and the others wait for the result.
+    If more than ``maxsize`` entries are stored, the least recently used ones are removed
+
+    :param maxsize: maximum number of stored entries (None means unbounded)
+    """
+
+    def __init__(self, maxsize: int | None = SCHEMA_DICT_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: dict[Any, threading.Lock] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'builds': 0, 'evictions': 0, 'build_time': 0.0}
+
+    def get_or_build(self, key: Any, build: Callable[[], Any], rebuild: bool = False) -> Any:
+        """
+        Get the entry for the given key. If it is not in the cache it is created
+        with the given function and stored
+
+        :param key: key of the entry
+        :param build: function creating the entry
+        :param rebuild: bool, if True the entry is always created again and replaces the stored one
+
+        :returns: the cached or newly created entry
+        """
+        with self._lock:
+            if key in self._entries and not rebuild:
+                self._stats['hits'] += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self._lock:
+                if key in self._entries and not rebuild:
+                    #Was built by another thread in the meantime
+                    self._stats['hits'] += 1
+                    self._entries.move_to_end(key)
+                    return self._entries[key]
+                self._stats['misses'] += 1
+
+            start = time.perf_counter()
+            try:
+                value = build()
+            except BaseException:
+                with self._lock:
+                    self._build_locks.pop(key, None)
+                raise
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self._stats['builds'] += 1
+                self._stats['build_time'] += elapsed
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                self._evict()
+                self._build_locks.pop(key, None)
+        return value
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used entries until the size limit is satisfied
+        (The lock has to be held by the caller)
+        """
+        while self._maxsize is not None and len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    @property
+    def maxsize(self) -> int | None:
+        """
+        Maximum number of stored entries. Reducing it removes
+        the least recently used entries immediately
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int | None) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Remove all stored entries. The statistics are kept
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def info(self) -> dict[str, Any]:
+        """
+        Statistics of the cache for monitoring
+
+        :returns: dict with the number of ``hits``, ``misses``, ``builds`` and ``evictions``,
+                  the total time spent building entries in seconds (``build_time``), the
+                  current number of entries (``size``), the ``maxsize`` and the stored ``keys``
+        """
+        with self._lock:
+            return {**self._stats, 'size': len(self._entries), 'maxsize': self._maxsize, 'keys': list(self._entries)}
+
+
 def _add_condition(specification: str | Iterable[str] | None, condition: str) -> set[str]:
     """Add element to specification making it into a set if necessary"""
 
@@ -228,21 +385,25 @@ def _add_condition(specification: str | Iterable[str] | None, condition: str) ->
 class SchemaDict(LockableDict):
     """
     Base class for schema dictionaries. Is  locked on initialization with :py:meth:`~masci_tools.util.lockable_containers.LockableDict.freeze()`.
-    Holds a reference to the xmlSchema for validating files.
+    Holds a reference to the xmlSchema for validating files and a cache for the
+    path selections performed in :py:mod:`~masci_tools.util.schema_dict_util`.
 
     Also provides interfaces for utility functions
 
     :param xmlschema: etree.XMLSchema object for validating files
+    :param xmlschema_doc: optional parsed XML schema document the xmlschema was created from.
+                          Enables validating only modified parts of a file (see :py:meth:`validate()`)
 
     All other arguments are passed on to :py:class:`~masci_tools.util.lockable_containers.LockableDict`
 
     """
-    _schema_dict_cache: dict[Any, SchemaDict] = {}
+    _schema_dict_cache: SchemaDictCache = SchemaDictCache()
     _tag_entries: tuple[str, ...] = ()
     _attrib_entries: tuple[str, ...] = ()
     _info_entries: tuple[str, ...] = ()
 
     _VALIDATION_ERROR_HEADER: str = 'File does not validate'
+    _PATH_QUERY_CACHE_SIZE: int = 4096
 
     @classmethod
     def clear_cache(cls) -> None:
@@ -251,10 +412,110 @@ class SchemaDict(LockableDict):
         """
         cls._schema_dict_cache.clear()
 
-    def __init__(self, *args: Any, xmlschema: etree.XMLSchema | None = None, **kwargs: Any):
+    @classmethod
+    def cache_info(cls) -> dict[str, Any]:
+        """
+        Statistics of the in-memory schema dictionary cache of this class
+        (see :py:meth:`SchemaDictCache.info()`)
+        """
+        return cls._schema_dict_cache.info()
+
+    @classmethod
+    def set_cache_size(cls, maxsize: int | None) -> None:
+        """
+        Set the maximum number of schema dictionaries kept in memory for this class
+
+        :param maxsize: maximum number of entries (None means unbounded)
+        """
+        cls._schema_dict_cache.maxsize = maxsize
+
+    @classmethod
+    def _disk_cache_file(cls, file_hash: str) -> Path | None:
+        """
+        Get the path of the file in the on-disk cache for the given schema file hash
+
+        :param file_hash: hash of the schema file(s) the dictionary is created from
+
+        :returns: path to the cache file or None if the on-disk cache is disabled
+        """
+        cache_dir = get_schema_cache_directory()
+        if cache_dir is None:
+            return None
+        version = getattr(cls, '__version__', '')
+        return cache_dir / f'{cls.__name__}-{version}-{file_hash}.pickle'
+
+    @classmethod
+    def _load_from_disk_cache(cls, file_hash: str) -> dict[str, Any] | None:
+        """
+        Load the content of a schema dictionary from the on-disk cache
+
+        :param file_hash: hash of the schema file(s) the dictionary is created from
+
+        :returns: the stored content of the schema dictionary or None if no valid entry exists
+        """
+        cache_file = cls._disk_cache_file(file_hash)
+        if cache_file is None or not cache_file.is_file():
+            return None
+
+        try:
+            with open(cache_file, 'rb') as file:
+                content = pickle.load(file)
+        except Exception:  #pylint: disable=broad-except
+            #Corrupted or incompatible cache entries are just rebuilt
+            return None
+
+        if not isinstance(content, dict):
+            return None
+        if content.get('version') != getattr(cls, '__version__', '') or content.get('hash') != file_hash:
+            return None
+        return content['data']
+
+    @classmethod
+    def _store_in_disk_cache(cls, file_hash: str, data: dict[str, Any]) -> None:
+        """
+        Store the content of a schema dictionary in the on-disk cache. Failures
+        to write the file are ignored
+
+        :param file_hash: hash of the schema file(s) the dictionary is created from
+        :param data: content of the schema dictionary
+        """
+        cache_file = cls._disk_cache_file(file_hash)
+        if cache_file is None:
+            return
+
+        content = {'version': getattr(cls, '__version__', ''), 'hash': file_hash, 'data': data}
+        temp_file = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            #Write to a temporary file first and move it into place to avoid
+            #other processes reading incomplete files
+            with tempfile.NamedTemporaryFile('wb', dir=cache_file.parent, delete=False, suffix='.tmp') as file:
+                temp_file = file.name
+                pickle.dump(content, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+            temp_file = None
+        except (OSError, pickle.PicklingError, TypeError):  #TypeError is raised for objects that cannot be pickled
+            pass
+        finally:
+            if temp_file is not None:
+                try:
+                    os.unlink(temp_file)
+                except OSError:
+                    pass
+
+    def __init__(self,
+                 *args: Any,
+                 xmlschema: etree.XMLSchema | None = None,
+                 xmlschema_doc: etree._ElementTree | None = None,
+                 **kwargs: Any):
         if xmlschema is None:
             raise ValueError('xmlschema has to be supplied')
         self.xmlschema = xmlschema
+        self.xmlschema_doc = xmlschema_doc
+        self._section_schemas: dict[str, etree.XMLSchema | None] = {}
+        self.selection_cache: dict[Any, Any] = {}
+        self._path_index: dict[tuple[str, str], tuple[str, ...]] = {}
+        self._path_queries: dict[tuple[str, tuple[str, ...], frozenset[str], frozenset[str]], tuple[str, ...]] = {}
         super().__init__(*args, **kwargs)
         super().freeze()
 
@@ -267,6 +528,9 @@ class SchemaDict(LockableDict):
         Find all paths in the schema_dict in the given entries for the given name
         and matching the contains/not_contains criteria
 
+        The results are memoized (the schema dictionary is immutable), so that
+        repeated queries are answered without scanning the paths again
+
         :param name: str, name of the tag
         :param contains: str or list of str, this string has to be in the final path
         :param not_contains: str or list of str, this string has to NOT be in the final path
@@ -275,46 +539,61 @@ class SchemaDict(LockableDict):
         """
 
         if contains is None:
-            contains = set()
+            contains = frozenset()
         elif isinstance(contains, str):
-            contains = {contains}
+            contains = frozenset((contains,))
         else:
-            contains = set(contains)
+            contains = frozenset(contains)
 
         if not_contains is None:
-            not_contains = set()
+            not_contains = frozenset()
         elif isinstance(not_contains, str):
-            not_contains = {not_contains}
+            not_contains = frozenset((not_contains,))
         else:
-            not_contains = set(not_contains)
+            not_contains = frozenset(not_contains)
 
-        path_list = []
-        for entry in entries:
-            if name in self[entry]:
-                entry_paths = self[entry][name]
-
-                if not isinstance(entry_paths, LockableList):
-                    entry_paths = [entry_paths]
-                else:
-                    entry_paths = entry_paths.get_unlocked()
-
-                invalid_paths = set()
-                for phrase in contains:
-                    for xpath in entry_paths:
-                        if phrase not in xpath:
-                            invalid_paths.add(xpath)
+        entries = tuple(entries)
+        key = (name, entries, contains, not_contains)
+        try:
+            path_list = self._path_queries.pop(key)
+        except KeyError:
+            path_list = tuple(
+                xpath for entry in entries for xpath in self._indexed_paths(entry, name)
+                if all(phrase in xpath for phrase in contains) and not any(phrase in xpath for phrase in not_contains))
+            if len(self._path_queries) >= self._PATH_QUERY_CACHE_SIZE:
+                self._path_queries.pop(next(iter(self._path_queries)), None)
+        #Reinserting the entry marks it as most recently used
+        self._path_queries[key] = path_list
+
+        return list(path_list)
+
+    def _indexed_paths(self, entry: str, name: str) -> tuple[str, ...]:
+        """
+        Get all paths for the given name in the given entry of the schema dictionary.
+        The paths are stored in an index, to avoid repeated lookups in the
+        case-insensitive dictionaries and copies of the locked lists
 
-                for phrase in not_contains:
-                    for xpath in entry_paths:
-                        if phrase in xpath:
-                            invalid_paths.add(xpath)
+        :param entry: str of the entry in the schema dictionary
+        :param name: str, name of the tag or attribute
 
-                for invalid in invalid_paths:
-                    entry_paths.remove(invalid)
+        :returns: tuple of the paths for the name
+        """
+        key = (entry, name)
+        try:
+            return self._path_index[key]
+        except KeyError:
+            pass
 
-                path_list += entry_paths
+        paths: tuple[str, ...] = ()
+        if name in self[entry]:
+            entry_paths = self[entry][name]
+            if isinstance(entry_paths, LockableList):
+                paths = tuple(entry_paths)
+            else:
+                paths = (entry_paths,)
 
-        return path_list
+        self._path_index[key] = paths
+        return paths
 
     def tag_xpath(self,
                   name: str,
@@ -566,31 +845,108 @@ class SchemaDict(LockableDict):
 
         return tag_info
 
-    def validate(self, xmltree: etree._ElementTree, logger: Logger | None = None, header: str = '') -> None:
+    def _section_schema(self, name: str) -> etree.XMLSchema | None:
+        """
+        Get the XML schema for validating a single direct child of the root element
+        with the given name on its own. The schema is created by replacing the declaration
+        of the root element with the declaration of the child element
+
+        :param name: name of the child element of the root
+
+        :returns: etree.XMLSchema or None if no such schema can be created
+        """
+        if name in self._section_schemas:
+            return self._section_schemas[name]
+
+        schema = None
+        if self.xmlschema_doc is not None:
+            schema_doc = copy.deepcopy(self.xmlschema_doc)
+            namespaces = {'xsd': 'http://www.w3.org/2001/XMLSchema'}
+            root_decl = schema_doc.xpath('/xsd:schema/xsd:element', namespaces=namespaces)
+            if len(root_decl) == 1:
+                section_decl = schema_doc.xpath('/xsd:schema/xsd:complexType[@name=$type]/*/xsd:element[@name=$name]',
+                                                namespaces=namespaces,
+                                                type=root_decl[0].get('type', ''),
+                                                name=name)
+                if len(section_decl) == 1:
+                    section_decl = copy.deepcopy(section_decl[0])
+                    section_decl.attrib.pop('minOccurs', None)
+                    section_decl.attrib.pop('maxOccurs', None)
+                    root_decl[0].getparent().replace(root_decl[0], section_decl)
+                    try:
+                        schema = etree.XMLSchema(schema_doc)
+                    except etree.XMLSchemaParseError:
+                        schema = None
+
+        self._section_schemas[name] = schema
+        return schema
+
+    def _modified_sections(self, xmltree: etree._ElementTree,
+                           modified_elements: Iterable[etree._Element]) -> list[etree._Element] | None:
+        """
+        Determine the direct children of the root element containing the given modified elements
+
+        :param xmltree: XML tree to validate
+        :param modified_elements: elements modified in the XML tree
+
+        :returns: list of the modified children of the root or None if these cannot be validated
+                  on their own, i.e. the root itself was modified or one of the elements
+                  is not contained in the tree (anymore)
+        """
+        if requires_clearing(xmltree):
+            return None
+
+        root = xmltree.getroot()
+        sections: dict[etree._Element, None] = {}
+        for node in modified_elements:
+            if node is root:
+                return None
+            parent = node.getparent()
+            while parent is not None and parent is not root:
+                node, parent = parent, parent.getparent()
+            if parent is None or not isinstance(node.tag, str) or self._section_schema(node.tag) is None:
+                return None
+            sections[node] = None
+        return list(sections)
+
+    def validate(self,
+                 xmltree: etree._ElementTree,
+                 logger: Logger | None = None,
+                 header: str = '',
+                 modified_elements: Iterable[etree._Element] | None = None) -> None:
         """
         Validate the given XML tree against the schema
 
+        If the modified elements are given (e.g. recorded with
+        :py:func:`~masci_tools.util.xml.xml_setters_basic.track_modifications()`), only the direct children
+        of the root element containing these are validated, assuming that the tree was valid before the modifications.
+        If this is not possible, e.g. the root element itself was modified, the complete tree is validated
+
         :param xmltree: XML tree to validate
         :param logger: Logger to relay evlt warnings/errors
+        :param header: str to lead a evtl error message with
+        :param modified_elements: optional iterable of the elements modified since the last validation
         """
         header = header or self._VALIDATION_ERROR_HEADER
-        errmsg = ''
-        xmltree, _ = clear_xml(xmltree)
+
+        sections = None
+        if modified_elements is not None:
+            sections = self._modified_sections(xmltree, modified_elements)
+
         try:
-            validate_xml(xmltree, self.xmlschema, error_header=header)
+            if sections is None:
+                validate_xml(xmltree, self.xmlschema, error_header=header)
+            else:
+                for section in sections:
+                    validate_xml(etree.ElementTree(section),
+                                 cast(etree.XMLSchema, self._section_schema(section.tag)),
+                                 error_header=header)
         except etree.DocumentInvalid as err:
             errmsg = str(err)
             if logger is not None:
                 logger.warning(errmsg)
             raise ValueError(errmsg) from err
 
-        #TODO: Is this an esoteric case that will never happen or is this something we really need?
-        if not self.xmlschema.validate(xmltree) and errmsg == '':
-            errmsg = f'{header}: Reason is unknown'
-            if logger is not None:
-                logger.warning(errmsg)
-            raise ValueError(errmsg)
-
 
 class InputSchemaDict(SchemaDict):
     """
@@ -620,7 +976,7 @@ class InputSchemaDict(SchemaDict):
     """
     __version__ = '0.2.0'
 
-    _schema_dict_cache: dict[str, InputSchemaDict] = {}  #type:ignore
+    _schema_dict_cache = SchemaDictCache()
     _tag_entries = ('tag_paths',)
     _attrib_entries = (
         'unique_attribs',
@@ -660,26 +1016,48 @@ class InputSchemaDict(SchemaDict):
             version = latest_version
             schema_file_path = PACKAGE_DIRECTORY / version / 'FleurInputSchema.xsd'
 
-        if version in cls._schema_dict_cache and not no_cache:
-            return cls._schema_dict_cache[version]
+        return cls._schema_dict_cache.get_or_build(version,
+                                                   lambda: cls.fromPath(schema_file_path, use_disk_cache=not no_cache),
+                                                   rebuild=no_cache)
 
-        cls._schema_dict_cache[version] = cls.fromPath(schema_file_path)
+    @classmethod
+    def warmup(cls, versions: Iterable[str] | None = None) -> None:
+        """
+        Create the schema dictionaries for the given versions, so that they
+        are available from the cache of :py:meth:`fromVersion()`
 
-        return cls._schema_dict_cache[version]
+        :param versions: iterable of the input versions (by default all available versions)
+        """
+        if versions is None:
+            versions = list_available_versions(output_schema=False)
+        for version in versions:
+            cls.fromVersion(version)
 
     @classmethod
-    def fromPath(cls, path: os.PathLike) -> InputSchemaDict:
+    def fromPath(cls, path: os.PathLike, use_disk_cache: bool = False) -> InputSchemaDict:
         """
         load the FleurInputSchema dict for the specified FleurInputSchema file
 
         :param path: path to the input schema file
+        :param use_disk_cache: bool, if True the persistent cache (see :py:func:`get_schema_cache_directory()`)
+                               is used to avoid recreating the dictionary. Entries are identified
+                               by the hash of the schema file
 
         :return: InputSchemaDict object with the information for the provided file
         """
-        schema_dict = create_inpschema_dict(path)
-        xmlschema = etree.XMLSchema(file=path)
+        schema_dict = None
+        if use_disk_cache:
+            file_hash = _hash_files(path)
+            schema_dict = cls._load_from_disk_cache(file_hash)
 
-        return cls(schema_dict, xmlschema=xmlschema)
+        if schema_dict is None:
+            schema_dict = create_inpschema_dict(path)
+            if use_disk_cache:
+                cls._store_in_disk_cache(file_hash, schema_dict)
+        xmlschema_doc = etree.parse(os.fspath(path))
+        xmlschema = etree.XMLSchema(xmlschema_doc)
+
+        return cls(schema_dict, xmlschema=xmlschema, xmlschema_doc=xmlschema_doc)
 
     @property
     def inp_version(self) -> tuple[int, int]:
@@ -738,7 +1116,7 @@ class OutputSchemaDict(SchemaDict):
 
     __version__ = '0.2.0'
 
-    _schema_dict_cache: dict[tuple[str, str], OutputSchemaDict] = {}  #type:ignore
+    _schema_dict_cache = SchemaDictCache()
     _tag_entries = (
         'tag_paths',
         'iteration_tag_paths',
@@ -807,31 +1185,53 @@ class OutputSchemaDict(SchemaDict):
             logger.info('Creating OutputSchemaDict object for differing versions (out: %s; inp: %s)', version,
                         inp_version)
 
-        if (version, inp_version) in cls._schema_dict_cache and not no_cache:
-            return cls._schema_dict_cache[(version, inp_version)]
+        def build() -> OutputSchemaDict:
+            #Check for known incompatibilities
+            if int(version.split('.')[1]) >= 35 and int(inp_version.split('.')[1]) <= 32:
+                raise IncompatibleSchemaVersions('Output schemas starting from version 0.35 cannot be compiled '
+                                                 'to a XML schema with Input schemas before version 0.33')
 
-        #Check for known incompatibilities
-        if int(version.split('.')[1]) >= 35 and int(inp_version.split('.')[1]) <= 32:
-            raise IncompatibleSchemaVersions('Output schemas starting from version 0.35 cannot be compiled '
-                                             'to a XML schema with Input schemas before version 0.33')
+            inpschema_dict = InputSchemaDict.fromVersion(inp_version, no_cache=no_cache)
+            return cls.fromPath(schema_file_path,
+                                inp_path=inpschema_file_path,
+                                inpschema_dict=inpschema_dict,
+                                use_disk_cache=not no_cache)
 
-        inpschema_dict = InputSchemaDict.fromVersion(inp_version, no_cache=no_cache)
-        cls._schema_dict_cache[(version, inp_version)] = cls.fromPath(schema_file_path,
-                                                                      inp_path=inpschema_file_path,
-                                                                      inpschema_dict=inpschema_dict)
+        return cls._schema_dict_cache.get_or_build((version, inp_version), build, rebuild=no_cache)
 
-        return cls._schema_dict_cache[(version, inp_version)]
+    @classmethod
+    def warmup(cls, versions: Iterable[str | tuple[str, str]] | None = None) -> None:
+        """
+        Create the schema dictionaries for the given versions, so that they
+        are available from the cache of :py:meth:`fromVersion()`
+
+        :param versions: iterable of the output versions or tuples of output and input versions
+                         (by default all available output versions with the same input version)
+        """
+        if versions is None:
+            versions = list_available_versions(output_schema=True)
+        for version in versions:
+            if isinstance(version, tuple):
+                cls.fromVersion(*version)
+            else:
+                cls.fromVersion(version)
 
     @classmethod
     def fromPath(cls,
                  path: os.PathLike,
                  inp_path: os.PathLike | None = None,
-                 inpschema_dict: InputSchemaDict | None = None) -> OutputSchemaDict:
+                 inpschema_dict: InputSchemaDict | None = None,
+                 use_disk_cache: bool = False) -> OutputSchemaDict:
         """
         load the FleurOutputSchema dict for the specified paths
 
         :param path: path to the FleurOutputSchema file
         :param inp_path: path to the FleurInputSchema file (defaults to same folder as path)
+        :param inpschema_dict: InputSchemaDict for the input schema file. If not given it is loaded from the
+                               given input schema path
+        :param use_disk_cache: bool, if True the persistent cache (see :py:func:`get_schema_cache_directory()`)
+                               is used to avoid recreating the dictionary. Entries are identified
+                               by the hash of both schema files
 
         :return: OutputSchemaDict object with the information for the provided files
         """
@@ -839,12 +1239,20 @@ class OutputSchemaDict(SchemaDict):
         if inp_path is None:
             inp_path = Path(path).parent / 'FleurInputSchema.xsd'
 
-        if inpschema_dict is None:
-            inpschema_dict = create_inpschema_dict(inp_path)  #type:ignore
-        inpschema_data = cast(InputSchemaData, inpschema_dict)
+        schema_dict = None
+        if use_disk_cache:
+            file_hash = _hash_files(path, inp_path)
+            schema_dict = cls._load_from_disk_cache(file_hash)
+
+        if schema_dict is None:
+            if inpschema_dict is None:
+                inpschema_dict = InputSchemaDict.fromPath(inp_path, use_disk_cache=use_disk_cache)
+            inpschema_data = cast(InputSchemaData, inpschema_dict)
 
-        schema_dict = create_outschema_dict(path, inpschema_dict=inpschema_data)
-        schema_dict = merge_schema_dicts(inpschema_data, schema_dict)
+            schema_dict = create_outschema_dict(path, inpschema_dict=inpschema_data)
+            schema_dict = merge_schema_dicts(inpschema_data, schema_dict)
+            if use_disk_cache:
+                cls._store_in_disk_cache(file_hash, schema_dict)
 
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
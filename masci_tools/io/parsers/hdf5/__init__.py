@@ -4,6 +4,7 @@ This is needed to make the HDF5Reader aware of their existence
 """
 
 from .reader import HDF5Reader
+from .lazy import LazyDataset
 from .transforms import HDF5TransformationError
 
-__all__ = ['HDF5Reader', 'HDF5TransformationError']
+__all__ = ['HDF5Reader', 'HDF5TransformationError', 'LazyDataset']
@@ -0,0 +1,288 @@
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-1/PGI-1, Germany.         #
+#                All rights reserved.                                         #
+# This file is part of the Masci-tools package.                               #
+# (Material science tools)                                                    #
+#                                                                             #
+# The code is hosted on GitHub at https://github.com/judftteam/masci-tools.   #
+# For further information on the license, see the LICENSE.txt file.           #
+# For further information please visit http://judft.de/.                      #
+#                                                                             #
+###############################################################################
+"""
+This module contains the :py:class:`LazyDataset` class used by the
+:py:class:`~masci_tools.io.parsers.hdf5.reader.HDF5Reader` for deferred reading of datasets
+"""
+from __future__ import annotations
+
+from functools import partial
+import operator
+from typing import Any, Callable, Iterator
+import h5py
+import numpy as np
+
+
+def _indexed_shape(shape: tuple[int, ...], key: Any) -> tuple[int, ...]:
+    """
+    Determine the shape after indexing an array of the given shape with the key
+    without allocating the array
+    """
+    dummy = np.lib.stride_tricks.as_strided(np.zeros(1), shape=shape, strides=(0,) * len(shape))
+    return dummy[key].shape
+
+
+def _known_shape(dataset: Any) -> tuple[int, ...] | None:
+    """
+    Get the shape of the dataset without reading in any lazy data (None if it is not known)
+    """
+    if isinstance(dataset, LazyDataset):
+        return dataset._shape  #pylint: disable=protected-access
+    return np.shape(dataset)
+
+
+def _evaluate(func: Callable[..., Any], datasets: tuple[Any, ...]) -> Any:
+    """
+    Load all the given datasets and call the function with them
+    """
+    return func(*(np.asarray(dset) for dset in datasets))
+
+
+def _sum_arrays(*arrays: np.ndarray) -> np.ndarray:
+    """
+    Sum the given arrays
+    """
+    return np.sum(arrays, axis=0)
+
+
+def _reversed_operation(op: Callable[[Any, Any], Any], left: Any, right: Any) -> Any:
+    """
+    Call the binary operation with swapped arguments
+    """
+    return op(right, left)
+
+
+class LazyDataset:
+    """
+    Deferred view of (a part of) a dataset in a hdf5 file. Nothing is read from the file
+    until the data is accessed via :py:meth:`load()` or converted to a numpy array (e.g. ``np.asarray``)
+
+    Index operations are pushed down to the read of the h5py.Dataset (only the selected hyperslab is read),
+    as long as only elementwise operations with scalars were applied before. All other
+    operations are recorded and executed after the data is read
+
+    :param source: h5py.Dataset or callable returning the data
+    :param index: tuple of the index operations to apply when reading the data
+    :param operations: tuple of callables to apply to the data after reading
+    :param elementwise: bool if True all operations are elementwise, i.e. index operations can be applied before them
+    :param shape: shape of the data if it is known without reading it
+    :param inputs: optional tuple of the function and datasets for data computed elementwise from
+                   multiple datasets of the same shape (index operations are applied to the inputs)
+
+    .. note::
+        The data can only be accessed while the underlying hdf file is still open
+    """
+
+    __array_priority__ = 1000  #Make sure that operations with numpy arrays/scalars are deferred
+
+    def __init__(self,
+                 source: h5py.Dataset | Callable[[], Any],
+                 index: tuple[Any, ...] = (),
+                 operations: tuple[Callable[[Any], Any], ...] = (),
+                 elementwise: bool = True,
+                 shape: tuple[int, ...] | None = None,
+                 inputs: tuple[Callable[..., Any], tuple[Any, ...]] | None = None) -> None:
+        self._source = source
+        self._inputs = inputs
+        self._index = index
+        self._operations = operations
+        self._elementwise = elementwise
+
+        if shape is None and isinstance(source, h5py.Dataset) and not operations:
+            shape = source.shape
+            for key in index:
+                shape = _indexed_shape(shape, key)
+        self._shape = shape
+
+    @classmethod
+    def combine(cls,
+                func: Callable[..., Any],
+                *datasets: Any,
+                shape: tuple[int, ...] | None = None,
+                elementwise: bool = False) -> LazyDataset:
+        """
+        Create a :py:class:`LazyDataset` deferring the call of the function with
+        the given datasets (which are loaded before calling the function)
+
+        :param func: function to call
+        :param datasets: arguments for the function
+        :param shape: shape of the result if it is known
+        :param elementwise: bool if True the function operates elementwise on the datasets,
+                            which all have the given shape. Index operations are then applied
+                            to the datasets before calling the function
+        """
+        inputs = None
+        if elementwise and shape is not None and all(_known_shape(dset) == shape for dset in datasets):
+            inputs = func, datasets
+        return cls(partial(_evaluate, func, datasets), shape=shape, inputs=inputs)
+
+    @classmethod
+    def sum_datasets(cls, datasets: list[Any]) -> LazyDataset:
+        """
+        Create a :py:class:`LazyDataset` for the sum of the given datasets
+
+        :param datasets: list of the datasets to sum
+        """
+        shapes = {_known_shape(dset) for dset in datasets}
+        shape = shapes.pop() if len(shapes) == 1 else None
+        return cls.combine(_sum_arrays, *datasets, shape=shape, elementwise=True)
+
+    def _apply(self,
+               func: Callable[[Any], Any],
+               elementwise: bool = False,
+               shape: tuple[int, ...] | None = None) -> LazyDataset:
+        """
+        Return a new :py:class:`LazyDataset` with the given operation added
+        """
+        return LazyDataset(self._source,
+                           index=self._index,
+                           operations=(*self._operations, func),
+                           elementwise=self._elementwise and elementwise,
+                           shape=shape)
+
+    def load(self) -> Any:
+        """
+        Read the data from the file and apply all recorded operations
+
+        :returns: the resulting data (normally a numpy array)
+        """
+        index = self._index
+        if isinstance(self._source, h5py.Dataset):
+            if not self._source.id.valid:
+                raise ValueError('Cannot load LazyDataset: The hdf file was already closed')
+            if index:
+                data = self._source[index[0]]
+                index = index[1:]
+            else:
+                data = self._source[()]
+        else:
+            data = self._source()
+
+        for key in index:
+            data = data[key]
+        for func in self._operations:
+            data = func(data)
+        return data
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:  #pylint: disable=unused-argument
+        return np.asarray(self.load(), dtype=dtype)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """
+        Shape of the data. If it cannot be determined without reading in the data,
+        the data is loaded
+        """
+        if self._shape is None:
+            return np.shape(self.load())
+        return self._shape
+
+    @property
+    def ndim(self) -> int:
+        """
+        Number of dimensions of the data
+        """
+        return len(self.shape)
+
+    def __len__(self) -> int:
+        if not self.shape:
+            raise TypeError('len() of unsized LazyDataset')
+        return self.shape[0]
+
+    def __iter__(self) -> Iterator[LazyDataset]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, key: Any) -> LazyDataset:
+        shape = None
+        if self._shape is not None:
+            shape = _indexed_shape(self._shape, key)
+
+        if self._inputs is not None and not self._index and not self._operations:
+            func, datasets = self._inputs
+            return LazyDataset.combine(func, *(dset[key] for dset in datasets), shape=shape, elementwise=True)
+        if self._elementwise:
+            return LazyDataset(self._source,
+                               index=(*self._index, key),
+                               operations=self._operations,
+                               elementwise=True,
+                               shape=shape)
+        return self._apply(partial(_reversed_operation, operator.getitem, key), shape=shape)
+
+    def _binary_operation(self, other: Any, op: Callable[[Any, Any], Any], reverse: bool = False) -> LazyDataset:
+        """
+        Record a binary operation with the given other operand
+        """
+        if isinstance(other, LazyDataset):
+            shape = None
+            if self._shape is not None and other._shape is not None:
+                shape = np.broadcast_shapes(self._shape, other._shape)
+            if reverse:
+                return LazyDataset.combine(op, other, self, shape=shape, elementwise=True)
+            return LazyDataset.combine(op, self, other, shape=shape, elementwise=True)
+
+        elementwise = np.ndim(other) == 0
+        shape = None
+        if self._shape is not None:
+            shape = np.broadcast_shapes(self._shape, np.shape(other))
+        if reverse:
+            return self._apply(partial(op, other), elementwise=elementwise, shape=shape)
+        return self._apply(partial(_reversed_operation, op, other), elementwise=elementwise, shape=shape)
+
+    def __add__(self, other: Any) -> LazyDataset:
+        return self._binary_operation(other, operator.add)
+
+    def __radd__(self, other: Any) -> LazyDataset:
+        return self._binary_operation(other, operator.add, reverse=True)
+
+    def __sub__(self, other: Any) -> LazyDataset:
+        return self._binary_operation(other, operator.sub)
+
+    def __rsub__(self, other: Any) -> LazyDataset:
+        return self._binary_operation(other, operator.sub, reverse=True)
+
+    def __mul__(self, other: Any) -> LazyDataset:
+        return self._binary_operation(other, operator.mul)
+
+    def __rmul__(self, other: Any) -> LazyDataset:
+        return self._binary_operation(other, operator.mul, reverse=True)
+
+    def __truediv__(self, other: Any) -> LazyDataset:
+        return self._binary_operation(other, operator.truediv)
+
+    def __rtruediv__(self, other: Any) -> LazyDataset:
+        return self._binary_operation(other, operator.truediv, reverse=True)
+
+    def __neg__(self) -> LazyDataset:
+        return self._apply(operator.neg, elementwise=True, shape=self._shape)
+
+    def flatten(self, order: str = 'C') -> LazyDataset:
+        """
+        Deferred version of `numpy.ndarray.flatten`
+        """
+        shape = None
+        if self._shape is not None:
+            shape = (int(np.prod(self._shape)),)
+        return self._apply(partial(np.ravel, order=order), shape=shape)
+
+    def dot(self, matrix: Any) -> LazyDataset:
+        """
+        Deferred version of `numpy.ndarray.dot`
+        """
+        shape = None
+        if self._shape is not None:
+            shape = (*self._shape[:-1], *np.shape(matrix)[1:])
+        return self._apply(partial(_reversed_operation, np.dot, matrix), shape=shape)
+
+    def __repr__(self) -> str:
+        source = self._source.name if isinstance(self._source, h5py.Dataset) else 'computed'
+        return f'<LazyDataset {source} shape={self._shape}>'
@@ -24,6 +24,7 @@ import logging
 from pathlib import Path
 from typing import IO, Callable, NamedTuple, Any, cast
 from masci_tools.util.typing import FileLike
+from .lazy import LazyDataset
 try:
     from typing import TypedDict
 except ImportError:
@@ -68,11 +69,18 @@ logger = logging.getLogger(__name__)
 class HDF5Reader:
     """Class for reading in data from hdf5 files using a specified recipe
 
-    :param file: filepath to hdf file or opened file handle (mode 'rb')
+    :param file: filepath to hdf file, opened file handle (mode 'rb') or opened h5py.File
+                 (already opened h5py.File objects are not closed by the reader)
     :param move_to_memory: bool if True after reading and transforming the data
                            all leftover h5py.Datasets are moved into np.arrays
     :param filename: Name of the file. Only used for logging. If not given and the file
                      provides the information extract it from there
+    :param lazy: bool if True the entries in the datasets section of the recipe are not read
+                 into memory. Instead :py:class:`~masci_tools.io.parsers.hdf5.lazy.LazyDataset`
+                 objects are returned, which read the data only when accessed. Transformations
+                 supporting this mode are recorded and executed on access, index operations are
+                 pushed down to the reads of the hdf5 datasets. The data can only be accessed
+                 while the file is open
 
     The recipe is passed to the :py:meth:`HDF5Reader.read()` method and consists
     of a dict specifying which attributes and datasets to read in and how to transform them
@@ -95,12 +103,28 @@ class HDF5Reader:
             data, attributes = h5reader.read(recipe=recipes.FleurBands)
         print(data, attributes)
 
+    For large files the datasets can be read lazily. Only the
+    entries that are accessed are read from the file:
+
+    .. code-block:: python
+
+        import numpy as np
+
+        with HDF5Reader('/path/to/hdf/banddos.hdf', lazy=True) as h5reader:
+            data, attributes = h5reader.read(recipe=recipes.FleurBands)
+            weight = np.asarray(data['MT:1d_up'])
+
     """
 
     _transforms: dict[str, Callable[[Any], Any]] = {}
     _attribute_transforms: set[str] = set()
+    _lazy_transforms: set[str] = set()
 
-    def __init__(self, file: FileLike, move_to_memory: bool = True, filename: str = 'UNKNOWN') -> None:
+    def __init__(self,
+                 file: FileLike | h5py.File,
+                 move_to_memory: bool = True,
+                 filename: str = 'UNKNOWN',
+                 lazy: bool = False) -> None:
 
         self._original_file = file
         self.file: h5py.File = None
@@ -119,10 +143,16 @@ class HDF5Reader:
         logger.info('Instantiated %s with file %s', self.__class__.__name__, self.filename)
 
         self._move_to_memory = move_to_memory
+        self._lazy = lazy
 
     def __enter__(self) -> HDF5Reader:
 
         file = self._original_file
+        if isinstance(file, h5py.File):
+            #Already opened files are used as they are and are not closed in __exit__
+            self.file = file
+            return self
+
         if getattr(file, 'seek', None) is not None:
             #This check catches a special case resulting from
             #the AiiDA v2 file repository. The h5py.File constructor
@@ -151,7 +181,8 @@ class HDF5Reader:
 
     def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None,
                  exc_traceback: TracebackType | None) -> None:
-        self.file.close()
+        if self.file is not self._original_file:
+            self.file.close()
         if self._tempfile is not None:
             self._tempfile.close()
         logger.debug('Closed h5py.File with id %s', self.file.id)
@@ -213,6 +244,12 @@ class HDF5Reader:
         transformed_dset = dataset
         for spec in transforms:
 
+            if self._lazy and attributes is not None:
+                if spec.name in self._lazy_transforms:
+                    transformed_dset = self._make_lazy(transformed_dset)
+                else:
+                    transformed_dset = self._load_lazy(transformed_dset)
+
             args = spec.args
             if spec.name in self._attribute_transforms:
                 spec = cast(AttribTransformation, spec)
@@ -232,6 +269,38 @@ class HDF5Reader:
 
         return transformed_dset
 
+    @classmethod
+    def _make_lazy(cls, dataset: Any) -> Any:
+        """
+        Wrap all h5py.Datasets in the given dataset in
+        :py:class:`~masci_tools.io.parsers.hdf5.lazy.LazyDataset` objects
+
+        :param dataset: dataset to wrap
+
+        :returns: dataset with all h5py.Datasets replaced
+        """
+        if isinstance(dataset, dict):
+            return {key: cls._make_lazy(val) for key, val in dataset.items()}
+        if isinstance(dataset, h5py.Dataset):
+            return LazyDataset(dataset)
+        return dataset
+
+    @classmethod
+    def _load_lazy(cls, dataset: Any) -> Any:
+        """
+        Load all :py:class:`~masci_tools.io.parsers.hdf5.lazy.LazyDataset` objects
+        in the given dataset
+
+        :param dataset: dataset to load
+
+        :returns: dataset with all lazy datasets loaded
+        """
+        if isinstance(dataset, dict):
+            return {key: cls._load_lazy(val) for key, val in dataset.items()}
+        if isinstance(dataset, LazyDataset):
+            return dataset.load()
+        return dataset
+
     @staticmethod
     def _unpack_dataset(output_dict: dict[str, Any], dataset_name: str) -> dict[str, Any]:
         """
@@ -309,6 +378,10 @@ class HDF5Reader:
                     logger.exception(str(err))
                     raise
 
+        if self._lazy:
+            logger.debug('Wrapping remaining h5py.Datasets in LazyDataset')
+            output_data = self._make_lazy(output_data)
+
         if self._move_to_memory:
             logger.debug('Moving remaining h5py.Datasets to memory')
             try:
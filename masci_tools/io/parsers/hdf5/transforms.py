@@ -29,6 +29,7 @@ import numpy as np
 from functools import wraps
 from collections import defaultdict
 from .reader import HDF5Reader
+from .lazy import LazyDataset
 
 
 class HDF5TransformationError(Exception):
@@ -39,13 +40,16 @@ F = TypeVar('F', bound=Callable[..., Any])
 """Generic Callable type"""
 
 
-def hdf5_transformation(*, attribute_needed: bool) -> Callable[[F], F]:
+def hdf5_transformation(*, attribute_needed: bool, lazy: bool = False) -> Callable[[F], F]:
     """
     Decorator for registering a function as a transformation functions
     on the :py:class:`~masci_tools.io.parsers.hdf5.reader.HDF5Reader` class
 
     :param attribute_needed: bool if True this function takes a previously processed
                              attribute value and is therefore only available for the entries in datasets
+    :param lazy: bool if True this function can handle :py:class:`~masci_tools.io.parsers.hdf5.lazy.LazyDataset`
+                 objects without reading in the data. Otherwise these are loaded before
+                 the transformation is applied, if the reader is used with ``lazy=True``
     """
 
     def hdf5_transformation_decorator(func: F) -> F:
@@ -69,12 +73,15 @@ def hdf5_transformation(*, attribute_needed: bool) -> Callable[[F], F]:
         if attribute_needed:
             HDF5Reader._attribute_transforms.add(func.__name__)
 
+        if lazy:
+            HDF5Reader._lazy_transforms.add(func.__name__)
+
         return cast(F, transform_func)
 
     return hdf5_transformation_decorator
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def get_first_element(dataset):
     """
     Get the first element of the dataset.
@@ -86,7 +93,7 @@ def get_first_element(dataset):
     return index_dataset(dataset, 0)
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def index_dataset(dataset, index):
     """
     Get the n-th element of the dataset.
@@ -103,7 +110,7 @@ def index_dataset(dataset, index):
     return transformed
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def slice_dataset(dataset, slice_arg):
     """
     Slice the dataset with the given slice argument.
@@ -300,7 +307,7 @@ def stack_datasets(dataset, axis=0, sort_key=None):
     return np.stack([dataset[key] for key in keys], axis=axis)
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def shift_dataset(dataset, scalar_value, negative=False):
     """
     Shift the dataset by the given scalar_value
@@ -334,7 +341,7 @@ def shift_dataset(dataset, scalar_value, negative=False):
     return transformed
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def multiply_scalar(dataset, scalar_value):
     """
     Multiply the given dataset with a scalar_value
@@ -361,7 +368,7 @@ def multiply_scalar(dataset, scalar_value):
     return transformed
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def convert_to_complex_array(dataset):
     """
     Converts the given dataset of real numbers into
@@ -389,7 +396,7 @@ def convert_to_complex_array(dataset):
     return transformed
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def multiply_array(dataset, matrix, transpose=False):
     """
     Multiply the given dataset with a matrix
@@ -524,7 +531,7 @@ def move_to_memory(dataset):
     return transformed
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def flatten_array(dataset, order='C'):
     """
     Flattens the given dataset to one dimensional array.
@@ -553,7 +560,7 @@ def flatten_array(dataset, order='C'):
     return transformed
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def split_array(dataset, suffixes=None, name=None):
     """
     Split the arrays in a dataset into multiple entries
@@ -662,7 +669,7 @@ def periodic_elements(dataset):
     return transformed
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def sum_over_dict_entries(dataset, overwrite_dict=False, entries=None, dict_entry='sum', entry_format=None):
     """
     Sum the datasets contained in the given dict dataset
@@ -683,16 +690,22 @@ def sum_over_dict_entries(dataset, overwrite_dict=False, entries=None, dict_entr
     if entry_format is not None:
         entries = [entry_format(entry) for entry in entries]
 
+    selected = [entry for key, entry in dataset.items() if key in entries]
+    if any(isinstance(entry, LazyDataset) for entry in selected):
+        summed = LazyDataset.sum_datasets(selected)
+    else:
+        summed = np.sum(selected, axis=0)
+
     transformed = dataset
     if overwrite_dict:
-        transformed = np.sum([entry for key, entry in dataset.items() if key in entries], axis=0)
+        transformed = summed
     else:
-        transformed[dict_entry] = np.sum([entry for key, entry in dataset.items() if key in entries], axis=0)
+        transformed[dict_entry] = summed
 
     return transformed
 
 
-@hdf5_transformation(attribute_needed=False)
+@hdf5_transformation(attribute_needed=False, lazy=True)
 def add_partial_sums_fixed(dataset, patterns, replace_entries=None):
     """
     Add entries to the dataset dict (Only available for dict datasets) with sums
@@ -732,7 +745,7 @@ def add_partial_sums_fixed(dataset, patterns, replace_entries=None):
 #The transformation don't have access to all the attributes
 
 
-@hdf5_transformation(attribute_needed=True)
+@hdf5_transformation(attribute_needed=True, lazy=True)
 def multiply_by_attribute(dataset, attribute_value, transpose=False):
     """
     Multiply the given dataset with a previously parsed attribute, either scalar or matrix like
@@ -756,7 +769,7 @@ def multiply_by_attribute(dataset, attribute_value, transpose=False):
     return transformed
 
 
-@hdf5_transformation(attribute_needed=True)
+@hdf5_transformation(attribute_needed=True, lazy=True)
 def shift_by_attribute(dataset, attribute_value, negative=False):
     """
     Shift the dataset by the given value of the attribute
@@ -771,7 +784,7 @@ def shift_by_attribute(dataset, attribute_value, negative=False):
     return shift_dataset(dataset, attribute_value, negative=negative)
 
 
-@hdf5_transformation(attribute_needed=True)
+@hdf5_transformation(attribute_needed=True, lazy=True)
 def add_partial_sums(dataset, attribute_value, pattern_format, make_set=False, replace_format=None):
     """
     Add entries to the dataset dict (Only available for dict datasets) with sums
@@ -31,6 +31,68 @@ __version__ = '1.8.3'
 ####################################################################################
 
 
+class _CachedOutfile:
+    """
+    Wrapper around an output file (path or file handle), which reads the content only once.
+    It behaves like a file handle for :py:func:`~masci_tools.io.common_functions.get_outfile_txt()`,
+    i.e. `readlines()` returns a new list with the cached lines. The file is only read on the
+    first access, so that errors for missing files occur at the same place as without the cache
+    """
+
+    def __init__(self, outfile):
+        self._outfile = outfile
+        self._lines = None
+
+    def seek(self, offset, whence=0):  #pylint: disable=unused-argument
+        """
+        Nothing to do here since the content is cached
+        """
+
+    def readlines(self):
+        """
+        Return a copy of the lines in the file
+        """
+        if self._lines is None:
+            self._lines = get_outfile_txt(self._outfile)
+        return list(self._lines)
+
+
+def scan_outfile(outfile, searchstrings):
+    """
+    Collect all lines containing any of the given search strings in a single pass over the file
+
+    :param outfile: path or file handle of the file to scan
+    :param searchstrings: list of strings to search for
+
+    Returns: dict with the list of lines (in the order of the file) containing each search string
+    """
+    matches = {searchstring: [] for searchstring in searchstrings}
+    for line in get_outfile_txt(outfile):
+        for searchstring, lines in matches.items():
+            if searchstring in line:
+                lines.append(line)
+    return matches
+
+
+def _convert_lines_float(lines, splitinfo, replacepair=None):
+    """
+    Extract the float values from the given lines (see :py:func:`parse_array_float()` for
+    the meaning of the arguments)
+    """
+    res = []
+    for tmpval in lines:
+        if replacepair is not None:
+            tmpval = tmpval.replace(replacepair[0], replacepair[1])
+        if splitinfo[0] == 1:
+            tmpval = float(tmpval.split(splitinfo[1])[splitinfo[2]])
+        elif splitinfo[0] == 2:
+            tmpval = float(tmpval.split(splitinfo[1])[splitinfo[2]].split()[splitinfo[3]])
+        else:
+            raise ValueError('splitinfo[0] has to be either 1 or 2')
+        res.append(tmpval)
+    return array(res)
+
+
 def parse_array_float(outfile, searchstring, splitinfo, replacepair=None, debug=False):
     """
     Search for keyword `searchstring` in `outfile` and extract array of results
@@ -48,26 +110,10 @@ def parse_array_float(outfile, searchstring, splitinfo, replacepair=None, debug=
     Returns: array of results
 
     """
-    tmptxt = get_outfile_txt(outfile)
-    itmp = 0
-    res = []
-    while itmp >= 0:
-        itmp = search_string(searchstring, tmptxt)
-        if debug:
-            print(('in parse_array_float (itmp, searchstring, outfile):', itmp, searchstring, outfile))
-        if itmp >= 0:
-            tmpval = tmptxt.pop(itmp)
-            if replacepair is not None:
-                tmpval = tmpval.replace(replacepair[0], replacepair[1])
-            if splitinfo[0] == 1:
-                tmpval = float(tmpval.split(splitinfo[1])[splitinfo[2]])
-            elif splitinfo[0] == 2:
-                tmpval = float(tmpval.split(splitinfo[1])[splitinfo[2]].split()[splitinfo[3]])
-            else:
-                raise ValueError('splitinfo[0] has to be either 1 or 2')
-            res.append(tmpval)
-    res = array(res)
-    return res
+    lines = scan_outfile(outfile, [searchstring])[searchstring]
+    if debug:
+        print(('in parse_array_float (nlines, searchstring, outfile):', len(lines), searchstring, outfile))
+    return _convert_lines_float(lines, splitinfo, replacepair)
 
 
 def get_rms(outfile, outfile2, debug=False, is_imp_calc=False):
@@ -76,23 +122,26 @@ def get_rms(outfile, outfile2, debug=False, is_imp_calc=False):
     """
     if debug:
         print((outfile, outfile2))
-    rms_charge = parse_array_float(outfile, 'average rms-error', [2, '=', 1, 0], ['D', 'E'], debug=debug)
+    search_keys = ['average rms-error', '   v+ - v-']
+    if is_imp_calc:
+        search_keys.append('TOTAL RMS-ERROR for LDA+U:')
+    lines = scan_outfile(outfile, search_keys)
+    rms_charge = _convert_lines_float(lines['average rms-error'], [2, '=', 1, 0], ['D', 'E'])
     if debug:
         print(rms_charge)
     if is_imp_calc:
-        rms_ldau = parse_array_float(outfile, 'TOTAL RMS-ERROR for LDA+U:', [2, ':', 1, 0], debug=debug)
+        rms_ldau = _convert_lines_float(lines['TOTAL RMS-ERROR for LDA+U:'], [2, ':', 1, 0])
         if debug:
             print(rms_ldau)
-    rms_spin = parse_array_float(
-        outfile, '   v+ - v-', [1, '=', 1],
+    rms_spin = _convert_lines_float(
+        lines['   v+ - v-'], [1, '=', 1],
         ['D', 'E'])  # this should be in the line after 'average rms-error' but is only present if NSPIN==2
     if debug:
         print(rms_spin)
     rms_charge_atoms = parse_array_float(outfile2, 'rms-error for atom', [2, '=', 1, 0], ['D', 'E'])
     if debug:
         print(rms_charge_atoms)
-    rms_spin_atoms = parse_array_float(outfile2, 'rms-error for atom', [2, '=', 1, 0],
-                                       ['D', 'E'])  # only present for NSPIN==2
+    rms_spin_atoms = rms_charge_atoms.copy()  # only present for NSPIN==2
     if debug:
         print(rms_spin_atoms)
     niter = len(rms_charge)  # number of iterations
@@ -151,21 +200,12 @@ def get_Etot(outfile):
 
 def find_warnings(outfile):
     tmptxt = get_outfile_txt(outfile)
-    tmptxt_caps = [txt.upper() for txt in tmptxt]
-    itmp = 0
-    res = []
-    while itmp >= 0:
-        itmp = search_string('WARNING', tmptxt_caps)
-        if itmp >= 0:
-            tmpval = tmptxt_caps.pop(itmp)
-            tmpval = tmptxt.pop(itmp)
-            res.append(tmpval.strip())
+    res = [txt.strip() for txt in tmptxt if 'WARNING' in txt.upper()]
     return array(res)
 
 
 def extract_timings(outfile):
     tmptxt = get_outfile_txt(outfile)
-    itmp = 0
     res = []
     search_keys = [
         'main0',
@@ -178,27 +218,25 @@ def extract_timings(outfile):
         'main2',
         'Time in Iteration'
     ]
-    while itmp >= 0:
-        tmpvals = []
-        for isearch in search_keys:
-            itmp = search_string(isearch, tmptxt)
-            if itmp >= 0:
-                tmpval = [isearch, float(tmptxt.pop(itmp).split()[-1])]
-                tmpvals.append(tmpval)
-        if len(tmpvals) > 0:
-            res.append(tmpvals)
-    res = res[0]
+    # only the first occurrence of each timing is used
+    for isearch in search_keys:
+        itmp = search_string(isearch, tmptxt)
+        if itmp >= 0:
+            res.append([isearch, float(tmptxt.pop(itmp).split()[-1])])
+    if not res:
+        raise IndexError('No timings found')
     return dict(res)
 
 
 def get_charges_per_atom(outfile_000):
-    res1 = parse_array_float(outfile_000, 'charge in wigner seitz', [1, '=', 1])
+    lines = scan_outfile(outfile_000, ['charge in wigner seitz', 'nuclear charge', 'core charge'])
+    res1 = _convert_lines_float(lines['charge in wigner seitz'], [1, '=', 1])
     # these two are not in output of DOS calculation (and are then ignored)
-    res2 = parse_array_float(outfile_000, 'nuclear charge', [2, 'nuclear charge', 1, 0])
+    res2 = _convert_lines_float(lines['nuclear charge'], [2, 'nuclear charge', 1, 0])
     try:
-        res3 = parse_array_float(outfile_000, 'core charge', [1, '=', 1])
+        res3 = _convert_lines_float(lines['core charge'], [1, '=', 1])
     except IndexError:
-        res3 = parse_array_float(outfile_000, 'core charge', [1, ':', 1])
+        res3 = _convert_lines_float(lines['core charge'], [1, ':', 1])
     return res1, res2, res3
 
 
@@ -207,15 +245,8 @@ def get_single_particle_energies(outfile_000):
     extracts single particle energies from outfile_000 (output.000.txt)
     returns the valence contribution of the single particle energies
     """
-    tmptxt = get_outfile_txt(outfile_000)
-    itmp = 0
-    res = []
-    while itmp >= 0:
-        itmp = search_string('band energy per atom', tmptxt)
-        if itmp >= 0:
-            tmpval = float(tmptxt.pop(itmp).split()[-1])
-            res.append(tmpval)
-    return array(res)
+    lines = scan_outfile(outfile_000, ['band energy per atom'])['band energy per atom']
+    return array([float(line.split()[-1]) for line in lines])
 
 
 def get_econt_info(outfile_0init):
@@ -338,14 +369,8 @@ def get_kmeshinfo(outfile_0init, outfile_000):
     nkmesh.append(tmpdict)
 
     #next get kmesh_ie from output.000.txt
-    tmptxt = get_outfile_txt(outfile_000)
-    kmesh_ie = []
-    itmp = 0
-    while itmp >= 0:
-        itmp = search_string('KMESH =', tmptxt)
-        if itmp >= 0:
-            tmpval = int(tmptxt.pop(itmp).split()[-1])
-            kmesh_ie.append(tmpval)
+    lines = scan_outfile(outfile_000, ['KMESH ='])['KMESH =']
+    kmesh_ie = [int(line.split()[-1]) for line in lines]
 
     return nkmesh, kmesh_ie
 
@@ -454,22 +479,31 @@ def use_BdG(outfile_0init):
     return val_use_BdG
 
 
-def get_spinmom_per_atom(outfile, natom, nonco_out_file=None):
+def _get_moment_blocks(outfile, natom, column):
     """
-    Extract spin moment information from outfile and nonco_angles_out (if given)
+    Read the blocks of natom lines following each line containing 'm_spin'
+    and return the values in the given column for each block
     """
     tmptxt = get_outfile_txt(outfile)
-    itmp = 0
     result = []
-    while itmp >= 0:
-        itmp = search_string('m_spin', tmptxt)
-        if itmp >= 0:
-            tmpline = tmptxt.pop(itmp)
-            tmparray = []
-            for iatom in range(natom):
-                tmpline = tmptxt.pop(itmp)
-                tmparray.append(float(tmpline.split()[3]))
-            result.append(tmparray)
+    itmp = 0
+    while itmp < len(tmptxt):
+        if 'm_spin' not in tmptxt[itmp]:
+            itmp += 1
+            continue
+        block = tmptxt[itmp + 1:itmp + 1 + natom]
+        if len(block) < natom:
+            raise IndexError('Incomplete block of magnetic moments')
+        result.append([float(line.split()[column]) for line in block])
+        itmp += 1 + natom
+    return result
+
+
+def get_spinmom_per_atom(outfile, natom, nonco_out_file=None):
+    """
+    Extract spin moment information from outfile and nonco_angles_out (if given)
+    """
+    result = _get_moment_blocks(outfile, natom, 3)
 
     # if the file is there, i.e. NEWSOSOL is used, then extract also direction of spins (angles theta and phi)
     if nonco_out_file is not None and result:
@@ -487,18 +521,7 @@ def get_orbmom(outfile, natom):
     """
     read orbmom info from outfile and return array (iteration, atom)=orbmom
     """
-    tmptxt = get_outfile_txt(outfile)
-    itmp = 0
-    result = []
-    while itmp >= 0:
-        itmp = search_string('m_spin', tmptxt)
-        if itmp >= 0:
-            tmpline = tmptxt.pop(itmp)
-            tmparray = []
-            for iatom in range(natom):
-                tmpline = tmptxt.pop(itmp)
-                tmparray.append(float(tmpline.split()[4]))
-            result.append(tmparray)
+    result = _get_moment_blocks(outfile, natom, 4)
 
     return array(result)  #, vec, angles
 
@@ -543,6 +566,11 @@ def parse_kkr_outputfile(out_dict,
     # scaling factors etc. defined globally
     doscalc = False
 
+    # every text file is read at most once, the content is shared by all the extraction functions below
+    outfile, outfile_0init, outfile_000, timing_file, outfile_2 = (_CachedOutfile(f) if f is not None else None
+                                                                   for f in (outfile, outfile_0init, outfile_000,
+                                                                             timing_file, outfile_2))
+
     # collection of parsing error messages
     msg_list = []
 
@@ -16,10 +16,13 @@ and written to ``greensf.hdf`` files by fleur
 from __future__ import annotations
 
 from itertools import groupby, chain
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import warnings
 import numpy as np
 import h5py
-from typing import Iterator, Any, NamedTuple, Generator
+from types import TracebackType
+from typing import Iterator, Any, NamedTuple, Generator, Iterable
 
 try:
     from typing import Literal
@@ -454,28 +457,15 @@ def _read_gf_element(file: Any, index: int) -> tuple[GreensfElement, dict[str, A
     Read the information needed for a given Green's function element form a ``greensf.hdf``
     file
 
-    :param file: filepath or handle to be read
+    :param file: filepath, handle or :py:class:`GreensFunctionFile` to be read
     :param index: integer index of the element to read in (indexing starts at 1)
 
     :returns: tuple of the information containing the :py:class:`GreensfElement` for the element
               and the datasets and attributes dict produced by the corresponding
               :py:class:`~masci_tools.io.parsers.hdf5.HDF5Reader`
     """
-    with HDF5Reader(file) as h5reader:
-        version = _get_version(h5reader.file)
-        gf_element = _read_element_header(h5reader.file, index)
-        group_name = _get_greensf_group_name(h5reader.file)
-
-        if gf_element.kresolved:
-            recipe = _get_kresolved_recipe(group_name, index, gf_element.contour, version=version)
-        elif gf_element.sphavg:
-            recipe = _get_sphavg_recipe(group_name, index, gf_element.contour, version=version)
-        else:
-            recipe = _get_radial_recipe(group_name, index, gf_element.contour, nLO=gf_element.nLO, version=version)
-
-        data, attributes = h5reader.read(recipe=recipe)
-
-    return gf_element, data, attributes
+    with _as_greensf_file(file) as gf_file:
+        return gf_file.read_element_data(index)
 
 
 class GreensFunction:
@@ -566,7 +556,7 @@ class GreensFunction:
         """
         Classmethod for creating a :py:class:`GreensFunction` instance directly from a hdf file
 
-        :param file: path or opened file handle to a greensf.hdf file
+        :param file: path, opened file handle or :py:class:`GreensFunctionFile` of a greensf.hdf file
         :param index: optional int index of the element to read in
 
         If index is not given Keyword arguments with the keys being the names of the fields of
@@ -574,21 +564,22 @@ class GreensFunction:
         has to match only one element in the file
         """
 
-        if index is None:
-            elements = listElements(file)
-            if len(elements) > 1 and not selection_params:
-                raise ValueError('If index is not given, parameters for selection need to be provided')
-            indices = select_element_indices(elements, **selection_params)
-            if len(indices) == 1:
-                index = indices[0] + 1
+        with _as_greensf_file(file) as gf_file:
+            if index is None:
+                elements = gf_file.elements
+                if len(elements) > 1 and not selection_params:
+                    raise ValueError('If index is not given, parameters for selection need to be provided')
+                indices = select_element_indices(elements, **selection_params)
+                if len(indices) == 1:
+                    index = indices[0] + 1
+                else:
+                    raise ValueError(
+                        f'Found multiple possible matches for the given criteria. Indices {indices} are possible')
             else:
-                raise ValueError(
-                    f'Found multiple possible matches for the given criteria. Indices {indices} are possible')
-        else:
-            if selection_params:
-                raise ValueError('If index is given no further selection parameters are allowed')
+                if selection_params:
+                    raise ValueError('If index is given no further selection parameters are allowed')
 
-        element, data, attributes = _read_gf_element(file, index)
+            element, data, attributes = gf_file.read_element_data(index)
         return cls(element, data, attributes)
 
     def __getattr__(self, attr: str) -> Any:
@@ -995,6 +986,203 @@ class GreensFunction:
         return self.moment(0, spin=spin)
 
 
+class GreensFunctionFile:
+    """
+    Class for reading many Green's function elements from one ``greensf.hdf`` file.
+    The file is opened only once for all elements and the file version and
+    the headers of the elements are cached
+
+    :param file: filepath, opened file handle (mode 'rb') or opened h5py.File of a greensf.hdf file
+
+    The file is opened when entering the context manager. Nested ``with`` blocks
+    reuse the already opened file, which is closed when the outermost block is left.
+    All accesses to the file are serialized with a lock. When reading in multiple
+    elements with :py:meth:`read_elements()` in multiple threads only the construction
+    of the :py:class:`GreensFunction` objects is done in parallel
+
+    Basic Usage:
+
+    .. code-block:: python
+
+        from masci_tools.tools.greensfunction import GreensFunctionFile
+
+        with GreensFunctionFile('greensf.hdf') as gf_file:
+            print(gf_file.elements)
+            greensfunctions = gf_file.read_elements([1, 2, 3], max_workers=4)
+    """
+
+    def __init__(self, file: FileLike | h5py.File) -> None:
+        self._reader = HDF5Reader(file)
+        self._lock = threading.RLock()
+        self._open_count = 0
+
+        self._group_name: str | None = None
+        self._version: int | None = None
+        self._num_elements: int | None = None
+        self._headers: dict[int, GreensfElement] = {}
+
+    def __enter__(self) -> GreensFunctionFile:
+        self.open()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None,
+                 exc_traceback: TracebackType | None) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """
+        Open the underlying file (if it is not already open)
+        """
+        with self._lock:
+            if self._open_count == 0:
+                self._reader.__enter__()
+            self._open_count += 1
+
+    def close(self) -> None:
+        """
+        Close the underlying file, if this corresponds to the outermost call of :py:meth:`open()`
+        """
+        with self._lock:
+            if self._open_count == 0:
+                return
+            self._open_count -= 1
+            if self._open_count == 0:
+                self._reader.__exit__(None, None, None)
+
+    @property
+    def file(self) -> h5py.File:
+        """
+        The opened h5py.File
+        """
+        if self._open_count == 0:
+            raise ValueError('The greensf.hdf file is not opened. Use the GreensFunctionFile as a context manager')
+        return self._reader.file
+
+    @property
+    def group_name(self) -> str:
+        """
+        Name of the group containing the Green's function elements
+        """
+        with self._lock:
+            if self._group_name is None:
+                self._group_name = _get_greensf_group_name(self.file)
+        return self._group_name
+
+    @property
+    def version(self) -> int | None:
+        """
+        File version of the greensf.hdf file
+        """
+        with self._lock:
+            if self._version is None:
+                self._version = _get_version(self.file)
+        return self._version
+
+    @property
+    def num_elements(self) -> int:
+        """
+        Number of Green's function elements in the file
+        """
+        with self._lock:
+            if self._num_elements is None:
+                self._num_elements = int(self.file.get(self.group_name).attrs['NumElements'][0])
+        return self._num_elements
+
+    @property
+    def elements(self) -> list[GreensfElement]:
+        """
+        List of the :py:class:`GreensfElement` for all elements in the file
+        """
+        return [self.element(index) for index in range(1, self.num_elements + 1)]
+
+    def element(self, index: int) -> GreensfElement:
+        """
+        Get the header of the given Green's function element
+
+        :param index: integer index of the element (indexing starts at 1)
+
+        :returns: :py:class:`GreensfElement` of the element
+        """
+        with self._lock:
+            if index not in self._headers:
+                if not 1 <= index <= self.num_elements:
+                    raise ValueError(f'Invalid element index {index}. The file contains {self.num_elements} elements')
+                self._headers[index] = _read_element_header(self.file, index)
+        return self._headers[index]
+
+    def _get_recipe(self, index: int) -> HDF5Recipe:
+        """
+        Get the recipe for reading in the given element
+
+        :param index: integer index of the element (indexing starts at 1)
+        """
+        gf_element = self.element(index)
+        if gf_element.kresolved:
+            return _get_kresolved_recipe(self.group_name, index, gf_element.contour, version=self.version)
+        if gf_element.sphavg:
+            return _get_sphavg_recipe(self.group_name, index, gf_element.contour, version=self.version)
+        return _get_radial_recipe(self.group_name, index, gf_element.contour, nLO=gf_element.nLO, version=self.version)
+
+    def read_element_data(self, index: int) -> tuple[GreensfElement, dict[str, Any], dict[str, Any]]:
+        """
+        Read the information needed for a given Green's function element
+
+        :param index: integer index of the element to read in (indexing starts at 1)
+
+        :returns: tuple of the :py:class:`GreensfElement` for the element
+                  and the datasets and attributes dict produced by the corresponding
+                  :py:class:`~masci_tools.io.parsers.hdf5.HDF5Reader`
+        """
+        with self._lock:
+            recipe = self._get_recipe(index)
+            data, attributes = self._reader.read(recipe=recipe)
+        return self.element(index), data, attributes
+
+    def read_element(self, index: int) -> GreensFunction:
+        """
+        Read in the given Green's function element
+
+        :param index: integer index of the element to read in (indexing starts at 1)
+
+        :returns: :py:class:`GreensFunction` for the element
+        """
+        return GreensFunction(*self.read_element_data(index))
+
+    def read_elements(self, indices: Iterable[int], max_workers: int | None = None) -> list[GreensFunction]:
+        """
+        Read in multiple Green's function elements. Each element is only read once
+        even if it is given multiple times
+
+        :param indices: integer indices of the elements to read in (indexing starts at 1)
+        :param max_workers: optional int, if given and larger than 1 the elements
+                            are read in using a thread pool with this number of threads
+
+        :returns: list of :py:class:`GreensFunction` in the order of the given indices
+        """
+        indices = list(indices)
+        unique_indices = list(dict.fromkeys(indices))
+        with self:
+            if max_workers is not None and max_workers > 1 and len(unique_indices) > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    greensfunctions = dict(zip(unique_indices, executor.map(self.read_element, unique_indices)))
+            else:
+                greensfunctions = {index: self.read_element(index) for index in unique_indices}
+
+        return [greensfunctions[index] for index in indices]
+
+
+def _as_greensf_file(file: Any) -> GreensFunctionFile:
+    """
+    Return a :py:class:`GreensFunctionFile` for the given file. If it is already
+    a :py:class:`GreensFunctionFile` it is returned unchanged
+
+    :param file: filepath, file handle or :py:class:`GreensFunctionFile`
+    """
+    if isinstance(file, GreensFunctionFile):
+        return file
+    return GreensFunctionFile(file)
+
+
 class colors:
     """
     Color strings for coloring terminal output
@@ -1049,20 +1237,19 @@ def listElements(hdffile: FileLike, show: bool = False) -> list[GreensfElement]:
     """
     Find the green's function elements contained in the given ``greens.hdf`` file
 
-    :param hdffile: filepath or file handle to a greensf.hdf file
+    :param hdffile: filepath, file handle or :py:class:`GreensFunctionFile` of a greensf.hdf file
     :param show: bool if True the found elements are printed in a table
 
     :returns: list of :py:class:`GreensfElement`
     """
-    with h5py.File(hdffile, 'r') as h5_file:
-
-        group_name = _get_greensf_group_name(h5_file)
-
-        num_elements = h5_file.get(group_name).attrs['NumElements'][0]
-
-        elements = []
-        for index in range(1, num_elements + 1):
-            elements.append(_read_element_header(h5_file, index))
+    if isinstance(hdffile, GreensFunctionFile):
+        with hdffile:
+            elements = hdffile.elements
+    else:
+        #Opened directly with h5py, so that files without a .hdf extension can be used
+        with h5py.File(hdffile, 'r') as h5_file:
+            with GreensFunctionFile(h5_file) as gf_file:
+                elements = gf_file.elements
 
     if show:
         print(f'These Elements are found in {hdffile!r}:')
@@ -1077,20 +1264,22 @@ def select_elements_from_file(hdffile: FileLike,
     """
     Construct the green's function matching specified criteria from a given ``greensf.hdf`` file
 
-    :param hdffile: file or file path to the ``greensf.hdf`` file
+    :param hdffile: file, file path or :py:class:`GreensFunctionFile` of the ``greensf.hdf`` file
     :param show: bool if True the found elements will be printed
 
     The Keyword arguments correspond to the names of the fields and their desired value
 
     :returns: iterator over the matching :py:class:`GreensFunction`
     """
+    gf_file = _as_greensf_file(hdffile)
 
-    elements = listElements(hdffile, show=show)
+    elements = listElements(gf_file, show=show)
     found_elements = select_element_indices(elements, show=show, **selection_params)
 
     def gf_iterator(found_elements: list[int]) -> Generator[GreensFunction, None, None]:
-        for index in found_elements:
-            yield GreensFunction.fromFile(hdffile, index=index + 1)
+        with gf_file:
+            for index in found_elements:
+                yield gf_file.read_element(index + 1)
 
     return gf_iterator(found_elements)
 
@@ -1148,36 +1337,43 @@ def select_element_indices(elements: list[GreensfElement], show: bool = False, *
     return found_elements
 
 
-def intersite_shells_from_file(hdffile: FileLike,
-                               reference_atom: int,
-                               show: bool = False,
-                               max_shells: int | None = None
-                               ) -> Generator[tuple[np.floating[Any], GreensFunction, GreensFunction], None, None]:
+def intersite_shells_from_file(
+        hdffile: FileLike | GreensFunctionFile,
+        reference_atom: int,
+        show: bool = False,
+        max_shells: int | None = None,
+        max_workers: int | None = None
+) -> Generator[tuple[np.floating[Any], GreensFunction, GreensFunction], None, None]:
     """
     Construct the green's function pairs to calculate the Jij exchange constants
     for a given reference atom from a given ``greensf.hdf`` file
 
-    :param hdffile: filepath or file handle to a greensf.hdf file
+    :param hdffile: filepath, file handle or :py:class:`GreensFunctionFile` of a greensf.hdf file
     :param reference_atom: integer of the atom to calculate the Jij's for (correspinds to the i)
     :param show: if True the elements belonging to a shell are printed in a shell
     :param max_shells: optional int, if given only the first max_shells shells are constructed
+    :param max_workers: optional int, if given the elements of each shell are read in
+                        with this number of threads
 
     :returns: flat iterator with distance and the two corresponding :py:class:`GreensFunction`
               instances for each Jij calculation
     """
+    gf_file = _as_greensf_file(hdffile)
 
-    elements = listElements(hdffile)
+    elements = listElements(gf_file)
     jij_pairs = intersite_shell_indices(elements, reference_atom, show=show, max_shells=max_shells)
 
     def shell_iterator(
         shells: list[tuple[np.floating[Any], list[tuple[int, int]]]]
     ) -> Generator[tuple[np.floating[Any], GreensFunction, GreensFunction], None, None]:
-        for distance, pairs in shells:
-            for g1, g2 in pairs:
+        with gf_file:
+            for distance, pairs in shells:
+                #All elements of one shell are read in together
                 #Plus 1 because the indexing starts at 1 in the hdf file
-                yield (distance,
-                       GreensFunction.fromFile(hdffile, g1+1),\
-                       GreensFunction.fromFile(hdffile, g2+1))
+                greensfunctions = gf_file.read_elements((index + 1 for pair in pairs for index in pair),
+                                                        max_workers=max_workers)
+                for g1, g2 in zip(greensfunctions[::2], greensfunctions[1::2]):
+                    yield (distance, g1, g2)
 
     return shell_iterator(jij_pairs)
 
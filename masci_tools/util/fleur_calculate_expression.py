@@ -15,10 +15,53 @@ with predefined constants given in the inp.xml file of Fleur
 """
 from __future__ import annotations
 
-from typing import Callable
+from functools import lru_cache
+import operator
+from typing import Any, Callable, Iterable, Dict
+import sys
+if sys.version_info >= (3, 10):
+    from typing import TypeAlias
+else:
+    from typing_extensions import TypeAlias
+
 import numpy as np
 from masci_tools.util.constants import FLEUR_DEFINED_CONSTANTS
 
+#Map the keywords recognized by fleur to the corresponding numpy function
+FUNCTIONS: dict[str, Callable] = {
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'exp': np.exp,
+    'log': np.log,
+    'abs': np.abs,
+    'sqrt': np.sqrt,
+    'acos': np.arccos,
+    'asin': np.arcsin,
+    'atan': np.arctan,
+    'cosh': np.cosh,
+    'sinh': np.sinh,
+    'tanh': np.tanh,
+}
+
+#Conditions for the arguments of functions (function returning True for invalid arguments and error message)
+FUNCTION_CONDITIONS: dict[str, tuple[Callable[[Any], bool], str]] = {
+    'log': (lambda x: x <= 0.0, 'Invalid expression: log(x), x<=0'),
+    'sqrt': (lambda x: x < 0.0, 'Invalid expression: sqrt(x), x<0'),
+    'asin': (lambda x: abs(x) > 1.0, 'Invalid expression: asin(x), |x|>1'),
+    'acos': (lambda x: abs(x) > 1.0, 'Invalid expression: acos(x), |x|>1'),
+}
+
+#Define order of operations
+OPERATOR_ORDER = {'+': 10, '-': 10, '*': 100, '/': 100, '%': 100, '**': 1000, '^': 1000}
+
+EXPRESSION_CACHE_SIZE = 4096
+
+Evaluator: TypeAlias = Callable[[Dict[str, Any]], Any]
+"""
+Type of the compiled functions evaluating (parts of) an expression
+"""
+
 
 class MissingConstant(Exception):
     """
@@ -26,24 +69,137 @@ class MissingConstant(Exception):
     """
 
 
+class _DeferredError(Exception):
+    """
+    Raised during the compilation of an expression if it is invalid. Contains the evaluator
+    performing all operations before the error and raising the error afterwards, so
+    that the same error is raised as if the expression was evaluated step by step
+    """
+
+    def __init__(self, evaluator: Evaluator) -> None:
+        super().__init__()
+        self.evaluator = evaluator
+
+
+class CompiledExpression:
+    """
+    Reusable evaluator for a mathematical expression in the fleur input.
+    The expression is only parsed once and can be evaluated for different constants
+
+    Use :py:func:`compile_expression()` to get cached instances of this class
+
+    :param expression: str containing the expression to be parsed
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        names: list[str] = []
+        try:
+            self._evaluator, _ = _compile_block(expression.replace(' ', ''), None, names)
+        except _DeferredError as err:
+            self._evaluator = err.evaluator
+        #Names of the constants used in the expression
+        self.constants: tuple[str, ...] = tuple(dict.fromkeys(names))
+
+    def evaluate(self, constants: dict[str, float] | None = None) -> float | int:
+        """
+        Evaluates the expression with the given defined constants
+
+        :param constants: dict with all defined constants (predefined in the Fleur code or defined in the inp.xml)
+
+        :return: float value of the expression
+        """
+        if constants is None:
+            constants = FLEUR_DEFINED_CONSTANTS
+        return self._evaluator(constants)
+
+    __call__ = evaluate
+
+    def __repr__(self) -> str:
+        return f'CompiledExpression({self.expression!r})'
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression: str) -> CompiledExpression:
+    """
+    Compile the given expression string into a reusable :py:class:`CompiledExpression`.
+    The results are cached for the most recently used expressions
+
+    :param expression: str containing the expression to be parsed
+
+    :return: :py:class:`CompiledExpression` for the expression
+    """
+    return CompiledExpression(expression)
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _evaluate_cached(expression: str, fingerprint: tuple[tuple[str, type, Any], ...]) -> float | int:
+    """
+    Evaluates the expression with the constants given by the fingerprint
+    (name, type and value of the used constants)
+    """
+    return compile_expression(expression).evaluate({name: value for name, _, value in fingerprint})
+
+
 def calculate_expression(expression: str | float | int, constants: dict[str, float] | None = None) -> float | int:
     """
-    Recursively evaluates the given expression string with the given defined constants
+    Evaluates the given expression string with the given defined constants
+
+    The expression is compiled once and the results are cached
+    for the values of the constants used in the expression
 
     :param expression: str containing the expression to be parsed
     :param constants: dict with all defined constants (predefined in the Fleur code or defined in the inp.xml)
 
     :return: float value of the given expression string
     """
-    value, _ = calculate_expression_partial(expression, constants=constants)
-    return value
+    if expression is None:
+        raise ValueError('Invalid expression: Got None for expression')
+
+    if isinstance(expression, (float, int)):
+        return expression
+
+    if constants is None:
+        constants = FLEUR_DEFINED_CONSTANTS
+
+    compiled = compile_expression(expression)
+    fingerprint = tuple(
+        (name, type(constants[name]), constants[name]) for name in compiled.constants if name in constants)
+    try:
+        return _evaluate_cached(expression, fingerprint)
+    except TypeError:
+        #Unhashable values of constants
+        return compiled.evaluate(constants)
+
+
+def calculate_expressions(expressions: Iterable[str | float | int],
+                          constants: dict[str, float] | None = None) -> list[float | int]:
+    """
+    Evaluates all the given expression strings with the given defined constants.
+    Each distinct expression is only evaluated once
+
+    :param expressions: iterable of str containing the expressions to be parsed
+    :param constants: dict with all defined constants (predefined in the Fleur code or defined in the inp.xml)
+
+    :return: list of the float values of the given expression strings
+    """
+    results: dict[Any, float | int] = {}
+    values = []
+    for expression in expressions:
+        if isinstance(expression, str):
+            if expression not in results:
+                results[expression] = calculate_expression(expression, constants=constants)
+            values.append(results[expression])
+        else:
+            values.append(calculate_expression(expression, constants=constants))
+    return values
 
 
 def calculate_expression_partial(expression: str | float | int,
                                  constants: dict[str, float] | None = None,
                                  prevCommand: str | None = None) -> tuple[float | int, str]:
     """
-    Recursively evaluates the given expression string with the given defined constants
+    Evaluates the given expression string with the given defined constants
     and returns the unevaluated part of the expression
 
     :param expression: str containing the expression to be parsed
@@ -54,126 +210,250 @@ def calculate_expression_partial(expression: str | float | int,
 
     :return: float value of the given expression string
     """
+    if expression is None:
+        raise ValueError('Invalid expression: Got None for expression')
 
-    #Map the keywords recognized by fleur to the corresponding numpy function
-    functions_dict: dict[str, Callable] = {
-        'sin': np.sin,
-        'cos': np.cos,
-        'tan': np.tan,
-        'exp': np.exp,
-        'log': np.log,
-        'abs': np.abs,
-        'sqrt': np.sqrt,
-        'acos': np.arccos,
-        'asin': np.arcsin,
-        'atan': np.arctan,
-        'cosh': np.cosh,
-        'sinh': np.sinh,
-        'tanh': np.tanh,
-    }
+    if isinstance(expression, (float, int)):
+        return expression, ''
 
     if constants is None:
         constants = FLEUR_DEFINED_CONSTANTS
 
-    #Define order of operations
-    order_dict = {'+': 10, '-': 10, '*': 100, '/': 100, '%': 100, '**': 1000, '^': 1000}
+    try:
+        evaluator, expression = _compile_block(expression.replace(' ', ''), prevCommand, [])
+    except _DeferredError as err:
+        evaluator = err.evaluator
+    return evaluator(constants), expression
 
-    stop_loop = False
-    loop_count = 0
 
-    if expression is None:
-        raise ValueError('Invalid expression: Got None for expression')
+def _compile_block(expression: str, prevCommand: str | None, names: list[str]) -> tuple[Evaluator, str]:
+    """
+    Compiles the expression string into an evaluator until a command is encountered,
+    which should be executed after prevCommand (order of operations)
 
-    if isinstance(expression, (float, int)):
-        return expression, ''
+    :param expression: str containing the expression to be parsed (without whitespace)
+    :param prevCommand: str, which gives the command before the beginning of the current block
+    :param names: list to which the names of the used constants are added
+
+    :raises _DeferredError: if the expression is invalid
+
+    :return: evaluator for the block and the remaining string of the expression
+    """
+    stop_loop = False
+    loop_count = 0
+    evaluator: Evaluator | None = None
 
-    expression = expression.replace(' ', '')
-    value = None
     while not stop_loop and len(expression) != 0:
         loop_count += 1
-        firstchar = expression[0]
-        if firstchar.isdecimal() or firstchar == '.' or \
-           (firstchar in ['+', '-'] and loop_count == 1):
-            value, expression = get_first_number(expression)
-            stop_loop = False
-        elif firstchar.isalpha():
-            string, expression = get_first_string(expression)
-            if string in functions_dict:
-                if not expression.startswith('('):
-                    raise ValueError('Invalid expression: Expected Bracket after function name')
-                function = functions_dict[string]
-                function_value, expression = evaluate_bracket(expression, constants)
-                #Check conditions for functions
-                if string == 'log' and function_value <= 0.0:
-                    raise ValueError('Invalid expression: log(x), x<=0')
-                if string == 'sqrt' and function_value < 0.0:
-                    raise ValueError('Invalid expression: sqrt(x), x<0')
-                if string == 'asin' and abs(function_value) > 1.0:
-                    raise ValueError('Invalid expression: asin(x), |x|>1')
-                if string == 'acos' and abs(function_value) > 1.0:
-                    raise ValueError('Invalid expression: acos(x), |x|>1')
-                value = function(function_value)
-            elif expression.startswith('('):
-                raise ValueError(f'Unknown function: {string}')
-            elif string in constants:
-                value = constants[string]
-            else:
-                raise MissingConstant(string)
-            stop_loop = False
-        elif firstchar in ['+', '-', '*', '/', '%', '^']:
-            if loop_count == 1:
-                raise ValueError(f'Invalid Expression: Found operator {firstchar} in the beginning of expression')
-            operator = firstchar
-            if expression[1] in ['+', '-', '*', '/', '%', '^']:
-                if expression[:2] == '**':
-                    operator = expression[:2]
+        try:
+            firstchar = expression[0]
+            if firstchar.isdecimal() or firstchar == '.' or \
+               (firstchar in ['+', '-'] and loop_count == 1):
+                value, expression = get_first_number(expression)
+                new_evaluator = _number_evaluator(value)
+            elif firstchar.isalpha():
+                string, expression = get_first_string(expression)
+                if string in FUNCTIONS:
+                    if not expression.startswith('('):
+                        raise ValueError('Invalid expression: Expected Bracket after function name')
+                    bracket, expression = _split_bracket(expression)
+                    new_evaluator = _function_evaluator(string, _compile_block(bracket, None, names)[0])
+                elif expression.startswith('('):
+                    raise ValueError(f'Unknown function: {string}')
                 else:
-                    raise ValueError('Invalid Expression: Operator following operator')
-            if prevCommand is not None:
-                prevOrder = order_dict[prevCommand]
-            else:
-                prevOrder = 0
-            operatorOrder = order_dict[operator]
-            if operatorOrder > prevOrder:
-                if value is None:
-                    raise ValueError('No left value available for operation')
-                #Evaluate the next block
-                block_value, expression = calculate_expression_partial(expression[len(operator):],
-                                                                       constants,
-                                                                       prevCommand=operator)
-                #Perform the operation
-                if operator == '+':
-                    value += block_value
-                elif operator == '-':
-                    value -= block_value
-                elif operator == '*':
-                    value *= block_value
-                elif operator == '/':
-                    if abs(block_value) < 1e-12:
-                        raise ValueError('Undefined Expression: Division by zero')
-                    value *= 1.0 / block_value
-                elif operator == '%':
-                    value = value % block_value
-                elif operator in ['^', '**']:
-                    if abs(value) < 1e-12 and abs(block_value) < 1e-12:
-                        raise ValueError('Undefined Expression: 0^0')
-                    if value < 0.0 and abs(int(block_value) - block_value) > 1e-12:
-                        raise ValueError('Undefined Expression: x^y, x<0 and y not integer')
-                    if value < 0.0:
-                        block_value = int(block_value)
-                    value = value**block_value
+                    names.append(string)
+                    new_evaluator = _constant_evaluator(string)
+            elif firstchar in ['+', '-', '*', '/', '%', '^']:
+                if loop_count == 1:
+                    raise ValueError(f'Invalid Expression: Found operator {firstchar} in the beginning of expression')
+                operator_str = firstchar
+                if expression[1] in ['+', '-', '*', '/', '%', '^']:
+                    if expression[:2] == '**':
+                        operator_str = expression[:2]
+                    else:
+                        raise ValueError('Invalid Expression: Operator following operator')
+                if prevCommand is not None:
+                    prevOrder = OPERATOR_ORDER[prevCommand]
+                else:
+                    prevOrder = 0
+                if OPERATOR_ORDER[operator_str] > prevOrder:
+                    if evaluator is None:
+                        raise ValueError('No left value available for operation')
+                    #Compile the next block
+                    block_evaluator, expression = _compile_block(expression[len(operator_str):], operator_str, names)
+                    evaluator = _operator_evaluator(operator_str, evaluator, block_evaluator)
+                else:
+                    stop_loop = True
+                continue
+            elif firstchar == '(':
+                bracket, expression = _split_bracket(expression)
+                new_evaluator = _compile_block(bracket, None, names)[0]
             else:
-                stop_loop = True
-        elif firstchar == '(':
-            value, expression = evaluate_bracket(expression, constants)
-            stop_loop = False
+                raise ValueError(f'Invalid expression: Found unexpected character {firstchar}')
+        except _DeferredError as err:
+            if evaluator is None:
+                raise
+            raise _DeferredError(_sequence_evaluator(evaluator, err.evaluator)) from None
+        except Exception as exc:  #pylint: disable=broad-except
+            error_evaluator = _error_evaluator(exc)
+            if evaluator is not None:
+                error_evaluator = _sequence_evaluator(evaluator, error_evaluator)
+            raise _DeferredError(error_evaluator) from None
+
+        #A value following directly on another value replaces it
+        if evaluator is None:
+            evaluator = new_evaluator
         else:
-            raise ValueError(f'Invalid expression: Found unexpected character {firstchar}')
+            evaluator = _sequence_evaluator(evaluator, new_evaluator)
 
-    if value is None:
-        raise ValueError('Failed to evaluate expression')
+    if evaluator is None:
+        error_evaluator = _error_evaluator(ValueError('Failed to evaluate expression'))
+        raise _DeferredError(error_evaluator)
 
-    return value, expression
+    return evaluator, expression
+
+
+def _number_evaluator(value: float) -> Evaluator:
+    """
+    Evaluator returning a fixed number
+    """
+
+    def evaluate_number(constants: dict[str, Any]) -> float:  #pylint: disable=unused-argument
+        return value
+
+    return evaluate_number
+
+
+def _constant_evaluator(name: str) -> Evaluator:
+    """
+    Evaluator returning the value of the given constant
+    """
+
+    def evaluate_constant(constants: dict[str, Any]) -> Any:
+        if name in constants:
+            return constants[name]
+        raise MissingConstant(name)
+
+    return evaluate_constant
+
+
+def _function_evaluator(name: str, argument: Evaluator) -> Evaluator:
+    """
+    Evaluator calling the function of the given name on the evaluated argument
+    """
+    function = FUNCTIONS[name]
+    if name not in FUNCTION_CONDITIONS:
+
+        def evaluate_function(constants: dict[str, Any]) -> Any:
+            return function(argument(constants))
+
+        return evaluate_function
+
+    invalid, message = FUNCTION_CONDITIONS[name]
+
+    def evaluate_function_checked(constants: dict[str, Any]) -> Any:
+        function_value = argument(constants)
+        if invalid(function_value):
+            raise ValueError(message)
+        return function(function_value)
+
+    return evaluate_function_checked
+
+
+def _divide(value: Any, block_value: Any) -> Any:
+    """
+    Division with check for division by zero
+    """
+    if abs(block_value) < 1e-12:
+        raise ValueError('Undefined Expression: Division by zero')
+    value *= 1.0 / block_value
+    return value
+
+
+def _power(value: Any, block_value: Any) -> Any:
+    """
+    Exponentiation with checks for undefined expressions
+    """
+    if abs(value) < 1e-12 and abs(block_value) < 1e-12:
+        raise ValueError('Undefined Expression: 0^0')
+    if value < 0.0 and abs(int(block_value) - block_value) > 1e-12:
+        raise ValueError('Undefined Expression: x^y, x<0 and y not integer')
+    if value < 0.0:
+        block_value = int(block_value)
+    return value**block_value
+
+
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    '+': operator.iadd,
+    '-': operator.isub,
+    '*': operator.imul,
+    '/': _divide,
+    '%': operator.mod,
+    '**': _power,
+    '^': _power,
+}
+
+
+def _operator_evaluator(operator_str: str, left: Evaluator, right: Evaluator) -> Evaluator:
+    """
+    Evaluator applying the operation to the evaluated operands
+    """
+    operation = _OPERATORS[operator_str]
+
+    def evaluate_operator(constants: dict[str, Any]) -> Any:
+        value = left(constants)
+        return operation(value, right(constants))
+
+    return evaluate_operator
+
+
+def _sequence_evaluator(first: Evaluator, second: Evaluator) -> Evaluator:
+    """
+    Evaluator evaluating both evaluators in order and returning the second value
+    """
+
+    def evaluate_sequence(constants: dict[str, Any]) -> Any:
+        first(constants)
+        return second(constants)
+
+    return evaluate_sequence
+
+
+def _error_evaluator(exc: Exception) -> Evaluator:
+    """
+    Evaluator raising a new instance of the given exception
+    """
+    exc_type, args = type(exc), exc.args
+
+    def raise_error(constants: dict[str, Any]) -> Any:  #pylint: disable=unused-argument
+        raise exc_type(*args)
+
+    return raise_error
+
+
+def _split_bracket(expression: str) -> tuple[str, str]:
+    """
+    Split off the bracket opened at the start of the expression
+
+    :param expression: expression to be parsed
+
+    :return: expression inside the brackets and remaining string of the expression
+             after the corresponding closed bracket
+    """
+    closing_pos = 0
+    opened_brackets = 0
+    for char in expression:
+        if char == '(':
+            opened_brackets += 1
+        elif char == ')':
+            opened_brackets -= 1
+        if opened_brackets == 0:
+            break
+        closing_pos += 1
+    if opened_brackets != 0:
+        raise ValueError('Invalid Expression: Unbalanced parentheses')
+
+    return expression[1:closing_pos], expression[closing_pos + 1:]
 
 
 def get_first_number(expression: str) -> tuple[float, str]:
@@ -235,19 +515,7 @@ def evaluate_bracket(expression: str, constants: dict[str, float]) -> tuple[floa
     :return: value of the expression inside the brackets and remaining string of the expression
              after the corresponding closed bracket
     """
-    closing_pos = 0
-    opened_brackets = 0
-    for char in expression:
-        if char == '(':
-            opened_brackets += 1
-        elif char == ')':
-            opened_brackets -= 1
-        if opened_brackets == 0:
-            break
-        closing_pos += 1
-    if opened_brackets != 0:
-        raise ValueError('Invalid Expression: Unbalanced parentheses')
+    bracket, expression = _split_bracket(expression)
+    value = calculate_expression(bracket, constants=constants)
 
-    value = calculate_expression(expression[1:closing_pos], constants=constants)
-
-    return value, expression[closing_pos + 1:]
+    return value, expression
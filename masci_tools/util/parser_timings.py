@@ -0,0 +1,182 @@
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-1/PGI-1, Germany.         #
+#                All rights reserved.                                         #
+# This file is part of the Masci-tools package.                               #
+# (Material science tools)                                                    #
+#                                                                             #
+# The code is hosted on GitHub at https://github.com/judftteam/masci-tools.   #
+# For further information on the license, see the LICENSE.txt file.           #
+# For further information please visit http://judft.de/.                      #
+#                                                                             #
+###############################################################################
+"""
+This module contains the opt-in instrumentation for the fleur XML parsers. While a
+:py:func:`collect_timings()` context is active, the wall times and number of calls of the
+phases, parse tasks and conversions marked with :py:func:`timed()` are recorded together
+with the number of evaluated XPath expressions. If no context is active, the instrumented
+code only performs a lookup of a context variable
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import os
+import time
+from typing import Any, Iterator
+
+TIMINGS_ENV_VARIABLE = 'MASCI_TOOLS_PARSER_TIMINGS'
+
+CATEGORIES = ('phases', 'tasks', 'conversions')
+
+_ACTIVE_TIMINGS: ContextVar[ParserTimings | None] = ContextVar('_ACTIVE_TIMINGS', default=None)
+
+
+class ParserTimings:
+    """
+    Collection of the wall times, call counts and XPath evaluation counts
+    of the instrumented parts of a parser run
+    """
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.total: float | None = None
+        self.xpath_evaluations = 0
+        self.entries: dict[str, dict[str, dict[str, Any]]] = {category: {} for category in CATEGORIES}
+
+    def record(self, category: str, name: str, elapsed: float, xpath_evaluations: int) -> None:
+        """
+        Add one call of the given phase/task/conversion
+
+        :param category: one of ``phases``, ``tasks`` or ``conversions``
+        :param name: name of the entry
+        :param elapsed: wall time of the call in seconds
+        :param xpath_evaluations: number of XPath evaluations during the call
+        """
+        entry = self.entries[category].setdefault(name, {'time': 0.0, 'calls': 0, 'xpath_evaluations': 0})
+        entry['time'] += elapsed
+        entry['calls'] += 1
+        entry['xpath_evaluations'] += xpath_evaluations
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the collected information into a dictionary
+
+        :returns: dict with the total time, the number of xpath evaluations and the entries for
+                  each category (dicts with the ``time``, ``calls`` and ``xpath_evaluations``)
+        """
+        total = self.total if self.total is not None else time.perf_counter() - self.start
+        return {
+            'total': total,
+            'xpath_evaluations': self.xpath_evaluations,
+            **{category: {name: entry.copy() for name, entry in entries.items()} \
+                for category, entries in self.entries.items()}
+        }
+
+
+def timings_enabled(profile: bool = False) -> bool:
+    """
+    Determine whether the timings should be collected. This is the case if
+    ``profile`` is True or the environment variable ``MASCI_TOOLS_PARSER_TIMINGS``
+    is set to a value other than ``0``, ``false`` or ``no``
+
+    :param profile: bool, explicit switch of the parser
+
+    :returns: bool, whether the timings should be collected
+    """
+    if profile:
+        return True
+    return os.environ.get(TIMINGS_ENV_VARIABLE, '').strip().lower() not in ('', '0', 'false', 'no')
+
+
+@contextmanager
+def collect_timings(enabled: bool = True) -> Iterator[ParserTimings | None]:
+    """
+    Contextmanager collecting the timings of all instrumented code executed inside it
+
+    :param enabled: bool, if False nothing is collected and None is returned
+
+    :returns: the :py:class:`ParserTimings` instance (or None)
+    """
+    if not enabled:
+        yield None
+        return
+
+    timings = ParserTimings()
+    token = _ACTIVE_TIMINGS.set(timings)
+    try:
+        yield timings
+    finally:
+        timings.total = time.perf_counter() - timings.start
+        _ACTIVE_TIMINGS.reset(token)
+
+
+@contextmanager
+def timed(name: str, category: str = 'phases') -> Iterator[None]:
+    """
+    Contextmanager recording the wall time and xpath evaluations of the
+    contained code under the given name, if timings are collected
+
+    :param name: name of the entry
+    :param category: one of ``phases``, ``tasks`` or ``conversions``
+    """
+    timings = _ACTIVE_TIMINGS.get()
+    if timings is None:
+        yield
+        return
+
+    xpath_evaluations = timings.xpath_evaluations
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.record(category, name, time.perf_counter() - start, timings.xpath_evaluations - xpath_evaluations)
+
+
+def count_xpath_evaluation() -> None:
+    """
+    Count one evaluation of an XPath expression, if timings are collected
+    """
+    timings = _ACTIVE_TIMINGS.get()
+    if timings is not None:
+        timings.xpath_evaluations += 1
+
+
+def format_timings(timings: dict[str, Any], limit: int | None = None) -> str:
+    """
+    Create a summary table of the timings produced by the parsers (``parser_info_out['timings']``)
+
+    :param timings: dict produced by :py:meth:`ParserTimings.to_dict()`
+    :param limit: int, if given only the most expensive entries of each category are shown
+
+    :returns: str with the summary
+    """
+    from tabulate import tabulate
+
+    total = timings['total']
+    lines = [f"Total time: {total:.4f} s ({timings['xpath_evaluations']} XPath evaluations)"]
+    for category in CATEGORIES:
+        entries = sorted(timings.get(category, {}).items(), key=lambda item: item[1]['time'], reverse=True)
+        if not entries:
+            continue
+        if limit is not None:
+            entries = entries[:limit]
+        rows = [[
+            name, f"{entry['time']:.4f}", f"{100*entry['time']/total:.1f}" if total else '-', entry['calls'],
+            entry['xpath_evaluations']
+        ] for name, entry in entries]
+        lines.append('')
+        lines.append(
+            tabulate(rows,
+                     headers=[category.capitalize(), 'Time [s]', 'Total [%]', 'Calls', 'XPath evaluations'],
+                     disable_numparse=True))
+    return '\n'.join(lines)
+
+
+def print_timings(timings: dict[str, Any], limit: int | None = None) -> None:
+    """
+    Print the summary table of the timings produced by the parsers (``parser_info_out['timings']``)
+
+    :param timings: dict produced by :py:meth:`ParserTimings.to_dict()`
+    :param limit: int, if given only the most expensive entries of each category are shown
+    """
+    print(format_timings(timings, limit=limit))
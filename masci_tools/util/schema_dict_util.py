@@ -30,12 +30,16 @@ from logging import Logger
 import warnings
 import copy
 import os
-from typing import Iterable, Any, overload
+from functools import wraps
+from typing import Iterable, Any, Callable, TypeVar, overload
 try:
     from typing import Literal
 except ImportError:
     from typing_extensions import Literal  #type:ignore
 
+F = TypeVar('F', bound=Callable[..., Any])
+"""Generic Callable type"""
+
 
 def read_constants(root: XMLLike | etree.XPathElementEvaluator,
                    schema_dict: fleur_schema.SchemaDict,
@@ -846,6 +850,55 @@ def _get_xinclude_elem(include_file: str | os.PathLike) -> etree._Element:
     return xinclude_elem
 
 
+def _freeze_argument(value: Any) -> Any:
+    """
+    Convert the given argument into a hashable object
+    (lists/tuples to tuples and sets to frozensets)
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_argument(val) for val in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze_argument(val) for val in value)
+    return value
+
+
+def _cache_selection(func: F) -> F:
+    """
+    Decorator for the functions selecting the xpaths/tag information for the evaluation
+    functions in this module. The results only depend on the schema dictionary, the given
+    arguments and the tag of the node (if it is an element). Since the schema dictionaries are
+    immutable the results are stored on the schema dictionary itself, so that the same lookups
+    (e.g. for each iteration in an out.xml file) are only performed once per schema version
+
+    Errors are not cached and arguments, which are not hashable, bypass the cache
+    """
+
+    @wraps(func)
+    def cached_selection(node: XMLLike | etree.XPathElementEvaluator, schema_dict: fleur_schema.SchemaDict, name: str,
+                         **kwargs: Any) -> Any:
+
+        cache = getattr(schema_dict, 'selection_cache', None)
+        if cache is None:
+            return func(node, schema_dict, name, **kwargs)
+
+        node_tag = node.tag if isinstance(node, etree._Element) else None
+        key = (func.__name__, node_tag, name, tuple(sorted(
+            (arg, _freeze_argument(val)) for arg, val in kwargs.items())))
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return func(node, schema_dict, name, **kwargs)
+
+        result = func(node, schema_dict, name, **kwargs)
+        cache[key] = result
+        return result
+
+    return cached_selection  #type:ignore[return-value]
+
+
+@_cache_selection
 def _select_tag_xpath(node: XMLLike | etree.XPathElementEvaluator,
                       schema_dict: fleur_schema.SchemaDict,
                       name: str,
@@ -900,6 +953,7 @@ def _select_tag_xpath(node: XMLLike | etree.XPathElementEvaluator,
     return xpath
 
 
+@_cache_selection
 def _select_attrib_xpath(node: XMLLike | etree.XPathElementEvaluator,
                          schema_dict: fleur_schema.SchemaDict,
                          name: str,
@@ -957,6 +1011,7 @@ def _select_attrib_xpath(node: XMLLike | etree.XPathElementEvaluator,
     return xpath
 
 
+@_cache_selection
 def _select_tag_info(node: XMLLike | etree.XPathElementEvaluator,
                      schema_dict: fleur_schema.SchemaDict,
                      name: str,
@@ -15,25 +15,58 @@ Common functions for parsing input/output files or XMLschemas from FLEUR
 from __future__ import annotations
 
 from masci_tools.util.typing import XMLLike, XPathLike, TXPathLike
+from masci_tools.util.parser_timings import count_xpath_evaluation
 from lxml import etree
 import warnings
 import copy
 import logging
+from functools import lru_cache
 from typing import Any, TypeVar, cast, overload
 
 from .xpathbuilder import FilterType, XPathBuilder
 
+XINCLUDE_TAG = '{http://www.w3.org/2001/XInclude}include'
 
-def clear_xml(tree: etree._ElementTree) -> tuple[etree._ElementTree, set[str]]:
+
+def requires_clearing(tree: etree._ElementTree) -> bool:
+    """
+    Check whether the given xml tree contains comments or xinclude tags, i.e.
+    whether :py:func:`clear_xml()` would change anything in the tree.
+    The check stops at the first element found, so it is much cheaper than
+    processing (or copying) the tree
+
+    :param tree: an xml-tree which will be checked
+
+    :returns: bool, True if there are comments or xinclude tags in the tree
+    """
+    root = tree.getroot()
+    for sibling in root.itersiblings(preceding=True):
+        if sibling.tag is etree.Comment:
+            return True
+    for sibling in root.itersiblings():
+        if sibling.tag is etree.Comment:
+            return True
+    return next(root.iter(etree.Comment, XINCLUDE_TAG), None) is not None
+
+
+def clear_xml(tree: etree._ElementTree, inplace: bool = False) -> tuple[etree._ElementTree, set[str]]:
     """
     Removes comments and executes xinclude tags of an
     xml tree.
 
     :param tree: an xml-tree which will be processed
+    :param inplace: bool, if True the given tree is modified instead of a copy.
+                    If there is nothing to remove or include the tree is returned
+                    unchanged in this case. Use this only if the caller owns the tree
 
     :returns: cleared_tree, an xmltree without comments and with replaced xinclude tags
     """
-    cleared_tree = copy.deepcopy(tree)
+    if inplace:
+        if not requires_clearing(tree):
+            return tree, set()
+        cleared_tree = tree
+    else:
+        cleared_tree = copy.deepcopy(tree)
 
     #Remove comments outside the root element (Since they have no parents this would lead to a crash)
     root = cleared_tree.getroot()
@@ -201,7 +234,9 @@ def validate_xml(xmltree: etree._ElementTree,
     from itertools import groupby
 
     try:
-        cleared_tree, _ = clear_xml(xmltree)
+        cleared_tree = xmltree
+        if requires_clearing(xmltree):
+            cleared_tree, _ = clear_xml(xmltree)
         schema.assertValid(cleared_tree)
     except etree.DocumentInvalid as exc:
         error_log = sorted(schema.error_log, key=lambda x: x.message)  #type: ignore[call-overload]
@@ -264,6 +299,7 @@ def eval_xpath(node: XMLLike | etree.XPathElementEvaluator,
             'Passing namespaces is only supported for string xpaths and nodes. for etree.XPath or XPathEvaluatore use namespaces in the init function'
         )
 
+    count_xpath_evaluation()
     try:
         if isinstance(node, etree.XPathElementEvaluator):
             if isinstance(xpath, etree.XPath):
@@ -274,8 +310,8 @@ def eval_xpath(node: XMLLike | etree.XPathElementEvaluator,
         elif isinstance(xpath, etree.XPath):
             return_value = xpath(node, **variables)
         else:
-            return_value = node.xpath(xpath, namespaces=namespaces, smart_strings=True, extensions=None, **variables)
-    except etree.XPathEvalError as err:
+            return_value = _compile_xpath(xpath, _freeze_namespaces(namespaces))(node, **variables)
+    except (etree.XPathEvalError, etree.XPathSyntaxError) as err:
         if logger is not None:
             logger.exception(
                 'There was a XpathEvalError on the xpath: %s \n'
@@ -297,6 +333,29 @@ def eval_xpath(node: XMLLike | etree.XPathElementEvaluator,
     return return_value
 
 
+@lru_cache(maxsize=4096)
+def _compile_xpath(xpath: str | bytes, namespaces: tuple[tuple[str, str], ...] | None) -> etree.XPath:
+    """
+    Compile the given xpath expression. The compiled expressions are cached,
+    since the same expressions are evaluated many times (e.g. for each iteration in an out.xml file)
+
+    :param xpath: str of the xpath expression
+    :param namespaces: namespaces as a tuple of prefix, uri pairs
+
+    :returns: compiled etree.XPath object
+    """
+    return etree.XPath(xpath, namespaces=dict(namespaces) if namespaces is not None else None, smart_strings=True)
+
+
+def _freeze_namespaces(namespaces: dict[str, str] | None) -> tuple[tuple[str, str], ...] | None:
+    """
+    Convert the namespaces argument to a hashable form for :py:func:`_compile_xpath()`
+    """
+    if namespaces is None:
+        return None
+    return tuple(sorted(namespaces.items()))
+
+
 def get_xml_attribute(node: etree._Element, attributename: str, logger: logging.Logger | None = None) -> str | None:
     """
     Get an attribute value from a node.
@@ -468,6 +527,8 @@ def normalize_xmllike(xmllike: XMLLike) -> etree._Element:
     """
     if etree.iselement(xmllike):
         return xmllike
+    if not requires_clearing(xmllike):  #type:ignore[arg-type]
+        return xmllike.getroot()  #type:ignore[union-attr]
     xmllike, _ = clear_xml(xmllike)  #type:ignore[arg-type]
     return xmllike.getroot()
 
@@ -156,32 +156,41 @@ def convert_from_xml_explicit(
 
     converted_list: list[ConvertedType | list[ConvertedType]] = []
     all_success = True
-    for text in xmlstring:
 
-        split_text = text.split(' ')
-        while '' in split_text:
-            split_text.remove('')
+    #All values with the same possible types are converted together
+    #The positions are stored as the index of the text and the slice of the values
+    batches: dict[tuple[BaseType, ...], tuple[list[str], list[tuple[int, slice]]]] = {}
+    lengths_list: list[set[int | Literal['unbounded']]] = []
+    #The matching definitions only depend on the number of values in the text
+    matching_definitions: dict[int, list[fleur_schema.AttributeType]] = {}
+    for text in xmlstring:
 
-        text_definitions = []
-        for definition in definitions:
-            if definition.length == len(split_text):
-                text_definitions.append(definition)
+        split_text = [value for value in text.split(' ') if value]
 
-        if not text_definitions:
+        text_definitions = matching_definitions.get(len(split_text))
+        if text_definitions is None:
+            text_definitions = []
             for definition in definitions:
-                if definition.length in ('unbounded', 1):
+                if definition.length == len(split_text):
                     text_definitions.append(definition)
 
+            if not text_definitions:
+                for definition in definitions:
+                    if definition.length in ('unbounded', 1):
+                        text_definitions.append(definition)
+            matching_definitions[len(split_text)] = text_definitions
+
         if not text_definitions:
             if logger is None:
                 raise ValueError(f"Could not convert '{text}', no matching definition found")
             logger.warning("Could not convert '%s', no matching definition found", text)
             converted_list.append(text)
+            lengths_list.append(set())
             all_success = False
             continue
 
         types = tuple(definition.base_type for definition in text_definitions)
-        lengths = {definition.length for definition in text_definitions}
+        lengths_list.append({definition.length for definition in text_definitions})
 
         if len(text_definitions) == 1:
             if text_definitions[0].length == 1:
@@ -190,16 +199,24 @@ def convert_from_xml_explicit(
         if logger is not None:
             logger.debug('Convert from XML: %s using definitions %s', split_text, types)
 
-        converted_text, suc = convert_from_xml_single_values(split_text, types, constants=constants, logger=logger)
+        values, positions = batches.setdefault(types, ([], []))
+        positions.append((len(converted_list), slice(len(values), len(values) + len(split_text))))
+        values.extend(split_text)
+        converted_list.append(text)
 
+    for types, (values, positions) in batches.items():
+        converted_values, suc = convert_from_xml_single_values(values, types, constants=constants, logger=logger)
         all_success = all_success and suc
 
-        if len(converted_text) == 1 and 'unbounded' not in lengths:
-            converted_text = converted_text[0]  #type:ignore[assignment]
-        elif len(converted_text) == 0 and 'unbounded' not in lengths:
-            converted_text = ''  #type:ignore
+        for index, value_slice in positions:
+            converted_text = converted_values[value_slice]
+            lengths = lengths_list[index]
+            if len(converted_text) == 1 and 'unbounded' not in lengths:
+                converted_text = converted_text[0]  #type:ignore[assignment]
+            elif len(converted_text) == 0 and 'unbounded' not in lengths:
+                converted_text = ''  #type:ignore
 
-        converted_list.append(converted_text)
+            converted_list[index] = converted_text
 
     ret_value = converted_list
     if len(converted_list) == 1 and not list_return:
@@ -291,6 +308,135 @@ def convert_to_xml_explicit(value: Any | Iterable[Any],
     return ret_value, all_success
 
 
+_DECIMAL = r'[+-]?(?:\d+\.?\d*|\.\d+)'
+_FORTRAN_REAL = rf'{_DECIMAL}(?:[eEdD][+-]?\d+)?'
+_DECIMAL_RE = re.compile(rf'\s*{_DECIMAL}\s*')
+_FORTRAN_REAL_RE = re.compile(rf'\s*{_FORTRAN_REAL}\s*')
+#Expressions in the fleur input do not allow exponents, so only plain decimals are converted directly
+_DECIMAL_LIST_RE = re.compile(rf'\s*(?:{_DECIMAL}\s+)*{_DECIMAL}\s*')
+_FORTRAN_REAL_LIST_RE = re.compile(rf'\s*(?:{_FORTRAN_REAL}\s+)*{_FORTRAN_REAL}\s*')
+_FORTRAN_EXPONENT_TABLE = str.maketrans('dD', 'eE')
+_FORTRAN_BOOLS = {'True': True, 't': True, 'T': True, 'False': False, 'f': False, 'F': False}
+
+
+def _convert_fortran_real(text: str) -> float:
+    """
+    Convert a real number written by fortran (also allowing `d`/`D` exponents)
+
+    :param text: str to convert
+
+    :raises ValueError: if the text is not a real number
+    """
+    if isinstance(text, str) and _FORTRAN_REAL_RE.fullmatch(text):
+        return float(text.translate(_FORTRAN_EXPONENT_TABLE))
+    raise ValueError(f'could not convert string to float: {text!r}')
+
+
+def _convert_floats_bulk(texts: list[str], exponents: bool = True) -> list[float] | None:
+    """
+    Convert a list of real numbers in one go using numpy. Returns None
+    if not all entries are real numbers
+
+    :param texts: list of str to convert
+    :param exponents: bool if False only plain decimal numbers without exponents are accepted
+    """
+    import numpy as np
+
+    if not all(isinstance(text, str) for text in texts):
+        return None
+    joined = ' '.join(texts)
+    pattern = _FORTRAN_REAL_LIST_RE if exponents else _DECIMAL_LIST_RE
+    if not pattern.fullmatch(joined):
+        return None
+    values = joined.translate(_FORTRAN_EXPONENT_TABLE).split()
+    if len(values) != len(texts):
+        return None
+    return np.array(values, dtype=float).tolist()
+
+
+def _convert_single_value(text: str, value_type: BaseType, constants: dict[str, float] | None) -> ConvertedType:
+    """
+    Convert a single value to the given type
+
+    :param text: str to convert
+    :param value_type: type to convert to
+    :param constants: dict, of constants defined in fleur input
+
+    :raises: ValueError, TypeError or MissingConstant if the conversion fails
+    """
+    from masci_tools.util.fleur_calculate_expression import calculate_expression, MissingConstant
+
+    if value_type == 'float':
+        try:
+            return float(text)
+        except (ValueError, TypeError):
+            return _convert_fortran_real(text)
+    if value_type == 'float_expression':
+        if isinstance(text, str) and _DECIMAL_RE.fullmatch(text):
+            return float(text)
+        try:
+            return calculate_expression(text, constants=constants)
+        except MissingConstant as exc:
+            raise MissingConstant(f'No value available for expression {exc}\n'
+                                  'Please provide the value for this constant'
+                                  ' by using the get_constants function for example') from exc
+    if value_type == 'complex':
+        return convert_from_fortran_complex(text)
+    if value_type == 'int':
+        return int(text)
+    if value_type == 'switch':
+        return convert_from_fortran_bool(text)
+    return str(text)
+
+
+def _convert_values_batch(texts: list[str], value_type: BaseType,
+                          constants: dict[str, float] | None) -> tuple[list[ConvertedType | None], list[int]]:
+    """
+    Convert a list of values to the given type. First the whole list is converted
+    at once. Only if this fails, the values are converted one by one
+
+    :param texts: list of str to convert
+    :param value_type: type to convert to
+    :param constants: dict, of constants defined in fleur input
+
+    :returns: list of the converted values (None for failed conversions)
+              and list of the indices of the failed conversions
+    """
+    from masci_tools.util.fleur_calculate_expression import calculate_expressions, MissingConstant
+
+    converted: list[ConvertedType | None] | None = None
+    try:
+        if value_type == 'float':
+            converted = _convert_floats_bulk(texts)  #type:ignore[assignment]
+        elif value_type == 'float_expression':
+            converted = _convert_floats_bulk(texts, exponents=False)  #type:ignore[assignment]
+            if converted is None:
+                converted = calculate_expressions(  #type:ignore[assignment]
+                    [float(text) if isinstance(text, str) and _DECIMAL_RE.fullmatch(text) else text for text in texts],
+                    constants=constants)
+        elif value_type == 'int':
+            converted = list(map(int, texts))
+        elif value_type == 'switch':
+            converted = [_FORTRAN_BOOLS[text] for text in texts]
+        elif value_type == 'string':
+            converted = list(map(str, texts))
+    except (ValueError, TypeError, KeyError, MissingConstant):
+        converted = None
+
+    if converted is not None:
+        return converted, []
+
+    converted = []
+    failed = []
+    for index, text in enumerate(texts):
+        try:
+            converted.append(_convert_single_value(text, value_type, constants))
+        except (ValueError, TypeError, MissingConstant):
+            converted.append(None)
+            failed.append(index)
+    return converted, failed
+
+
 def convert_from_xml_single_values(xmlstring: str | list[str],
                                    possible_types: tuple[BaseType, ...],
                                    constants: dict[str, float] | None = None,
@@ -301,88 +447,59 @@ def convert_from_xml_single_values(xmlstring: str | list[str],
 
     If no logger is given and a attribute cannot be converted an error is raised
 
+    The values are converted type by type for the whole list. Lists of numbers (also with
+    fortran `D` exponents) and booleans are converted in one go, only if this fails the
+    values are converted one by one (e.g. evaluating expressions)
+
     :param stringattribute: str, Attribute to convert.
     :param possible_types: list of str What types it will try to convert to
     :param constants: dict, of constants defined in fleur input
     :param logger: logger object for logging warnings
                    if given the errors are logged and the list is returned with the unconverted values
                    otherwise a error is raised, when the first conversion fails
-    :param list_return: if True, the returned quantity is always a list even if only one element is in it
 
     :return: The converted value of the first successful conversion
     """
-    from masci_tools.util.fleur_calculate_expression import calculate_expression, MissingConstant
+    from masci_tools.util.fleur_calculate_expression import MissingConstant
 
     if not isinstance(xmlstring, list):
         xmlstring = [xmlstring]
 
-    converted_value: ConvertedType
-    converted_list = []
-    all_success = True
-    for text in xmlstring:
+    converted_list: list[ConvertedType] = list(xmlstring)
+    remaining = list(range(len(xmlstring)))
+    converted_types: set[BaseType] = set()
+    for value_type in possible_types:
+        if not remaining:
+            break
+        converted, failed = _convert_values_batch([xmlstring[index] for index in remaining], value_type, constants)
+
+        failed_set = set(failed)
+        for local_index, (index, value) in enumerate(zip(remaining, converted)):
+            if local_index not in failed_set:
+                converted_list[index] = value  #type:ignore[assignment]
+                converted_types.add(value_type)
+        remaining = [remaining[local_index] for local_index in failed]
 
+    all_success = True
+    for index in remaining:
+        text = xmlstring[index]
         exceptions: list[Exception] = []
         for value_type in possible_types:
-            if value_type == 'float':
-                try:
-                    converted_value = float(text)
-                except (ValueError, TypeError) as exc:
-                    exceptions.append(exc)
-                    continue
+            try:
+                _convert_single_value(text, value_type, constants)
+            except (ValueError, TypeError, MissingConstant) as exc:
+                exceptions.append(exc)
 
-            elif value_type == 'float_expression':
-                try:
-                    converted_value = calculate_expression(text, constants=constants)
-                except ValueError as exc:
-                    exceptions.append(exc)
-                    continue
-                except MissingConstant as exc:
-                    new_exc = MissingConstant(f'No value available for expression {exc}\n'
-                                              'Please provide the value for this constant'
-                                              ' by using the get_constants function for example')
-
-                    exceptions.append(new_exc)
-                    continue
+        if logger is None:
+            raise ValueError(f"Could not convert '{text}'. Tried: {possible_types}.\n"
+                             'The following errors occurred:\n   ' + '\n   '.join([str(error) for error in exceptions]))
+        logger.warning("Could not convert '%s'. The following errors occurred:", text)
 
-            elif value_type == 'complex':
-                try:
-                    converted_value = convert_from_fortran_complex(text)
-                except (ValueError, TypeError) as exc:
-                    exceptions.append(exc)
-                    continue
+        for error in exceptions:
+            logger.warning('   %s', str(error))
+            logger.debug(error, exc_info=error)
 
-            elif value_type == 'int':
-                try:
-                    converted_value = int(text)
-                except (ValueError, TypeError) as exc:
-                    exceptions.append(exc)
-                    continue
-
-            elif value_type == 'switch':
-                try:
-                    converted_value = convert_from_fortran_bool(text)
-                except (ValueError, TypeError) as exc:
-                    exceptions.append(exc)
-                    continue
-
-            elif value_type == 'string':
-                converted_value = str(text)
-
-            converted_list.append(converted_value)
-            break
-        else:
-            if logger is None:
-                raise ValueError(f"Could not convert '{text}'. Tried: {possible_types}.\n"
-                                 'The following errors occurred:\n   ' +
-                                 '\n   '.join([str(error) for error in exceptions]))
-            logger.warning("Could not convert '%s'. The following errors occurred:", text)
-
-            for error in exceptions:
-                logger.warning('   %s', str(error))
-                logger.debug(error, exc_info=error)
-
-            converted_list.append(text)
-            all_success = False
+        all_success = False
 
     return converted_list, all_success
 
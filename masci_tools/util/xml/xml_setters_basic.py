@@ -17,13 +17,88 @@ to do these operations robustly
 """
 from __future__ import annotations
 
-from typing import Iterable, Any
+from typing import Iterable, Iterator, Any
+from contextlib import contextmanager
+from contextvars import ContextVar
 from lxml import etree
 import warnings
 
 from masci_tools.util.typing import XPathLike, XMLLike
 from masci_tools.util.xml.common_functions import eval_xpath_all, is_valid_tag
 
+_MODIFICATION_TRACKERS: ContextVar[tuple[list[etree._Element], ...]] = ContextVar('modification_trackers', default=())
+
+
+@contextmanager
+def track_modifications() -> Iterator[list[etree._Element]]:
+    """
+    Context manager recording the elements modified by the XML setting functions
+    inside the context. For elements that were added/removed/replaced the parent is recorded.
+    Contexts can be nested
+
+    .. code-block:: python
+
+        with track_modifications() as modified_elements:
+            xml_set_attrib_value_no_create(xmltree, '/fleurInput/calculationSetup/cutoffs', 'Kmax', '4.0')
+
+        #modified_elements now contains the cutoffs element
+
+    :returns: list of the modified elements (may contain duplicates)
+    """
+    modified: list[etree._Element] = []
+    token = _MODIFICATION_TRACKERS.set((*_MODIFICATION_TRACKERS.get(), modified))
+    try:
+        yield modified
+    finally:
+        _MODIFICATION_TRACKERS.reset(token)
+
+
+def record_modification(*nodes: etree._Element) -> None:
+    """
+    Record the given elements as modified for all active :py:func:`track_modifications()`
+    contexts. Has to be called by all XML setting functions modifying the tree directly
+
+    :param nodes: the modified elements
+    """
+    for modified in _MODIFICATION_TRACKERS.get():
+        modified.extend(nodes)
+
+
+_PENDING_INDENTATION: ContextVar[dict[int, XMLLike] | None] = ContextVar('pending_indentation', default=None)
+
+
+@contextmanager
+def deferred_indentation() -> Iterator[None]:
+    """
+    Context manager deferring the indentation of the XML trees modified by the XML setting
+    functions inside the context. Each tree is indented once when the context is left
+    instead of after each created/deleted/replaced tag
+    """
+    if _PENDING_INDENTATION.get() is not None:
+        #The indentation is done by the outermost context
+        yield
+        return
+
+    pending: dict[int, XMLLike] = {}
+    token = _PENDING_INDENTATION.set(pending)
+    try:
+        yield
+    finally:
+        _PENDING_INDENTATION.reset(token)
+    for xmltree in pending.values():
+        etree.indent(xmltree)
+
+
+def _indent(xmltree: XMLLike) -> None:
+    """
+    Indent the given XML tree or defer it if inside :py:func:`deferred_indentation()`
+    """
+    pending = _PENDING_INDENTATION.get()
+    if pending is None:
+        etree.indent(xmltree)
+    else:
+        pending[id(xmltree)] = xmltree
+
 
 def xml_replace_tag(xmltree: XMLLike,
                     xpath: XPathLike,
@@ -70,8 +145,9 @@ def xml_replace_tag(xmltree: XMLLike,
         index = parent.index(node)
         parent.remove(node)
         parent.insert(index, copy.deepcopy(element))
+        record_modification(parent)
 
-    etree.indent(xmltree)
+    _indent(xmltree)
     return xmltree
 
 
@@ -111,6 +187,7 @@ def xml_delete_att(xmltree: XMLLike,
 
     for node in nodes:
         node.attrib.pop(name, '')
+    record_modification(*nodes)
 
     return xmltree
 
@@ -150,14 +227,15 @@ def xml_delete_tag(xmltree: XMLLike, xpath: XPathLike, occurrences: int | Iterab
         if parent is None:
             raise ValueError('Could not find parent of node')
         parent.remove(node)
+        record_modification(parent)
 
-    etree.indent(xmltree)
+    _indent(xmltree)
     return xmltree
 
 
 def _reorder_tags(node: etree._Element, tag_order: list[str]) -> etree._Element:
     """
-    Order the children of the given node into the given order
+    Order the children of the given node into the given order (in place)
 
     Prerequisites for this function:
         - We already know that all nodes on the node are valid in the order
@@ -167,27 +245,15 @@ def _reorder_tags(node: etree._Element, tag_order: list[str]) -> etree._Element:
 
     :returns: The reordered node
     """
-    import copy
+    order_index: dict[str, int] = {}
+    for index, tag in enumerate(tag_order):
+        order_index.setdefault(tag, index)
 
-    ordered_node = copy.deepcopy(node)
-
-    #Remove all child nodes from new_tag (deepcopied so they are still on node)
-    for child in ordered_node.iterchildren():
-        ordered_node.remove(child)
-
-    for tag in tag_order:
-        #Iterate over all children with the given tag on the node and append to the new_tag
-        for child in node.iterchildren(tag=tag):
-            ordered_node.append(child)
-
-    #Now replace the node with the reordered node
-    parent = node.getparent()
-    if parent is None:
-        raise ValueError('Could not find parent of node')
-    index = parent.index(node)
-    parent.remove(node)
-    parent.insert(index, ordered_node)
-    return ordered_node
+    #sorted is stable, so the order of tags with the same name is kept
+    #Tags not in the order are removed
+    node[:] = sorted((child for child in node if child.tag in order_index), key=lambda child: order_index[child.tag])
+    record_modification(node)
+    return node
 
 
 def xml_create_tag(xmltree: XMLLike,
@@ -223,6 +289,7 @@ def xml_create_tag(xmltree: XMLLike,
     :returns: xmltree with created tags
     """
     import copy
+    from itertools import groupby
     from more_itertools import unique_justseen
 
     if not etree.iselement(element):
@@ -251,33 +318,54 @@ def xml_create_tag(xmltree: XMLLike,
         except IndexError as exc:
             raise ValueError('Wrong value for occurrences') from exc
 
+    if tag_order is not None:
+        try:
+            tag_index = tag_order.index(element_name)
+        except ValueError as exc:
+            raise ValueError(f"The tag '{element_name}' was not found in the order list. "
+                             f'Allowed tags are: {tag_order}') from exc
+
+        order_index: dict[Any, int] = {}
+        for index, tag in enumerate(tag_order):
+            order_index.setdefault(tag, index)
+
     for parent in parent_nodes:
         element_to_write: etree._Element = copy.deepcopy(element)
         if tag_order is not None:
-            try:
-                tag_index = tag_order.index(element_name)
-            except ValueError as exc:
-                raise ValueError(f"The tag '{element_name}' was not found in the order list. "
-                                 f'Allowed tags are: {tag_order}') from exc
-
-            behind_tags = tag_order[:tag_index]
-
             child_tags = [child.tag for child in parent.iterchildren()]
 
-            #This ignores serial duplicates. With this out of order tags will be obvious e.g ['ldaU', 'lo','lo', 'ldaU']
-            #will result in ['ldaU', 'lo', 'ldaU']
-            existing_order = list(unique_justseen(child_tags))
+            #Single pass over the runs of the same tag to determine the position of the new element
+            #(behind all tags before it in the order) and check the existing order
+            insert_index = 0
+            previous_index = 0
+            misordered = False
+            tag_exists = False
+            extra_tags = set()
+            for tag, run in groupby(child_tags):
+                child_index = order_index.get(tag)
+                if child_index is None:
+                    extra_tags.add(tag)
+                    continue
+                if child_index < previous_index:
+                    misordered = True
+                previous_index = child_index
+                if child_index < tag_index:
+                    insert_index += len(list(run))
+                elif child_index == tag_index:
+                    tag_exists = True
 
             #Does the input file have unknown tags
-            extra_tags = set(existing_order).difference(set(tag_order))
             if extra_tags:
                 raise ValueError(f'Did not find existing elements in the tag_order list: {extra_tags}')
 
-            if element_name in existing_order and not several:
+            if tag_exists and not several:
                 raise ValueError(f'The given tag {element_name} is not allowed to appear multiple times')
 
             #Is the existing order in line with the given tag_order
-            if sorted(existing_order, key=tag_order.index) != existing_order:
+            if misordered:
+                #This ignores serial duplicates. With this out of order tags will be obvious e.g ['ldaU', 'lo','lo', 'ldaU']
+                #will result in ['ldaU', 'lo', 'ldaU']
+                existing_order = list(unique_justseen(child_tags))
                 if not correct_order:
                     raise ValueError('Existing order does not correspond to tag_order list\n'
                                      f'Expected order: {tag_order}\n'
@@ -288,23 +376,12 @@ def xml_create_tag(xmltree: XMLLike,
                               f'Actual order: {existing_order}')
                 parent = _reorder_tags(parent, tag_order)
 
-            for tag in reversed(behind_tags):
-                existing_tags = list(parent.iterchildren(tag=tag))
-
-                if len(existing_tags) != 0:
-                    insert_index = parent.index(existing_tags[-1]) + 1
-                    try:
-                        parent.insert(insert_index, element_to_write)
-                    except ValueError as exc:
-                        raise ValueError(f"Failed to insert element '{element_name}' behind '{tag}' tag") from exc
-                    break
-
-            else:  #This is the construct for reaching the end of the loop without breaking
-                try:
-                    parent.insert(0, element_to_write)
-                except ValueError as exc:
-                    raise ValueError(
-                        f"Failed to insert element '{element_name}' at the beginning of the order") from exc
+            #In the correct order all tags before the new element come first
+            try:
+                parent.insert(insert_index, element_to_write)
+            except ValueError as exc:
+                raise ValueError(
+                    f"Failed to insert element '{element_name}' at the position given by the order") from exc
 
         elif place_index is not None:
             #We just try to insert the new element at the index
@@ -319,8 +396,9 @@ def xml_create_tag(xmltree: XMLLike,
                 parent.append(element_to_write)
             except ValueError as exc:
                 raise ValueError(f"Failed to append element '{element_name}' to the parent '{parent.tag}'") from exc
+        record_modification(parent)
 
-    etree.indent(xmltree)
+    _indent(xmltree)
     return xmltree
 
 
@@ -374,6 +452,7 @@ def xml_set_attrib_value_no_create(xmltree: XMLLike,
 
     for node, val in zip(nodes, value):
         node.set(name, val)
+    record_modification(*nodes)
 
     return xmltree
 
@@ -424,5 +503,6 @@ def xml_set_text_no_create(xmltree: XMLLike,
 
     for node, text_val in zip(nodes, text):
         node.text = text_val
+    record_modification(*nodes)
 
     return xmltree
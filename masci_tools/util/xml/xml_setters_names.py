@@ -702,6 +702,7 @@ def clone_species(xmltree: XMLLike,
     """
     from masci_tools.util.schema_dict_util import evaluate_attribute
     from masci_tools.util.xml.common_functions import eval_xpath_one
+    from masci_tools.util.xml.xml_setters_basic import record_modification
     import copy
 
     existing_names = set(evaluate_attribute(xmltree, schema_dict, 'name', contains='species', list_return=True))
@@ -722,6 +723,7 @@ def clone_species(xmltree: XMLLike,
     new_species = copy.deepcopy(old_species)
     new_species.set('name', new_name)
     parent.append(new_species)
+    record_modification(parent)
 
     if changes is not None:
         xmltree = set_species(xmltree, schema_dict, new_name, changes)
@@ -1132,6 +1134,73 @@ def set_xcfunctional(xmltree: XMLLike,
     return set_complex_tag(xmltree, schema_dict, 'xcFunctional', changes)
 
 
+def _create_kpoint_elements(schema_dict: fleur_schema.SchemaDict,
+                            kpoints: Iterable[Iterable[float]],
+                            weights: Iterable[float],
+                            special_labels: dict[int, str] | None = None) -> list[etree._Element] | None:
+    """
+    Create the kPoint elements for numerical kpoints and weights directly. The schema information
+    is only looked up once and the coordinates of all kpoints are formatted in one go
+    (same format as :py:func:`~masci_tools.util.xml.converters.convert_to_xml()`)
+
+    :param schema_dict: InputSchemaDict containing all information about the structure of the input
+    :param kpoints: list or array containing the **relative** coordinates of the kpoints
+    :param weights: list or array containing the weights of the kpoints
+    :param special_labels: dict mapping indices to labels
+
+    :returns: list of the kPoint elements or None if the kpoints/weights cannot be
+              converted this way (e.g. expressions as coordinates)
+    """
+    from masci_tools.util.xml.converters import convert_to_xml
+    import numpy as np
+
+    if special_labels is None:
+        special_labels = {}
+
+    kpoints_array = np.asarray(kpoints)
+    weights_array = np.asarray(weights)
+    if kpoints_array.dtype.kind not in 'biuf' or weights_array.dtype.kind not in 'biuf':
+        return None
+    if kpoints_array.ndim != 2 or weights_array.ndim != 1:
+        return None
+
+    tag_info = schema_dict.tag_info('kPoint')
+    tag_name = tag_info['name']
+    dimension = kpoints_array.shape[1]
+    text_definitions = schema_dict['text_types'].get(tag_name, [])
+    weight_definitions = schema_dict['attrib_types'].get('weight', [])
+    if any(definition.base_type not in ('float', 'float_expression') or definition.length != dimension
+           for definition in text_definitions) or not text_definitions:
+        return None
+    if any(definition.base_type not in ('float', 'float_expression') or definition.length != 1
+           for definition in weight_definitions) or not weight_definitions:
+        return None
+    if 'weight' not in tag_info['attribs'] or (special_labels and 'label' not in tag_info['attribs']):
+        return None
+
+    weight_name = tag_info['attribs'].original_case['weight']
+    label_name = tag_info['attribs'].original_case['label'] if special_labels else None
+
+    nkpts = len(kpoints_array)
+    text_format = ' '.join(['%16.13f'] * dimension)
+    texts = ('\n'.join([text_format] * nkpts) % tuple(kpoints_array.ravel().tolist())).split('\n')
+    weight_texts = ('\n'.join(['%.10f'] * nkpts) % tuple(weights_array.tolist())).split('\n')
+
+    elements = []
+    for indx, (text, weight) in enumerate(zip(texts, weight_texts)):
+        attrib = {weight_name: weight}
+        if indx in special_labels:
+            label = special_labels[indx]
+            if not isinstance(label, str):
+                label, _ = convert_to_xml(label, schema_dict, label_name)
+            attrib[label_name] = label
+        element = etree.Element(tag_name, attrib)
+        element.text = text
+        elements.append(element)
+
+    return elements
+
+
 @schema_dict_version_dispatch(output_schema=False)
 def set_kpointlist(xmltree: XMLLike,
                    schema_dict: fleur_schema.SchemaDict,
@@ -1197,13 +1266,15 @@ def set_kpointlist(xmltree: XMLLike,
 
     E = FleurElementMaker(schema_dict)
 
-    new_kpointset = E.kpointlist(*(E.kpoint(kpoint, weight=weight, label=special_labels[indx])
-                                   if indx in special_labels else E.kpoint(kpoint, weight=weight)
-                                   for indx, (kpoint, weight) in enumerate(zip(kpoints, weights))),
-                                 name=name,
-                                 count=nkpts,
-                                 type=kpoint_type,
-                                 **additional_attributes)
+    kpoint_elements = _create_kpoint_elements(schema_dict, kpoints, weights, special_labels=special_labels)
+    if kpoint_elements is None:
+        kpoint_elements = [
+            E.kpoint(kpoint, weight=weight, label=special_labels[indx])
+            if indx in special_labels else E.kpoint(kpoint, weight=weight)
+            for indx, (kpoint, weight) in enumerate(zip(kpoints, weights))
+        ]
+
+    new_kpointset = E.kpointlist(*kpoint_elements, name=name, count=nkpts, type=kpoint_type, **additional_attributes)
 
     xmltree = create_tag(xmltree, schema_dict, new_kpointset)
     if switch:
@@ -1237,6 +1308,7 @@ def set_kpointlist_max4(xmltree: XMLLike,
     """
     from masci_tools.util.xml.builder import FleurElementMaker
     from masci_tools.util.schema_dict_util import eval_simple_xpath
+    from masci_tools.util.xml.xml_setters_basic import record_modification
     import numpy as np
 
     if not isinstance(kpoints, (list, np.ndarray)) or not isinstance(weights, (list, np.ndarray)):
@@ -1255,14 +1327,15 @@ def set_kpointlist_max4(xmltree: XMLLike,
     for child in bzintegration_tag.iterchildren():
         if 'kPoint' in child.tag:
             bzintegration_tag.remove(child)
+    record_modification(bzintegration_tag)
 
     E = FleurElementMaker(schema_dict)
 
-    new_kpointset = E.kpointlist(*(E.kpoint(kpoint, weight=weight) for kpoint, weight in zip(kpoints, weights)),
-                                 posscale=1,
-                                 weightscale=1,
-                                 count=nkpts,
-                                 **additional_attributes)
+    kpoint_elements = _create_kpoint_elements(schema_dict, kpoints, weights)
+    if kpoint_elements is None:
+        kpoint_elements = [E.kpoint(kpoint, weight=weight) for kpoint, weight in zip(kpoints, weights)]
+
+    new_kpointset = E.kpointlist(*kpoint_elements, posscale=1, weightscale=1, count=nkpts, **additional_attributes)
 
     xmltree = create_tag(xmltree, schema_dict, new_kpointset, not_contains='altKPoint')
 
@@ -1346,6 +1419,7 @@ def set_nkpts_max4(xmltree: XMLLike, schema_dict: fleur_schema.SchemaDict, count
     :returns: an xmltree of the inp.xml file with changes.
     """
     from masci_tools.util.schema_dict_util import eval_simple_xpath, tag_exists
+    from masci_tools.util.xml.xml_setters_basic import record_modification
 
     if not tag_exists(xmltree, schema_dict, 'kPointCount', not_contains='altKPoint'):
         bzintegration_tag: etree._Element = eval_simple_xpath(xmltree, schema_dict, 'bzIntegration')  #type:ignore
@@ -1353,6 +1427,7 @@ def set_nkpts_max4(xmltree: XMLLike, schema_dict: fleur_schema.SchemaDict, count
         for child in bzintegration_tag.iterchildren():
             if 'kPoint' in child.tag:
                 bzintegration_tag.remove(child)
+        record_modification(bzintegration_tag)
 
         xmltree = create_tag(xmltree, schema_dict, 'kPointCount', not_contains='altKPoint')
 
@@ -37,10 +37,21 @@ __all__ = (
     'spinpol_bands',
     'scatter',
     'line',
+    'lttb_indices',
+    'downsample_bands',
+    'downsample_curves',
 )
 
 _DEFAULT_BACKEND = 'mpl'
 
+LEVEL_OF_DETAIL_DEFAULTS = {
+    'max_points': 500,
+    'weight_threshold': None,
+    'rasterize': True,
+    'rasterize_threshold': 20000,
+}
+"""Default options for the ``level_of_detail`` argument of the bandstructure and DOS plots"""
+
 
 def set_default_backend(backend):
     """
@@ -235,7 +246,293 @@ def get_plotter(backend=None):
     raise NotImplementedError()
 
 
-def dos(energy_grid, dos_data, backend=None, data=None, **kwargs):
+def _lttb_rows(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling applied to each row of the given
+    2D arrays at once. The x values of each row have to be sorted
+
+    :param x: 2D array of the x values (one curve per row)
+    :param y: 2D array of the y values (one curve per row)
+    :param n_out: number of points to select for each row (>= 3 and smaller than the number of columns)
+
+    :returns: 2D array of the selected indices for each row
+    """
+    import numpy as np
+
+    n_rows, length = x.shape
+    rows = np.arange(n_rows)
+    #n_out-2 buckets between the fixed first and last point
+    edges = np.linspace(1, length - 1, n_out - 1).astype(int)
+
+    selected = np.empty((n_rows, n_out), dtype=int)
+    selected[:, 0] = 0
+    selected[:, -1] = length - 1
+
+    previous = np.zeros(n_rows, dtype=int)
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = length - 1, length
+
+        avg_x = x[:, next_start:next_end].mean(axis=1)
+        avg_y = y[:, next_start:next_end].mean(axis=1)
+        prev_x = x[rows, previous]
+        prev_y = y[rows, previous]
+
+        area = np.abs((prev_x - avg_x)[:, np.newaxis] * (y[:, start:end] - prev_y[:, np.newaxis]) -
+                      (prev_x[:, np.newaxis] - x[:, start:end]) * (avg_y - prev_y)[:, np.newaxis])
+        previous = start + np.argmax(area, axis=1)
+        selected[:, bucket + 1] = previous
+
+    return selected
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Downsample a curve with the Largest-Triangle-Three-Buckets algorithm, which keeps
+    the visual shape of the curve. The first and last point are always kept
+
+    :param x: arraylike of the x values (sorted)
+    :param y: arraylike of the y values
+    :param n_out: int, number of points to keep
+
+    :returns: array of the sorted indices of the selected points
+    """
+    import numpy as np
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if n_out >= len(x) or n_out < 3:
+        return np.arange(len(x))
+    return _lttb_rows(x[np.newaxis, :], y[np.newaxis, :], n_out)[0]
+
+
+def downsample_bands(kpath,
+                     eigenvalues,
+                     band_index,
+                     max_points=LEVEL_OF_DETAIL_DEFAULTS['max_points'],
+                     special_kpoints=None,
+                     weights=None,
+                     weight_threshold=None):
+    """
+    Select the points of a bandstructure to plot, reducing each band to at most
+    (roughly) `max_points` points with the Largest-Triangle-Three-Buckets algorithm.
+    The minimum and maximum of each band and the points at the special kpoints are always kept.
+    Bands with the same number of points are processed together
+
+    :param kpath: arraylike of the kpoint data
+    :param eigenvalues: arraylike of the eigenvalues
+    :param band_index: arraylike of the band index of each eigenvalue
+    :param max_points: int, number of points to select for each band
+    :param special_kpoints: list of tuples (str, float) of the special kpoints to keep
+    :param weights: optional arraylike of the weights for each eigenvalue
+    :param weight_threshold: float, if given together with weights, all points with a weight smaller than
+                             this fraction of the maximum weight are removed
+
+    :returns: array of the sorted indices of the selected points
+    """
+    import numpy as np
+
+    kpath = np.asarray(kpath, dtype=float)
+    eigenvalues = np.asarray(eigenvalues, dtype=float)
+    band_index = np.asarray(band_index)
+
+    order = np.lexsort((kpath, band_index))
+    _, band_start, band_length = np.unique(band_index[order], return_index=True, return_counts=True)
+
+    special_positions = [position for _, position in special_kpoints or []]
+
+    selected = []
+    for length in np.unique(band_length):
+        #All bands with this number of points as rows of a 2D array
+        starts = band_start[band_length == length]
+        indices = order[starts[:, np.newaxis] + np.arange(length)]
+        if length <= max_points or max_points < 3:
+            selected.append(indices.ravel())
+            continue
+
+        x, y = kpath[indices], eigenvalues[indices]
+        positions = [
+            _lttb_rows(x, y, max_points),
+            np.argmin(y, axis=1)[:, np.newaxis],
+            np.argmax(y, axis=1)[:, np.newaxis]
+        ]
+        positions.extend(np.argmin(np.abs(x - position), axis=1)[:, np.newaxis] for position in special_positions)
+        positions = np.concatenate(positions, axis=1)
+        selected.append(np.take_along_axis(indices, positions, axis=1).ravel())
+
+    selected = np.unique(np.concatenate(selected))
+
+    if weights is not None and weight_threshold is not None:
+        weights = np.asarray(weights, dtype=float)
+        selected = selected[weights[selected] >= weight_threshold * np.nanmax(weights)]
+
+    return selected
+
+
+def downsample_curves(x, curves, max_points=LEVEL_OF_DETAIL_DEFAULTS['max_points']):
+    """
+    Select the points to plot for curves sharing the same x values (e.g. DOS components)
+    with the Largest-Triangle-Three-Buckets algorithm. The union of the points selected
+    for each curve and their minima and maxima is returned
+
+    :param x: arraylike of the shared x values (sorted)
+    :param curves: list of arraylikes with the y values of each curve
+    :param max_points: int, number of points to select for each curve
+
+    :returns: array of the sorted indices of the selected points
+    """
+    import numpy as np
+
+    x = np.asarray(x, dtype=float)
+    if len(x) <= max_points or max_points < 3:
+        return np.arange(len(x))
+
+    y = np.array([np.asarray(curve, dtype=float) for curve in curves])
+    x = np.broadcast_to(x, y.shape)
+    positions = [_lttb_rows(x, y, max_points).ravel(), np.argmin(y, axis=1), np.argmax(y, axis=1)]
+    return np.unique(np.concatenate(positions))
+
+
+def _level_of_detail_options(level_of_detail):
+    """
+    Get the options for the level of detail stage from the given argument
+    (None/False for disabled, True for the defaults or a dict with options)
+    """
+    if not level_of_detail:
+        return None
+    options = LEVEL_OF_DETAIL_DEFAULTS.copy()
+    if isinstance(level_of_detail, dict):
+        unknown = level_of_detail.keys() - options.keys()
+        if unknown:
+            raise ValueError(f'Unknown options for level_of_detail: {sorted(unknown)}. '
+                             f'Valid are: {sorted(options.keys())}')
+        options.update(level_of_detail)
+    return options
+
+
+def _get_column(arg, data):
+    """
+    Get the data for a data argument (key into data or arraylike) as a numpy array
+    """
+    import numpy as np
+
+    if isinstance(arg, str):
+        if data is None:
+            raise ValueError(f'No data given to get the entry {arg}')
+        return np.asarray(data[arg])
+    return np.asarray(arg)
+
+
+def _get_columns(arg, data):
+    """
+    Get the data for a data argument, which can contain multiple entries as a list of numpy arrays
+    """
+    import numpy as np
+
+    if isinstance(arg, (list, tuple)) and any(isinstance(entry, str) or np.ndim(entry) > 0 for entry in arg):
+        return [_get_column(entry, data) for entry in arg]
+    return [_get_column(arg, data)]
+
+
+def _select_points(indices, n_points, data, args, kwargs):
+    """
+    Select the given points from the data source and all arraylike data arguments
+
+    :returns: tuple of the selected data, args and kwargs
+    """
+    import numpy as np
+    import pandas as pd
+
+    def select(arg):
+        if isinstance(arg, (list, tuple)) and any(isinstance(entry, str) or np.ndim(entry) > 0 for entry in arg):
+            return [select(entry) for entry in arg]
+        if arg is None or isinstance(arg, str) or np.ndim(arg) == 0:
+            return arg
+        if len(arg) != n_points:
+            return arg
+        return np.asarray(arg)[indices]
+
+    if isinstance(data, pd.DataFrame):
+        data = data.iloc[indices].reset_index(drop=True)
+    elif isinstance(data, dict):
+        data = {key: select(value) for key, value in data.items()}
+    elif data is not None:
+        raise ValueError(f'level_of_detail is not supported for data of type {type(data)}')
+
+    args = [select(arg) for arg in args]
+    kwargs = {key: select(value) if key in ('size_data', 'color_data', 'band_index') else value \
+        for key, value in kwargs.items()}
+    return data, args, kwargs
+
+
+def _reduce_bands(kpath, eigenvalues, backend, data, options, kwargs):
+    """
+    Apply the level of detail stage to the arguments of a (spin-polarized) bandstructure plot
+
+    :returns: tuple of the selected data, positional arguments and kwargs
+    """
+    import numpy as np
+
+    if kwargs.get('band_index') is None:
+        raise ValueError('The band_index is needed for level_of_detail')
+
+    kpath_data = _get_column(kpath, data)
+    band_index = _get_column(kwargs['band_index'], data)
+    size_data = kwargs.get('size_data')
+
+    weights = [None] * len(eigenvalues)
+    if size_data is not None:
+        weights = _get_columns(size_data, data)
+        if len(weights) == 1:
+            weights = weights * len(eigenvalues)
+
+    indices = np.unique(
+        np.concatenate([
+            downsample_bands(kpath_data,
+                             _get_column(eigenvalue, data),
+                             band_index,
+                             max_points=options['max_points'],
+                             special_kpoints=kwargs.get('special_kpoints'),
+                             weights=weight,
+                             weight_threshold=options['weight_threshold'])
+            for eigenvalue, weight in zip(eigenvalues, weights)
+        ]))
+
+    data, args, kwargs = _select_points(indices, len(kpath_data), data, [kpath, *eigenvalues], kwargs)
+    kwargs = _rasterize_dense(backend, options, len(indices), kwargs)
+    return data, args, kwargs
+
+
+def _reduce_dos(energy_grid, dos_data, backend, data, options, kwargs):
+    """
+    Apply the level of detail stage to the arguments of a (spin-polarized) DOS plot
+
+    :returns: tuple of the selected data, positional arguments and kwargs
+    """
+    energy = _get_column(energy_grid, data)
+    curves = [curve for dos in dos_data for curve in _get_columns(dos, data)]
+
+    indices = downsample_curves(energy, curves, max_points=options['max_points'])
+
+    data, args, kwargs = _select_points(indices, len(energy), data, [energy_grid, *dos_data], kwargs)
+    kwargs = _rasterize_dense(backend, options, len(indices), kwargs)
+    return data, args, kwargs
+
+
+def _rasterize_dense(backend, options, n_points, kwargs):
+    """
+    Rasterize the plotted points for matplotlib if more than the
+    given threshold of points remain
+    """
+    if backend == PlotBackend.mpl and options['rasterize'] and n_points > options['rasterize_threshold']:
+        kwargs.setdefault('rasterized', True)
+    return kwargs
+
+
+def dos(energy_grid, dos_data, backend=None, data=None, level_of_detail=None, **kwargs):
     """
     Plot the provided data as a density of states (not spin-polarized). Can be done
     horizontally or vertical via the switch `xyswitch`
@@ -244,6 +541,9 @@ def dos(energy_grid, dos_data, backend=None, data=None, **kwargs):
     :param dos_data: data for all the DOS components to plot
     :param data: source for the data of the plot (optional) (pandas Dataframe for example)
     :param backend: name of the backend to use (uses a default if None is given)
+    :param level_of_detail: bool or dict, if given the DOS is downsampled before plotting
+                            (see :py:func:`downsample_curves()`). The options are given in
+                            ``LEVEL_OF_DETAIL_DEFAULTS`` (``max_points``, ``rasterize`` and ``rasterize_threshold``)
 
     Kwargs are passed on to the backend plotting functions:
 
@@ -259,10 +559,14 @@ def dos(energy_grid, dos_data, backend=None, data=None, **kwargs):
 
     backend = PlotBackend.from_str(backend)
 
+    options = _level_of_detail_options(level_of_detail)
+    if options is not None:
+        data, (energy_grid, dos_data), kwargs = _reduce_dos(energy_grid, [dos_data], backend, data, options, kwargs)
+
     return plot_funcs[backend](energy_grid, dos_data, data=data, **kwargs)
 
 
-def spinpol_dos(energy_grid, dos_data_up, dos_data_dn, backend=None, data=None, **kwargs):
+def spinpol_dos(energy_grid, dos_data_up, dos_data_dn, backend=None, data=None, level_of_detail=None, **kwargs):
     """
     Plot the provided data as a density of states (spin-polarized). Can be done
     horizontally or vertical via the switch `xyswitch`
@@ -272,6 +576,9 @@ def spinpol_dos(energy_grid, dos_data_up, dos_data_dn, backend=None, data=None,
     :param dos_data_dn: data for all the DOS components to plot for spin-down
     :param data: source for the data of the plot (optional) (pandas Dataframe for example)
     :param backend: name of the backend to use (uses a default if None is given)
+    :param level_of_detail: bool or dict, if given the DOS is downsampled before plotting
+                            (see :py:func:`downsample_curves()`). The options are given in
+                            ``LEVEL_OF_DETAIL_DEFAULTS`` (``max_points``, ``rasterize`` and ``rasterize_threshold``)
 
     Kwargs are passed on to the backend plotting functions:
 
@@ -287,10 +594,15 @@ def spinpol_dos(energy_grid, dos_data_up, dos_data_dn, backend=None, data=None,
 
     backend = PlotBackend.from_str(backend)
 
+    options = _level_of_detail_options(level_of_detail)
+    if options is not None:
+        data, (energy_grid, dos_data_up, dos_data_dn), kwargs = _reduce_dos(energy_grid, [dos_data_up, dos_data_dn],
+                                                                            backend, data, options, kwargs)
+
     return plot_funcs[backend](energy_grid, dos_data_up, dos_data_dn, data=data, **kwargs)
 
 
-def bands(kpath, eigenvalues, backend=None, data=None, **kwargs):
+def bands(kpath, eigenvalues, backend=None, data=None, level_of_detail=None, **kwargs):
     """
     Plot the provided data for a bandstructure (non spin-polarized)
     Non-weighted, weighted, as a line plot or scatter plot,
@@ -300,6 +612,10 @@ def bands(kpath, eigenvalues, backend=None, data=None, **kwargs):
     :param eigenvalues: data for the eigenvalues
     :param data: source for the data of the plot (optional) (pandas Dataframe for example)
     :param backend: name of the backend to use (uses a default if None is given)
+    :param level_of_detail: bool or dict, if given each band is downsampled before plotting
+                            (see :py:func:`downsample_bands()`, needs the ``band_index``). The options are given
+                            in ``LEVEL_OF_DETAIL_DEFAULTS`` (``max_points``, ``weight_threshold``, ``rasterize``
+                            and ``rasterize_threshold``)
 
     Kwargs are passed on to the backend plotting functions:
 
@@ -315,10 +631,14 @@ def bands(kpath, eigenvalues, backend=None, data=None, **kwargs):
 
     backend = PlotBackend.from_str(backend)
 
+    options = _level_of_detail_options(level_of_detail)
+    if options is not None:
+        data, (kpath, eigenvalues), kwargs = _reduce_bands(kpath, [eigenvalues], backend, data, options, kwargs)
+
     return plot_funcs[backend](kpath, eigenvalues, data=data, **kwargs)
 
 
-def spinpol_bands(kpath, eigenvalues_up, eigenvalues_dn, backend=None, data=None, **kwargs):
+def spinpol_bands(kpath, eigenvalues_up, eigenvalues_dn, backend=None, data=None, level_of_detail=None, **kwargs):
     """
     Plot the provided data for a bandstructure (spin-polarized)
     Non-weighted, weighted, as a line plot or scatter plot,
@@ -329,6 +649,10 @@ def spinpol_bands(kpath, eigenvalues_up, eigenvalues_dn, backend=None, data=None
     :param eigenvalues_dn: data for the eigenvalues for spin-down
     :param data: source for the data of the plot (optional) (pandas Dataframe for example)
     :param backend: name of the backend to use (uses a default if None is given)
+    :param level_of_detail: bool or dict, if given each band is downsampled before plotting
+                            (see :py:func:`downsample_bands()`, needs the ``band_index``). The options are given
+                            in ``LEVEL_OF_DETAIL_DEFAULTS`` (``max_points``, ``weight_threshold``, ``rasterize``
+                            and ``rasterize_threshold``)
 
     Kwargs are passed on to the backend plotting functions:
 
@@ -344,6 +668,11 @@ def spinpol_bands(kpath, eigenvalues_up, eigenvalues_dn, backend=None, data=None
 
     backend = PlotBackend.from_str(backend)
 
+    options = _level_of_detail_options(level_of_detail)
+    if options is not None:
+        data, (kpath, eigenvalues_up, eigenvalues_dn), kwargs = _reduce_bands(kpath, [eigenvalues_up, eigenvalues_dn],
+                                                                              backend, data, options, kwargs)
+
     return plot_funcs[backend](kpath, eigenvalues_up, eigenvalues_dn, data=data, **kwargs)
 
 
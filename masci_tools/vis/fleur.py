@@ -155,6 +155,74 @@ def plot_fleur_bands_characterize(bandsdata,
                             **kwargs)
 
 
+def _prepare_bands_data(bandsdata, bandsattributes, spinpol=True, only_spin=None):
+    """
+    Prepare the data for plotting a bandstructure as a dict of numpy arrays. The arrays
+    of the given data are reused without copying, where possible
+
+    Adds the index of the band for each eigenvalue (``band_index``) and, if spin-polarized data
+    should not be plotted spin-polarized, stacks the spin-down data below the spin-up data
+
+    :param bandsdata: dataset dict produced by the `FleurBands` recipe or a ``pd.DataFrame``
+    :param bandsattributes: attributes dict produced by the `FleurBands` recipe
+    :param spinpol: bool, if False spin-polarized data is stacked into the ``_up`` entries
+    :param only_spin: optional str, if given only the specified spin components are kept (as ``_up`` entries)
+
+    :returns: tuple of the dict with the data, the list of special kpoints (label and position)
+              and a bool, whether the data is spin-polarized
+    """
+    import numpy as np
+
+    nbands = bandsattributes['nbands']
+
+    if isinstance(bandsdata, pd.DataFrame):
+        data = {key: bandsdata[key].to_numpy() for key in bandsdata.columns}
+    else:
+        data = {key: np.asarray(value) for key, value in bandsdata.items()}
+
+    kpath = data['kpath']
+    special_kpoints = [
+        (label, kpath[k_index * nbands + 1])
+        for k_index, label in zip(bandsattributes['special_kpoint_indices'], bandsattributes['special_kpoint_labels'])
+    ]
+
+    band_index = np.arange(len(kpath)) % nbands
+
+    if only_spin is not None:
+        if only_spin not in ('up', 'down'):
+            raise ValueError(f'Invalid value for only spin {only_spin} (Valid are up or down)')
+
+        if not any(f'_{only_spin}' in key for key in data) or f'eigenvalues_{only_spin}' not in data:
+            raise ValueError(f'No data for spin {only_spin} available')
+
+        data = {key: value for key, value in data.items() if f'_{only_spin}' in key}
+        if only_spin == 'down':
+            data = {key.replace('_down', '_up'): value for key, value in data.items()}
+        data['kpath'] = kpath
+
+    spinpol_data = bandsattributes['spins'] == 2 and any('_down' in key for key in data)
+
+    if spinpol_data and not spinpol:
+        #Stack the _down entries below the _up entries
+        spin_up = {key: value for key, value in data.items() if key.endswith('_up')}
+        spin_dn = {key.replace('_down', '_up'): value for key, value in data.items() if key.endswith('_down')}
+        missing = np.full(len(kpath), np.nan)
+
+        stacked = {}
+        for key in dict.fromkeys([*spin_up, *spin_dn]):
+            stacked[key] = np.concatenate([spin_up.get(key, missing), spin_dn.get(key, missing)])
+        for key, value in data.items():
+            if key != 'kpath' and not key.endswith(('_up', '_down')):
+                stacked[key] = np.concatenate([value, value])
+        stacked['kpath'] = np.concatenate([kpath, kpath])
+        band_index = np.concatenate([band_index, band_index + nbands + 1])
+        data = stacked
+
+    data['band_index'] = band_index
+
+    return data, special_kpoints, spinpol_data
+
+
 def plot_fleur_bands(bandsdata, bandsattributes, spinpol=True, only_spin=None, backend=None, weight=None, **kwargs):
     """
     Plot the bandstructure previously extracted from a `banddos.hdf` via the
@@ -183,58 +251,12 @@ def plot_fleur_bands(bandsdata, bandsattributes, spinpol=True, only_spin=None, b
             'the plotting library to use', DeprecationWarning)
         backend = 'bokeh' if kwargs.pop('bokeh_plot') else 'matplotlib'
 
-    nbands = bandsattributes['nbands']
-
-    if not isinstance(bandsdata, pd.DataFrame):
-        bandsdata = pd.DataFrame(data=bandsdata)
-
-    special_kpoints = []
-    for k_index, label in zip(bandsattributes['special_kpoint_indices'], bandsattributes['special_kpoint_labels']):
-        special_kpoints.append((label, bandsdata['kpath'][(k_index * nbands) + 1]))
-
-    band_index = pd.Series(data=[index % nbands for index in range(len(bandsdata['kpath']))], name='band_index')
-    new_bandsdata = pd.concat([bandsdata, band_index], axis=1)
-    bandsdata = new_bandsdata
-
-    if only_spin is not None:
-        if only_spin not in ('up', 'down'):
-            raise ValueError(f'Invalid value for only spin {only_spin} (Valid are up or down)')
-
-        if not any(f'_{only_spin}' in key for key in bandsdata.keys()) or \
-           f'eigenvalues_{only_spin}' not in bandsdata.keys():
-            raise ValueError(f'No data for spin {only_spin} available')
-
-        bandsdata = bandsdata[[
-            key for key in bandsdata.keys() if f'_{only_spin}' in key or key in ('kpath', 'band_index')
-        ]]
-
-        if only_spin == 'down':
-            bandsdata = bandsdata.rename(columns={key: key.replace('_down', '_up') for key in bandsdata.columns})
-
-    spinpol_data = bandsattributes['spins'] == 2 and any('_down' in key for key in bandsdata.keys())
+    bandsdata, special_kpoints, spinpol_data = _prepare_bands_data(bandsdata,
+                                                                   bandsattributes,
+                                                                   spinpol=spinpol,
+                                                                   only_spin=only_spin)
 
     if spinpol_data and not spinpol:
-        #Concatenate the _up and _down columns
-        spin_up = bandsdata[[label for label in bandsdata.columns if label.endswith('_up')]]
-        spin_dn = bandsdata[[label for label in bandsdata.columns if label.endswith('_down')]]
-        rest = bandsdata[[label for label in bandsdata.columns if not label.endswith('_down') \
-                                                              and not label.endswith('_up') \
-                                                              and label not in ('kpath', 'band_index',)]]
-        kpath = bandsdata['kpath']
-        band_index = bandsdata['band_index']
-
-        spin_dn = spin_dn.rename(columns={key: key.replace('_down', '_up') for key in spin_dn.columns})
-
-        #Double kpath and extend spin up data
-        kpath = pd.concat([kpath, kpath], ignore_index=True)
-        band_index = pd.concat([band_index, band_index + nbands + 1], ignore_index=True)
-        complete_spin = pd.concat([spin_up, spin_dn], ignore_index=True)
-        rest = pd.concat([rest, rest], ignore_index=True)
-
-        #And now add the new kpath and overwrite bandsdata
-        new_bandsdata = pd.concat([complete_spin, kpath, band_index, rest], axis=1)
-        bandsdata = new_bandsdata
-
         if 'color_data' in kwargs:
             color_data = kwargs.pop('color_data')
             if isinstance(color_data[0], str):
@@ -447,7 +469,7 @@ def _process_dos_kwargs(ordered_keys, backend=None, **kwargs):
     ]
 
     for key, value in kwargs.items():
-        if params.is_general(key):
+        if params.is_general(key) or key == 'level_of_detail':
             continue
         if isinstance(value, dict):
             new_dict = value.copy()
@@ -2307,6 +2307,99 @@ def plot_one_element_corelv(corelevel_dict, element, compound='', axis=None, sav
     return ax
 
 
+CORELEVEL_PEAKFUNCTIONS = ('gaus', 'voigt', 'pseudo-voigt', 'lorentz', 'doniach-sunjic',
+                           'asymmetric_lorentz_gauss_conv')
+
+_CORELEVEL_CHUNK_ELEMENTS = 2**20
+
+
+def _evaluate_corelevel_peaks(x, positions, peakfunction, fwhm_g, fwhm_l, alpha_l, beta_l):
+    """
+    Evaluate the peak function for the given corelevel positions at once
+
+    :param x: array of the energies
+    :param positions: array of the positions of the peaks
+
+    :returns: 2D array with the peak for each position as rows. For the asymmetric
+              lorentzian the convolution with the gaussian is not yet done
+    """
+    xrow = x[np.newaxis, :]
+    mu = positions[:, np.newaxis]
+    if peakfunction == 'gaus':
+        return gaussian(xrow, fwhm_g, mu)
+    if peakfunction == 'voigt':
+        return voigt_profile(xrow, fwhm_g, fwhm_l, mu)  # different fwhn for g und l
+    if peakfunction == 'pseudo-voigt':
+        return pseudo_voigt_profile(xrow, fwhm_g, fwhm_l, mu)
+    if peakfunction == 'lorentz':
+        return lorentzian(xrow, fwhm_l, mu)
+    if peakfunction == 'doniach-sunjic':
+        return doniach_sunjic(xrow, scale=1.0, E_0=mu, gamma=fwhm_l, alpha=fwhm_g)
+    if peakfunction == 'asymmetric_lorentz_gauss_conv':
+        #Same split as in asymmetric_lorentz: The exponent alpha is used before
+        #the last point of the leading points smaller or equal to mu
+        above = x[np.newaxis, :] > mu
+        nleading = np.where(above.any(axis=1), np.argmax(above, axis=1), len(x))
+        split = np.maximum(nleading - 1, 0)
+        exponent = np.where(np.arange(len(x))[np.newaxis, :] < split[:, np.newaxis], alpha_l, beta_l)
+        return lorentzian_one(xrow, fwhm_l, mu)**exponent
+    raise ValueError(f'Given peakfunction type not known: {peakfunction}')
+
+
+def _corelevel_gauss_kernel(x, fwhm_g):
+    """
+    Gaussian used for the convolution in `asymmetric_lorentz_gauss_conv`
+    """
+    xstep = abs(round(x[-1] - x[-2], 6))
+    rangex = abs(x[-1] - x[0])
+    xgaus = np.arange(-rangex / 2.0, rangex / 2.0 + xstep, xstep)
+    return np.array(gauss_one(xgaus, fwhm_g, mu=0.0), dtype=np.float64)
+
+
+def _convolve_rows(data, kernel):
+    """
+    Convolve the last axis of the data with the kernel using a FFT. The result is
+    the same as ``np.convolve(row, kernel, mode='same')`` cut to the length of the row
+    """
+    from scipy.signal import fftconvolve
+
+    length = data.shape[-1]
+    full = fftconvolve(data, np.reshape(kernel, (1,) * (data.ndim - 1) + (-1,)), mode='full', axes=-1)
+    start = (min(length, len(kernel)) - 1) // 2
+    return full[..., start:start + length]
+
+
+def _corelevel_spectrum_fft(x, positions, weights, peak_args, grid_factor):
+    """
+    Construct the spectrum as the convolution of the line shape with the weighted positions
+    of the peaks (linearly distributed onto a grid `grid_factor` times finer than the given one)
+
+    :returns: array of the spectrum. For the asymmetric lorentzian the convolution
+              with the gaussian is not yet done
+    """
+    from scipy.signal import fftconvolve
+
+    steps = np.diff(x)
+    if len(x) < 2 or not np.allclose(steps, steps[0]):
+        raise ValueError("method='fft' is only possible for equidistant energy grids")
+    step = steps[0] / grid_factor
+
+    #Fractional indices of the peaks on the fine grid
+    #The grid is extended to contain all peaks
+    index = (positions - x[0]) / step
+    lower = np.floor(index).astype(int)
+    fraction = index - lower
+    offset = min(0, lower.min())
+    npoints = max((len(x) - 1) * grid_factor, lower.max() + 1) - offset + 1
+
+    sticks = np.bincount(lower - offset, weights * (1 - fraction), minlength=npoints) \
+           + np.bincount(lower - offset + 1, weights * fraction, minlength=npoints)
+
+    kernel = _evaluate_corelevel_peaks(np.arange(-npoints + 1, npoints) * step, np.zeros(1), *peak_args)[0]
+    spectrum = fftconvolve(sticks, kernel, mode='full')
+    return spectrum[npoints - 1 - offset + grid_factor * np.arange(len(x))]
+
+
 def construct_corelevel_spectrum(coreleveldict,
                                  natom_typesdict,
                                  exp_references=None,
@@ -2318,14 +2411,35 @@ def construct_corelevel_spectrum(coreleveldict,
                                  energy_grid=0.2,
                                  peakfunction='voigt',
                                  alpha_l=1.0,
-                                 beta_l=1.5):
+                                 beta_l=1.5,
+                                 method='direct',
+                                 single_peaks=True,
+                                 chunk_size=None,
+                                 grid_factor=10):
     """
     Constructrs a corelevel spectrum from a given corelevel dict
 
-    :params:
+    The peak functions are evaluated for many corelevels at once (in chunks of `chunk_size` peaks
+    to limit the memory usage)
+
+    :param method: str, either ``'direct'`` (evaluate the peak function for each corelevel) or ``'fft'``.
+                   Since all peaks have the same line shape, the spectrum is the convolution of the
+                   line shape with the weighted corelevel positions. With ``'fft'`` the positions are distributed
+                   onto a grid `grid_factor` times finer than the energy grid and convolved with the line shape
+                   using a FFT. This is much faster for many corelevels, but approximate (the error decreases
+                   with `grid_factor`). Only possible for equidistant energy grids
+    :param single_peaks: bool, if False the curves of the single peaks are not constructed
+                         (`ydata_single_all` is an empty list). The single peaks are always evaluated directly
+    :param chunk_size: int, number of peaks evaluated at once (by default chosen to keep the
+                       arrays below roughly 1 million entries)
+    :param grid_factor: int, refinement of the energy grid for ``method='fft'``
 
     :returns: list: [xdata_spec, ydata_spec, ydata_single_all, xdata_all, ydata_all, xdatalabel]
     """
+    if peakfunction not in CORELEVEL_PEAKFUNCTIONS:
+        raise ValueError(f'Given peakfunction type not known: {peakfunction}')
+    if method not in ('direct', 'fft'):
+        raise ValueError(f"Given method not known: {method}. Valid are 'direct' and 'fft'")
 
     if energy_range is None:
         energy_range = (None, None)
@@ -2382,43 +2496,34 @@ def construct_corelevel_spectrum(coreleveldict,
         xdata_spec = xspec
     else:
         xdata_spec = np.array(np.arange(xmin, xmax + energy_grid, energy_grid))
-    ydata_spec = np.zeros(len(xdata_spec), dtype=float)
-    ydata_single_all = []
-    for i, xpoint in enumerate(xdata_all):
-        if peakfunction == 'gaus':
-            data_f = np.array(gaussian(xdata_spec, fwhm_g, xpoint))  #, 1.0))
-        elif peakfunction == 'voigt':
-            data_f = np.array(voigt_profile(xdata_spec, fwhm_g, fwhm_l, xpoint))  # different fwhn for g und l
-        elif peakfunction == 'pseudo-voigt':
-            data_f = np.array(pseudo_voigt_profile(xdata_spec, fwhm_g, fwhm_l, xpoint))
-        elif peakfunction == 'lorentz':
-            data_f = np.array(lorentzian(xdata_spec, fwhm_l, xpoint))
-        elif peakfunction == 'doniach-sunjic':
-            data_f = np.array(doniach_sunjic(xdata_spec, scale=1.0, E_0=xpoint, gamma=fwhm_l, alpha=fwhm_g))
-        elif peakfunction == 'asymmetric_lorentz_gauss_conv':
-            #print(xpoint, xdata_spec)
-            data_f = np.array(
-                asymmetric_lorentz_gauss_conv(xdata_spec,
-                                              xpoint,
-                                              fwhm_g=fwhm_g,
-                                              fwhm_l=fwhm_l,
-                                              alpha=alpha_l,
-                                              beta=beta_l))
-        else:
-            raise ValueError(f'Given peakfunction type not known: {peakfunction}')
-
-        # sometimes we get a point to much if constructed from new mesh..
-        if len(ydata_spec) < len(data_f):
-            # TODO: further adjustments? we assume only one point difference
-            data_f = data_f[:-1]
-        #print('length', len(ydata_spec), len(data_f))
-        #gaus_f = lorentzian(xdata_spec, xpoint, 0.6, 100.0)
-        if peakfunction == 'doniach-sunjic':
-            ydata_spec = ydata_spec + ydata_all[i] * data_f
-            ydata_single_all.append(ydata_all[i] * data_f)
-        else:
-            ydata_spec = ydata_spec + ydata_all[i] * data_f
-            ydata_single_all.append(ydata_all[i] * data_f)
+
+    xgrid = np.asarray(xdata_spec, dtype=float)
+    positions = np.asarray(xdata_all, dtype=float)
+    weights = np.asarray(ydata_all, dtype=float)
+    peak_args = (peakfunction, fwhm_g, fwhm_l, alpha_l, beta_l)
+
+    if chunk_size is None:
+        chunk_size = max(1, _CORELEVEL_CHUNK_ELEMENTS // len(xgrid))
+
+    #For the asymmetric lorentzian the convolution with the gaussian is
+    #the same for all peaks, so it is done once for the whole spectrum
+    ydata_spec = np.zeros(len(xgrid), dtype=float)
+    ydata_single = np.empty((len(positions) if single_peaks else 0, len(xgrid)), dtype=float)
+    if single_peaks or method == 'direct':
+        for start in range(0, len(positions), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            peaks = weights[chunk, np.newaxis] * _evaluate_corelevel_peaks(xgrid, positions[chunk], *peak_args)
+            if method == 'direct':
+                ydata_spec += peaks.sum(axis=0)
+            if single_peaks:
+                if peakfunction == 'asymmetric_lorentz_gauss_conv':
+                    peaks = _convolve_rows(peaks, _corelevel_gauss_kernel(xgrid, fwhm_g))
+                ydata_single[chunk] = peaks
+
+    if method == 'fft':
+        ydata_spec = _corelevel_spectrum_fft(xgrid, positions, weights, peak_args, grid_factor)
+    if peakfunction == 'asymmetric_lorentz_gauss_conv':
+        ydata_spec = _convolve_rows(ydata_spec, _corelevel_gauss_kernel(xgrid, fwhm_g))
 
     # we scale after and not before, because the max intensity is not necessary
     # the number of electrons.
@@ -2426,10 +2531,9 @@ def construct_corelevel_spectrum(coreleveldict,
         y_valmax = max(ydata_spec)
         scalingfactor = scale_to / y_valmax
         ydata_spec = ydata_spec * scalingfactor
-        ydata_single_all_new = []
-        for ydata_single in ydata_single_all:
-            ydata_single_all_new.append(ydata_single * scalingfactor)
-        ydata_single_all = ydata_single_all_new
+        ydata_single *= scalingfactor
+
+    ydata_single_all = list(ydata_single)
 
     return [xdata_spec, ydata_spec, ydata_single_all, xdata_all, ydata_all, xdatalabel]
 
@@ -163,3 +163,26 @@ def test_list_versions():
     assert result.exception is None, f'An unexpected exception occurred: {result.exception}'
     assert 'Version  Input Schema available    Output Schema available' in result.output
     assert '0.33  True                      True' in result.output
+
+
+def test_build_cache(tmp_path, monkeypatch):
+    """
+    Test of the build-cache command
+    """
+    from masci_tools.cmdline.commands.fleur_schema import build_schema_cache
+    from masci_tools.io.parsers.fleur_schema import list_available_versions
+    from click.testing import CliRunner
+
+    monkeypatch.setenv('MASCI_TOOLS_SCHEMA_CACHE', str(tmp_path / 'default'))
+
+    runner = CliRunner()
+    args = ['--cache-dir', os.fspath(tmp_path / 'cache')]
+    result = runner.invoke(build_schema_cache, args)
+
+    print(result.output)
+    assert result.exception is None, f'An unexpected exception occurred: {result.exception}'
+    assert 'Created schema dictionaries for all available versions' in result.output
+    assert len(list(
+        (tmp_path / 'cache').glob('InputSchemaDict-*.pickle'))) == len(list_available_versions(output_schema=False))
+    assert len(list(
+        (tmp_path / 'cache').glob('OutputSchemaDict-*.pickle'))) == len(list_available_versions(output_schema=True))
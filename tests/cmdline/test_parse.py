@@ -40,6 +40,26 @@ def test_fleur_out_file():
     assert '"sum_of_eigenvalues": -316.377' in result.output
 
 
+@pytest.mark.parametrize('command, file_name', [('parse_inp_file', 'inp.xml'), ('parse_out_file', 'out.xml')])
+def test_fleur_file_profile(command, file_name):
+    """
+    Test of the --profile option of the parse inp-file/out-file commands
+    """
+    from masci_tools.cmdline.commands import parse
+    from click.testing import CliRunner
+
+    TEST_FILE = Path(__file__).parent.resolve() / Path(f'../files/fleur/Max-R5/SiLOXML/files/{file_name}')
+    runner = CliRunner()
+    args = [os.fspath(TEST_FILE), '--profile']
+    result = runner.invoke(getattr(parse, command), args)
+
+    print(result.output)
+    assert result.exception is None, f'An unexpected exception occurred: {result.exception}'
+    assert 'Parser timings:' in result.output
+    assert 'Total time:' in result.output
+    assert '"timings"' not in result.output
+
+
 def test_constants():
     """
     Test of the parse constants command
@@ -0,0 +1,89 @@
+"""
+Tests of the main cli group and the lazy loading of the subcommands
+"""
+from pathlib import Path
+import os
+import re
+import subprocess
+import sys
+import pytest
+
+TEST_FILES = Path(__file__).parent.resolve() / Path('../files/fleur/Max-R5/SiLOXML/files/')
+
+#Upper bound for the total import time (s) of the parse commands
+IMPORT_TIME_LIMIT = 0.4
+
+#Modules, which should not be imported by the parse commands
+HEAVY_MODULES = ('matplotlib', 'bokeh', 'pandas', 'scipy', 'h5py', 'ase', 'pymatgen', 'click_completion',
+                 'masci_tools.vis', 'masci_tools.tools')
+
+
+def test_lazy_subcommands():
+    """
+    Test that all lazy subcommands of the cli can be loaded
+    """
+    import click
+    from masci_tools.cmdline.commands.root import cli, SUBCOMMANDS
+
+    ctx = click.Context(cli)
+    assert cli.list_commands(ctx) == sorted(SUBCOMMANDS)
+    for name in SUBCOMMANDS:
+        command = cli.get_command(ctx, name)
+        assert isinstance(command, click.Command)
+        assert command.name == name
+    assert cli.get_command(ctx, 'non-existent') is None
+
+
+def test_lazy_subcommand_invoke():
+    """
+    Test invoking a lazy subcommand via the main cli
+    """
+    from masci_tools.cmdline.commands.root import cli
+    from click.testing import CliRunner
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['parse', 'fleur-modes', os.fspath(TEST_FILES / 'inp.xml')])
+
+    print(result.output)
+    assert result.exception is None, f'An unexpected exception occurred: {result.exception}'
+    assert '"bz_integration": "hist"' in result.output
+
+
+def _import_times(args):
+    """
+    Run the cli with the given arguments with ``python -X importtime``
+
+    :returns: dict with the cumulative import time (in s) of the imported modules
+              and the total import time
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'from masci_tools.cmdline.commands.root import cli; cli({args!r})'],
+        capture_output=True,
+        text=True,
+        check=True)
+
+    times, total = {}, 0.0
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \|( +)(\S+)', line)
+        if match is None:
+            continue
+        times[match.group(3)] = int(match.group(1)) / 1e6
+        if len(match.group(2)) == 1:
+            total += int(match.group(1)) / 1e6
+    return times, total
+
+
+@pytest.mark.parametrize('command, file_name', [('constants', 'inp.xml'), ('fleur-modes', 'inp.xml'),
+                                                ('inp-file', 'inp.xml'), ('out-file', 'out.xml')])
+def test_parse_import_time(command, file_name):
+    """
+    Test that the parse commands do not import unrelated (expensive) modules
+    """
+    args = ['parse', command, os.fspath(TEST_FILES / file_name)]
+
+    _import_times(args)  #Make sure that all bytecode is compiled
+    times, total = _import_times(args)
+
+    heavy = [name for name in times if any(name == module or name.startswith(f'{module}.') for module in HEAVY_MODULES)]
+    assert heavy == []
+    assert total < IMPORT_TIME_LIMIT
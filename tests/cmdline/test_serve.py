@@ -0,0 +1,146 @@
+"""
+Tests of the serve command and the client
+"""
+from pathlib import Path
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import pytest
+
+TEST_FILES = Path(__file__).parent.resolve() / Path('../files/fleur/Max-R5/SiLOXML/files/')
+
+
+def test_handle_request():
+    """
+    Test of running the commands of requests in the server process
+    """
+    from masci_tools.cmdline.commands.serve import handle_request
+
+    response = handle_request({'args': ['parse', 'constants', 'inp.xml'], 'cwd': os.fspath(TEST_FILES)})
+    assert response['exit_code'] == 0
+    assert json.loads(response['stdout'])['Pi'] == pytest.approx(3.14159265)
+
+    response = handle_request({'args': ['fleur-schema', 'validate-output', os.fspath(TEST_FILES / 'out.xml')]})
+    assert response['exit_code'] == 0
+    assert 'validates against the schema for version 0.34' in response['stdout']
+
+    response = handle_request({'args': ['parse', 'constants', 'missing.xml'], 'cwd': os.fspath(TEST_FILES)})
+    assert response['exit_code'] == 2
+    assert 'does not exist' in response['stderr']
+
+    response = handle_request({'args': ['fleur-schema', 'add', 'schema.xsd']})
+    assert response['exit_code'] == 2
+    assert 'is not supported by the server' in response['stderr']
+
+    response = handle_request({'args': 'parse constants inp.xml'})
+    assert response['exit_code'] == 2
+
+
+def test_serve_stdin():
+    """
+    Test of the serve command reading the requests from stdin
+    """
+    from masci_tools.cmdline.commands.serve import serve
+    from click.testing import CliRunner
+
+    requests = [{
+        'args': ['parse', 'fleur-modes', 'inp.xml'],
+        'cwd': os.fspath(TEST_FILES)
+    }, {
+        'args': ['parse', 'nkpts', os.fspath(TEST_FILES / 'inp.xml')]
+    }, {
+        'shutdown': True
+    }, {
+        'args': ['parse', 'constants', os.fspath(TEST_FILES / 'inp.xml')]
+    }]
+    lines = '\n'.join(json.dumps(request) for request in requests)
+
+    runner = CliRunner()
+    result = runner.invoke(serve, ['--no-warmup'], input=f'{lines}\nnot json\n')
+    assert result.exception is None, f'An unexpected exception occurred: {result.exception}'
+
+    responses = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(responses) == 3
+    assert [response['exit_code'] for response in responses] == [0, 0, 0]
+    assert '"bz_integration": "hist"' in responses[0]['stdout']
+    assert 'Number of k-points: 2' in responses[1]['stdout']
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='Unix sockets are not available')
+def test_serve_socket(tmp_path):
+    """
+    Test of the serve command listening on a Unix socket together with the client
+    """
+    from masci_tools.cmdline.client import main, send_request
+
+    socket_path = tmp_path / 'masci-tools.sock'
+    args = ['serve', '--no-warmup', '--socket', os.fspath(socket_path)]
+    server = subprocess.Popen(
+        [sys.executable, '-c', f'from masci_tools.cmdline.commands.root import cli; cli({args!r})'])
+    try:
+        for _ in range(100):
+            if socket_path.exists():
+                break
+            time.sleep(0.1)
+        assert socket_path.exists()
+
+        response = send_request(socket_path, {'args': ['parse', 'constants', os.fspath(TEST_FILES / 'inp.xml')]})
+        assert response['exit_code'] == 0
+        assert '"Bohr": 1.0' in response['stdout']
+
+        assert main(['--socket', os.fspath(socket_path), 'parse', 'nkpts', os.fspath(TEST_FILES / 'inp.xml')]) == 0
+        assert main(['--socket', os.fspath(socket_path), 'plot', 'fleur-bands', 'banddos.hdf']) == 2
+
+        assert main(['--socket', os.fspath(socket_path), '--shutdown']) == 0
+        assert server.wait(timeout=10) == 0
+        assert not socket_path.exists()
+    finally:
+        if server.poll() is None:
+            server.kill()
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='Unix sockets are not available')
+def test_parse_server_socket_path(tmp_path):
+    """
+    Test that the server does not remove existing files, which are not sockets,
+    and that the socket is only accessible for the current user
+    """
+    import stat
+    from masci_tools.cmdline.commands.serve import ParseServer
+
+    existing_file = tmp_path / 'existing.txt'
+    existing_file.write_text('content')
+    with pytest.raises(ValueError, match='exists and is not a socket'):
+        ParseServer(existing_file)
+    assert existing_file.read_text() == 'content'
+
+    socket_path = tmp_path / 'masci-tools.sock'
+    server = ParseServer(socket_path)
+    try:
+        assert stat.S_ISSOCK(socket_path.stat().st_mode)
+        assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+
+        #A stale socket (no server listening) is replaced
+        server.socket.close()
+        server = ParseServer(socket_path)
+        assert stat.S_ISSOCK(socket_path.stat().st_mode)
+    finally:
+        server.server_close()
+    assert not socket_path.exists()
+
+
+def test_client_without_server(tmp_path, capsys):
+    """
+    Test that the client runs the command itself if no server is available
+    """
+    from masci_tools.cmdline.client import main
+
+    exit_code = main(
+        ['--socket',
+         os.fspath(tmp_path / 'missing.sock'), 'parse', 'nkpts',
+         os.fspath(TEST_FILES / 'inp.xml')])
+    assert exit_code == 0
+    assert 'Number of k-points: 2' in capsys.readouterr().out
@@ -94,3 +94,19 @@ def disable_parser_tracebacks():
 
     inp_logger.removeFilter(traceback_filter)
     out_logger.removeFilter(traceback_filter)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def isolated_schema_cache(tmp_path_factory):
+    """Use a temporary directory for the persistent schema dictionary cache"""
+    from masci_tools.io.parsers.fleur_schema.schema_dict import SCHEMA_CACHE_ENV_VARIABLE
+
+    previous = os.environ.get(SCHEMA_CACHE_ENV_VARIABLE)
+    os.environ[SCHEMA_CACHE_ENV_VARIABLE] = os.fspath(tmp_path_factory.mktemp('schema_cache'))
+
+    yield  #Now all tests run
+
+    if previous is None:
+        os.environ.pop(SCHEMA_CACHE_ENV_VARIABLE)
+    else:
+        os.environ[SCHEMA_CACHE_ENV_VARIABLE] = previous
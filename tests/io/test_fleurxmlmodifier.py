@@ -526,3 +526,107 @@ def test_fleurxml_modifier_include_inpgen_comments(test_file, file_regression):
 
     assert len(add_files) == 0
     file_regression.check(etree.tostring(xmltree, encoding='unicode', pretty_print=True), extension='.xml')
+
+
+@pytest.mark.parametrize('processes', [None, 2])
+def test_fleurxml_modifier_modify_many(test_file, processes):
+    """Tests that modify_many gives the same results as modify_xmlfile for each variant"""
+
+    fm = FleurXMLModifier()
+    fm.set_inpchanges({'dos': True})
+
+    variants = []
+    for kmax in (3.5, 4.0):
+        for radius in (2.0, 2.2):
+            variant = FleurXMLModifier()
+            variant.set_inpchanges({'Kmax': kmax, 'Gmax': 3 * kmax})
+            variant.set_species('all', {'mtSphere': {'radius': radius}})
+            variants.append(variant)
+    variants.append([('set_inpchanges', {'changes': {'itmax': 5}})])
+
+    results = list(fm.modify_many(test_file(TEST_INPXML_COMMENT_PATH), variants, processes=processes))
+    assert len(results) == len(variants)
+
+    for (xmltree, add_files), variant in zip(results, variants):
+        if not isinstance(variant, FleurXMLModifier):
+            variant = FleurXMLModifier.fromList(variant)
+        expected = FleurXMLModifier.fromList([*fm.task_list, *variant.task_list])
+        expected_xmltree, expected_files = expected.modify_xmlfile(test_file(TEST_INPXML_COMMENT_PATH))
+
+        assert etree.tostring(xmltree) == etree.tostring(expected_xmltree)
+        assert add_files == expected_files
+
+
+@pytest.mark.parametrize('processes', [None, 2])
+def test_fleurxml_modifier_modify_many_invalid(test_file, processes):
+    """Tests that modify_many raises for invalid variants"""
+
+    fm = FleurXMLModifier()
+    fm.set_inpchanges({'dos': True})
+
+    variant = FleurXMLModifier()
+    variant.set_attrib_value('itmax', 'INVALID')
+
+    results = fm.modify_many(test_file(TEST_INPXML_PATH), [[], variant], processes=processes)
+    with pytest.raises(ValueError, match='Changes were not valid'):
+        list(results)
+
+    xmltrees = list(fm.modify_many(test_file(TEST_INPXML_PATH), [variant], validate_changes=False))
+    assert len(xmltrees) == 1
+
+
+TEST_INCREMENTAL_TASKS = [
+    [('set_inpchanges', {
+        'changes': {
+            'itmax': 5,
+            'Kmax': 4.0
+        }
+    })],
+    [('set_attrib_value', {
+        'name': 'itmax',
+        'value': 'INVALID'
+    })],
+    [('set_species', {
+        'species_name': 'all',
+        'attributedict': {
+            'mtSphere': {
+                'radius': 2.0
+            }
+        }
+    }), ('set_kpointlist', {
+        'kpoints': [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]],
+        'weights': [0.5, 0.5]
+    })],
+    [('xml_create_tag', {
+        'xpath': '/fleurInput/atomSpecies/species',
+        'element': 'INVALID_TAG'
+    })],
+    [('xml_create_tag', {
+        'xpath': '/fleurInput',
+        'element': 'INVALID_TAG'
+    })],
+    [('delete_tag', {
+        'tag_name': 'output'
+    })],
+]
+
+
+@pytest.mark.parametrize('task_list', TEST_INCREMENTAL_TASKS)
+@pytest.mark.parametrize('file_path', [TEST_INPXML_PATH, TEST_INPXML_COMMENT_PATH, TEST_INPXML_NEWER_PATH])
+def test_fleurxml_modifier_incremental_validation(test_file, task_list, file_path):
+    """Tests that the incremental validation gives the same results as validating the complete file"""
+    import warnings
+
+    fm = FleurXMLModifier.fromList(task_list)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        try:
+            expected_xmltree, _ = fm.modify_xmlfile(test_file(file_path))
+        except ValueError as exc:
+            with pytest.raises(ValueError, match='Changes were not valid') as exc_info:
+                fm.modify_xmlfile(test_file(file_path), incremental_validation=True)
+            assert str(exc_info.value) == str(exc)
+        else:
+            xmltree, _ = fm.modify_xmlfile(test_file(file_path), incremental_validation=True)
+            assert etree.tostring(xmltree) == etree.tostring(expected_xmltree)
@@ -88,6 +88,71 @@ def test_hdf5_reader_bands_specific_weight(data_regression, test_file):
     data_regression.check({'datasets': convert_to_pystd(data), 'attributes': convert_to_pystd(attrs)})
 
 
+@pytest.mark.parametrize('filename,recipe_name', [('banddos_bands.hdf', 'FleurBands'),
+                                                  ('banddos_spinpol_bands.hdf', 'FleurBands'),
+                                                  ('banddos_dos.hdf', 'FleurDOS'),
+                                                  ('banddos_spinpol_dos.hdf', 'FleurJDOS')])
+def test_hdf5_reader_lazy(test_file, filename, recipe_name):
+    """
+    Test that the lazy mode produces the same results
+    """
+    from masci_tools.io.parsers.hdf5 import HDF5Reader, LazyDataset
+    from masci_tools.io.parsers.hdf5 import recipes
+    import numpy as np
+
+    recipe = getattr(recipes, recipe_name)
+
+    with HDF5Reader(test_file(f'hdf5_reader/{filename}')) as reader:
+        data, attrs = reader.read(recipe=recipe)
+
+    with HDF5Reader(test_file(f'hdf5_reader/{filename}'), lazy=True) as reader:
+        lazy_data, lazy_attrs = reader.read(recipe=recipe)
+
+        assert lazy_data.keys() == data.keys()
+        assert lazy_attrs.keys() == attrs.keys()
+        assert any(isinstance(val, LazyDataset) for val in lazy_data.values())
+        for key, val in lazy_data.items():
+            if isinstance(val, LazyDataset):
+                assert val.shape == data[key].shape
+            assert np.allclose(np.asarray(val), data[key])
+
+    lazy_entry = next(val for val in lazy_data.values() if isinstance(val, LazyDataset))
+    with pytest.raises(ValueError, match='already closed'):
+        lazy_entry.load()
+
+
+def test_lazy_dataset(test_file):
+    """
+    Test of the deferred operations of the LazyDataset
+    """
+    from masci_tools.io.parsers.hdf5 import LazyDataset
+    import numpy as np
+    import h5py
+
+    with h5py.File(test_file('hdf5_reader/banddos_spinpol_bands.hdf'), 'r') as file:
+        dset = file['/Local/BS/eigenvalues']
+        reference = np.array(dset)
+
+        lazy = LazyDataset(dset)
+        assert lazy.shape == reference.shape
+
+        transformed = (2.0 * lazy - 1.0)[1]
+        #Indexing is applied before the elementwise operations
+        assert transformed._index == (1,)
+        assert transformed.shape == reference[1].shape
+        assert np.allclose(np.asarray(transformed), 2.0 * reference[1] - 1.0)
+
+        flat = lazy.flatten()[:5]
+        assert flat.shape == (5,)
+        assert np.allclose(np.asarray(flat), reference.flatten()[:5])
+
+        summed = LazyDataset.sum_datasets([lazy, lazy])[0]
+        assert summed.shape == reference[0].shape
+        assert np.allclose(np.asarray(summed), 2 * reference[0])
+
+        assert [entry.shape for entry in lazy] == [entry.shape for entry in reference]
+
+
 def test_hdf5_reader_fileobjects(test_file):
     """
     Test the opening and closing of the HDF5file with
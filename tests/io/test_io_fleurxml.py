@@ -223,3 +223,55 @@ def test_get_constants(load_inpxml, load_outxml):
 
     with pytest.raises(KeyError, match='Ambiguous definition of constant Pi'):
         result = get_constants(invalidxmltree, schema_dict)
+
+
+def test_read_outxml_header(test_file):
+    from masci_tools.io.fleur_xml import read_outxml_header, load_outxml, _get_outxml_versions
+    from masci_tools.util.xml.xml_getters import get_fleur_modes
+
+    TEST_OUTXML_PATH = test_file('fleur/Max-R5/SiLOXML/files/out.xml')
+
+    xmltree, schema_dict = load_outxml(TEST_OUTXML_PATH)
+
+    header = read_outxml_header(TEST_OUTXML_PATH)
+    assert header is not None
+    assert header.xpath('//iteration') == []
+    assert _get_outxml_versions(header) == ('0.34', '0.34')
+    assert get_fleur_modes(header, schema_dict) == get_fleur_modes(xmltree, schema_dict)
+
+    #Pass file handle (the position is restored)
+    with open(TEST_OUTXML_PATH, 'rb') as outfile:
+        header = read_outxml_header(outfile)
+        assert outfile.tell() == 0
+        content = outfile.read()
+    assert etree.tostring(header) == etree.tostring(read_outxml_header(TEST_OUTXML_PATH))
+
+    #Pass file content as bytes and string
+    assert etree.tostring(read_outxml_header(content)) == etree.tostring(header)
+    assert etree.tostring(read_outxml_header(content.decode('utf-8'))) == etree.tostring(header)
+
+    #Not possible for parsed trees and text mode file handles
+    assert read_outxml_header(xmltree) is None
+    with open(TEST_OUTXML_PATH, encoding='utf-8') as outfile:
+        assert read_outxml_header(outfile) is None
+        assert outfile.tell() == 0
+
+
+def test_context_fleur_modes(test_file):
+    from masci_tools.io.fleur_xml import read_outxml_header, load_outxml, FleurXMLContext
+    from masci_tools.util.xml.xml_getters import get_fleur_modes
+
+    TEST_OUTXML_PATH = test_file('fleur/Max-R5/SiLOXML/files/out.xml')
+
+    xmltree, schema_dict = load_outxml(TEST_OUTXML_PATH)
+    header = read_outxml_header(TEST_OUTXML_PATH)
+    expected_modes = get_fleur_modes(xmltree, schema_dict)
+
+    with FleurXMLContext(xmltree, schema_dict) as root:
+        assert root.fleur_modes == expected_modes
+
+    with FleurXMLContext(xmltree, schema_dict, header=header) as root:
+        fleur_modes = root.fleur_modes
+        assert fleur_modes == expected_modes
+        for iteration in root.iter('iteration'):
+            assert iteration.fleur_modes is fleur_modes
@@ -196,3 +196,23 @@ def test_inpxml_kpoint_labels(data_regression, clean_parser_log, test_file):
     #The parser shoul not raise and just log all the failed conversions
     inp_dict = inpxml_parser(INPXML_FILEPATH, parser_info_out=warnings)
     data_regression.check({'input_dict': inp_dict, 'warnings': clean_parser_log(warnings)})
+
+
+def test_inpxml_timings(test_file):
+    """
+    Test the recorded timings of the inpxml_parser
+    """
+
+    INPXML_FILEPATH = test_file('fleur/Max-R6/inp.xml')
+    warnings = {}
+    expected = inpxml_parser(INPXML_FILEPATH, parser_info_out=warnings)
+    assert 'timings' not in warnings
+
+    warnings = {}
+    inp_dict = inpxml_parser(INPXML_FILEPATH, parser_info_out=warnings, profile=True)
+    assert inp_dict == expected
+
+    timings = warnings['timings']
+    assert timings['total'] > 0
+    assert set(timings['phases']) == {'load', 'clear_xml', 'constants', 'validation', 'inpxml_todict'}
+    assert all(entry['calls'] == 1 for entry in timings['phases'].values())
@@ -697,3 +697,257 @@ def test_outxml_no_iterations(data_regression, test_file, clean_parser_log):
         'output_dict': out_dict,
         'warnings': clean_parser_log(warnings),
     })
+
+
+@pytest.mark.parametrize('iteration_to_parse', ['last', 'first', 'all', 3, -2])
+@pytest.mark.parametrize('file_name', [
+    'fleur/Max-R5/SiLOXML/files/out.xml',
+    'fleur/broken_out_xml/terminated.xml',
+    'fleur/broken_out_xml/terminated_firstit.xml',
+    'fleur/out_no_iterations.xml',
+])
+def test_outxml_streaming(test_file, file_name, iteration_to_parse):
+    """
+    Test that the streaming mode of the outxml_parser produces the same results
+    as parsing the complete file
+    """
+
+    OUTXML_FILEPATH = test_file(file_name)
+
+    try:
+        expected = outxml_parser(OUTXML_FILEPATH, iteration_to_parse=iteration_to_parse)
+    except ValueError:
+        with pytest.raises(ValueError):
+            outxml_parser(OUTXML_FILEPATH, iteration_to_parse=iteration_to_parse, streaming=True)
+    else:
+        out_dict = outxml_parser(OUTXML_FILEPATH, iteration_to_parse=iteration_to_parse, streaming=True)
+        assert out_dict == expected
+
+
+def test_outxml_streaming_file_handle(test_file):
+    """
+    Test the streaming mode of the outxml_parser with file handles and file content
+    """
+
+    OUTXML_FILEPATH = test_file('fleur/Max-R5/SiLOXML/files/out.xml')
+
+    expected = outxml_parser(OUTXML_FILEPATH, iteration_to_parse='all')
+
+    with open(OUTXML_FILEPATH, 'rb') as outfile:
+        out_dict = outxml_parser(outfile, iteration_to_parse='all', streaming=True)
+    assert out_dict == expected
+
+    with open(OUTXML_FILEPATH, 'rb') as outfile:
+        out_content = outfile.read()
+    out_dict = outxml_parser(out_content, iteration_to_parse='all', streaming=True)
+    assert out_dict == expected
+
+
+def test_outxml_parser_many(test_file):
+    """
+    Test that parsing multiple files in parallel gives the same results as
+    the outxml_parser for each file
+    """
+    from masci_tools.io.parsers.fleur import outxml_parser_many
+
+    files = [
+        test_file('fleur/Max-R5/SiLOXML/files/out.xml'),
+        test_file('fleur/Max-R5/FePt_film_SSFT_LO/files/out.xml'),
+        test_file('fleur/broken_out_xml/terminated.xml'),
+        test_file('fleur/Max-R5/GaAsMultiUForceXML/files/out.xml'),
+        test_file('fleur/Max-R5/CuBulkXML/files/out.xml'),
+    ]
+
+    results = list(
+        outxml_parser_many(files,
+                           workers=2,
+                           chunksize=2,
+                           iteration_to_parse='all',
+                           minimal_mode=True,
+                           schema_versions=['0.34']))
+
+    assert sorted(res[0] for res in results) == sorted(files)
+    for file, out_dict, parser_info_out in results:
+        expected_info = {}
+        expected = outxml_parser(file, parser_info_out=expected_info, iteration_to_parse='all', minimal_mode=True)
+        assert out_dict == expected
+        assert parser_info_out == expected_info
+
+
+def test_outxml_parser_many_errors(test_file):
+    """
+    Test the error handling of outxml_parser_many
+    """
+    from masci_tools.io.parsers.fleur import outxml_parser_many
+
+    files = [test_file('fleur/Max-R5/SiLOXML/files/out.xml'), test_file('fleur/Max-R5/SiLOXML/files/inp.xml')]
+
+    results = {
+        os.path.basename(file): (out_dict, parser_info_out)
+        for file, out_dict, parser_info_out in outxml_parser_many(files, workers=1, schema_versions=[])
+    }
+
+    assert results['out.xml'][0] != {}
+    assert not results['out.xml'][1]['parser_critical']
+    assert results['inp.xml'][0] == {}
+    assert len(results['inp.xml'][1]['parser_critical']) == 1
+
+    with pytest.raises(ValueError):
+        list(outxml_parser_many(files, workers=1, schema_versions=[], strict=True))
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_outxml_timings(test_file, streaming):
+    """
+    Test the recorded timings of the outxml_parser
+    """
+
+    OUTXML_FILEPATH = test_file('fleur/Max-R5/SiLOXML/files/out.xml')
+
+    warnings = {}
+    expected = outxml_parser(OUTXML_FILEPATH, iteration_to_parse='all', parser_info_out=warnings, streaming=streaming)
+    assert 'timings' not in warnings
+
+    warnings = {}
+    out_dict = outxml_parser(OUTXML_FILEPATH,
+                             iteration_to_parse='all',
+                             parser_info_out=warnings,
+                             streaming=streaming,
+                             profile=True)
+    assert out_dict == expected
+
+    timings = warnings['timings']
+    assert timings['total'] > 0
+    assert timings['xpath_evaluations'] > 0
+    assert timings['phases']['iteration_tasks']['calls'] == 6
+    assert timings['phases']['general_tasks']['calls'] == 1
+    assert {'fleur_modes', 'determine_tasks'}.issubset(timings['phases'])
+    if not streaming:
+        assert {'load', 'clear_xml', 'validation'}.issubset(timings['phases'])
+    assert timings['tasks']['total_energy']['calls'] == 6
+    assert timings['tasks']['total_energy']['xpath_evaluations'] > 0
+    assert timings['conversions']['convert_htr_to_ev']['calls'] > 0
+
+
+def test_outxml_timings_env_variable(test_file, monkeypatch):
+    """
+    Test that the timings of the outxml_parser can be enabled via the environment variable
+    """
+    from masci_tools.util.parser_timings import TIMINGS_ENV_VARIABLE
+
+    OUTXML_FILEPATH = test_file('fleur/Max-R5/SiLOXML/files/out.xml')
+
+    monkeypatch.setenv(TIMINGS_ENV_VARIABLE, '1')
+    warnings = {}
+    outxml_parser(OUTXML_FILEPATH, parser_info_out=warnings)
+    assert 'timings' in warnings
+
+    monkeypatch.setenv(TIMINGS_ENV_VARIABLE, 'false')
+    warnings = {}
+    outxml_parser(OUTXML_FILEPATH, parser_info_out=warnings)
+    assert 'timings' not in warnings
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+@pytest.mark.parametrize('iteration_to_parse', ['all', 'last'])
+@pytest.mark.parametrize('file_name', [
+    'fleur/Max-R5/SiLOXML/files/out.xml',
+    'fleur/Max-R5/Fe_bct_LOXML/files/out.xml',
+    'fleur/Max-R5/GaAsMultiUForceXML/files/out.xml',
+    'fleur/broken_out_xml/terminated.xml',
+])
+def test_outxml_iteration_output_numpy(test_file, file_name, iteration_to_parse, streaming):
+    """
+    Test that the numpy output mode of the outxml_parser produces arrays with the same
+    content as the list mode
+    """
+    import numpy as np
+
+    OUTXML_FILEPATH = test_file(file_name)
+
+    expected = outxml_parser(OUTXML_FILEPATH, iteration_to_parse=iteration_to_parse, list_return=True)
+    out_dict = outxml_parser(OUTXML_FILEPATH,
+                             iteration_to_parse=iteration_to_parse,
+                             iteration_output='numpy',
+                             streaming=streaming)
+
+    assert out_dict.keys() == expected.keys()
+    n_iters = len(expected['energy'])
+    for key, value in out_dict.items():
+        if isinstance(value, np.ndarray):
+            assert len(value) == n_iters
+            expected_value = [np.nan if val is None else val for val in expected[key]]
+            assert np.allclose(value, expected_value, equal_nan=True)
+        elif isinstance(value, dict) and key != 'fleur_modes':
+            assert value.keys() == expected[key].keys()
+        else:
+            assert value == expected[key]
+
+
+def test_outxml_iteration_output_pandas(test_file):
+    """
+    Test the pandas output mode of the outxml_parser
+    """
+    import pandas as pd
+
+    OUTXML_FILEPATH = test_file('fleur/Max-R5/GaAsMultiUForceXML/files/out.xml')
+
+    expected = outxml_parser(OUTXML_FILEPATH, iteration_to_parse='all')
+    out_dict = outxml_parser(OUTXML_FILEPATH, iteration_to_parse='all', iteration_output='pandas')
+
+    iterations = out_dict.pop('iterations')
+    assert isinstance(iterations, pd.DataFrame)
+    assert len(iterations) == 2
+    assert iterations['energy'].tolist() == expected['energy']
+    assert iterations['ldau_info.density_matrix_distance'].fillna(-1).tolist() == [
+        -1 if val is None else val for val in expected['ldau_info']['density_matrix_distance']
+    ]
+    assert iterations['force_atoms'].tolist() == expected['force_atoms']
+    assert iterations['density_convergence'].isna().tolist() == [False, True]
+
+    assert 'energy' not in out_dict
+    assert out_dict['energy_units'] == expected['energy_units']
+    assert out_dict['ldau_info']['Ga-1/31'] == expected['ldau_info']['Ga-1/31']
+
+
+def test_outxml_iteration_output_invalid(test_file):
+    """
+    Test that an invalid iteration_output raises an error
+    """
+    OUTXML_FILEPATH = test_file('fleur/Max-R5/SiLOXML/files/out.xml')
+
+    with pytest.raises(ValueError, match='Invalid value for iteration_output'):
+        outxml_parser(OUTXML_FILEPATH, iteration_output='arrays', strict=True)
+
+
+def test_iteration_column():
+    """
+    Test the storage of iteration quantities in _IterationColumn
+    """
+    import numpy as np
+    from masci_tools.io.parsers.fleur.fleur_outxml_parser import _IterationColumn
+
+    column = _IterationColumn(2)
+    column.set(0, 1)
+    column.set(2, 3)
+    values = column.finalize(4)
+    assert values.dtype == float
+    assert np.allclose(values, [1, np.nan, 3, np.nan], equal_nan=True)
+
+    column = _IterationColumn(3)
+    column.set(0, [1, 2])
+    column.set(1, [1.5, 2.5])
+    column.set(2, [3, 4])
+    values = column.finalize(3)
+    assert values.shape == (3, 2)
+    assert values.tolist() == [[1, 2], [1.5, 2.5], [3, 4]]
+
+    column = _IterationColumn(3)
+    column.set(0, [1, 2])
+    column.set(1, [1, 2, 3])
+    column.set(2, 'test')
+    assert column.finalize(3) == [[1, 2], [1, 2, 3], 'test']
+
+    column = _IterationColumn(2)
+    column.set(1, True)
+    assert column.finalize(2).tolist() == [None, True]
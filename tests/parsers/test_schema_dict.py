@@ -349,6 +349,29 @@ def test_tag_xpath_notcontains():
                                  not_contains='species') == '/fleurInput/atomGroups/atomGroup/ldaU'
 
 
+def test_find_paths_memoized(monkeypatch):
+    """
+    Test that the path queries are memoized and the returned lists are independent
+    """
+    schema_dict = InputSchemaDict.fromVersion(MAIN_TEST_VERSION)
+
+    expected = schema_dict._find_paths('radius', ('unique_path_attribs', 'other_attribs'), contains='species')
+    assert expected == ['/fleurInput/atomSpecies/species/mtSphere/@radius']
+    expected.append('modified')
+
+    monkeypatch.setattr(schema_dict, '_indexed_paths', None)  #Raises if the index is used again
+    assert schema_dict._find_paths('radius', ['unique_path_attribs', 'other_attribs'],
+                                   contains={'species'}) == ['/fleurInput/atomSpecies/species/mtSphere/@radius']
+
+    monkeypatch.undo()
+    #The size of the memoized queries is bounded
+    monkeypatch.setattr(schema_dict, '_PATH_QUERY_CACHE_SIZE', len(schema_dict._path_queries))
+    n_queries = len(schema_dict._path_queries)
+    assert schema_dict._find_paths('radius', ('unique_path_attribs', 'other_attribs'),
+                                   not_contains='species') == ['/fleurInput/atomGroups/atomGroup/mtSphere/@radius']
+    assert len(schema_dict._path_queries) == n_queries
+
+
 def test_tagattrib_xpath_case_insensitivity():
     """
     Test that the selection works with case insensitivity
@@ -647,6 +670,200 @@ def test_tag_info():
     assert res == EXPECTED_RESULT
 
 
+def test_schema_dict_disk_cache(tmp_path, monkeypatch):
+    """
+    Test that the schema dictionaries are stored in and restored from the on-disk cache
+    """
+    from masci_tools.io.parsers.fleur_schema import get_schema_cache_directory
+
+    monkeypatch.setenv('MASCI_TOOLS_SCHEMA_CACHE', str(tmp_path))
+    assert get_schema_cache_directory() == tmp_path
+
+    inputschema = InputSchemaDict.fromVersion(MAIN_TEST_VERSION, no_cache=True)
+    outputschema = OutputSchemaDict.fromVersion(MAIN_TEST_VERSION, no_cache=True)
+    assert len(list(tmp_path.glob('*.pickle'))) == 0
+
+    InputSchemaDict.clear_cache()
+    OutputSchemaDict.clear_cache()
+
+    new_inputschema = InputSchemaDict.fromVersion(MAIN_TEST_VERSION)
+    new_outputschema = OutputSchemaDict.fromVersion(MAIN_TEST_VERSION)
+    assert len(list(tmp_path.glob('InputSchemaDict-*.pickle'))) == 1
+    assert len(list(tmp_path.glob('OutputSchemaDict-*.pickle'))) == 1
+
+    InputSchemaDict.clear_cache()
+    OutputSchemaDict.clear_cache()
+
+    cached_inputschema = InputSchemaDict.fromVersion(MAIN_TEST_VERSION)
+    cached_outputschema = OutputSchemaDict.fromVersion(MAIN_TEST_VERSION)
+
+    assert cached_inputschema is not new_inputschema
+    assert cached_outputschema is not new_outputschema
+    assert cached_inputschema.get_unlocked() == inputschema.get_unlocked()
+    assert cached_outputschema.get_unlocked() == outputschema.get_unlocked()
+    assert cached_inputschema.locked
+    assert cached_outputschema['tag_paths'].locked
+    assert cached_outputschema.tag_xpath('iteration') == outputschema.tag_xpath('iteration')
+
+
+def test_schema_dict_disk_cache_invalid(tmp_path, monkeypatch):
+    """
+    Test that invalid entries in the on-disk cache are ignored and replaced
+    """
+    monkeypatch.setenv('MASCI_TOOLS_SCHEMA_CACHE', str(tmp_path))
+
+    InputSchemaDict.clear_cache()
+    inputschema = InputSchemaDict.fromVersion(MAIN_TEST_VERSION)
+    cache_file, = tmp_path.glob('InputSchemaDict-*.pickle')
+    cache_file.write_bytes(b'not a pickle')
+
+    InputSchemaDict.clear_cache()
+    new_inputschema = InputSchemaDict.fromVersion(MAIN_TEST_VERSION)
+    assert new_inputschema.get_unlocked() == inputschema.get_unlocked()
+    assert cache_file.read_bytes() != b'not a pickle'
+
+
+def test_schema_dict_disk_cache_write_failure(tmp_path, monkeypatch):
+    """
+    Test that failures when writing the on-disk cache are ignored and leave no temporary files
+    """
+    import pickle
+
+    monkeypatch.setenv('MASCI_TOOLS_SCHEMA_CACHE', str(tmp_path))
+
+    def failing_dump(*args, **kwargs):
+        raise pickle.PicklingError('Cannot pickle')
+
+    monkeypatch.setattr(pickle, 'dump', failing_dump)
+
+    InputSchemaDict.clear_cache()
+    inputschema = InputSchemaDict.fromVersion(MAIN_TEST_VERSION)
+    assert inputschema['inp_version'] == MAIN_TEST_VERSION
+    assert len(list(tmp_path.iterdir())) == 0
+    InputSchemaDict.clear_cache()
+
+
+def test_schema_dict_disk_cache_disabled(tmp_path, monkeypatch):
+    """
+    Test that the on-disk cache can be disabled with the environment variable
+    """
+    from masci_tools.io.parsers.fleur_schema import get_schema_cache_directory
+
+    monkeypatch.setenv('MASCI_TOOLS_SCHEMA_CACHE', '')
+    assert get_schema_cache_directory() is None
+
+    InputSchemaDict.clear_cache()
+    InputSchemaDict.fromVersion(MAIN_TEST_VERSION)
+    assert len(list(tmp_path.iterdir())) == 0
+
+
+def test_schema_dict_cache_lru():
+    """
+    Test the eviction of the least recently used entries and the statistics of the SchemaDictCache
+    """
+    from masci_tools.io.parsers.fleur_schema import SchemaDictCache
+
+    cache = SchemaDictCache(maxsize=2)
+    assert cache.get_or_build('a', lambda: 1) == 1
+    assert cache.get_or_build('b', lambda: 2) == 2
+    assert cache.get_or_build('a', lambda: 3) == 1
+    assert cache.get_or_build('c', lambda: 4) == 4
+
+    assert 'b' not in cache
+    assert len(cache) == 2
+
+    info = cache.info()
+    assert info['keys'] == ['a', 'c']
+    assert {
+        key: info[key] for key in ('hits', 'misses', 'builds', 'evictions', 'size', 'maxsize')
+    } == {
+        'hits': 1,
+        'misses': 3,
+        'builds': 3,
+        'evictions': 1,
+        'size': 2,
+        'maxsize': 2
+    }
+    assert info['build_time'] >= 0
+
+    assert cache.get_or_build('a', lambda: 5, rebuild=True) == 5
+    cache.maxsize = 1
+    assert cache.info()['keys'] == ['a']
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info()['builds'] == 4
+
+
+def test_schema_dict_cache_build_once():
+    """
+    Test that concurrent requests for the same missing entry only build it once
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import threading
+    import time
+    from masci_tools.io.parsers.fleur_schema import SchemaDictCache
+
+    cache = SchemaDictCache()
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def build():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return object()
+
+    def request():
+        barrier.wait()
+        return cache.get_or_build('key', build)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: request(), range(8)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    info = cache.info()
+    assert info['builds'] == 1
+    assert info['hits'] + info['misses'] == 8
+
+
+def test_schema_dict_cache_failed_build():
+    """
+    Test that failed builds are not stored and can be retried
+    """
+    from masci_tools.io.parsers.fleur_schema import SchemaDictCache
+
+    cache = SchemaDictCache()
+
+    def build():
+        raise ValueError('Failed')
+
+    with pytest.raises(ValueError, match='Failed'):
+        cache.get_or_build('key', build)
+    assert 'key' not in cache
+    assert cache.get_or_build('key', lambda: 1) == 1
+
+
+def test_schema_dict_warmup():
+    """
+    Test the warmup of the in-memory caches of the schema dictionaries
+    """
+    InputSchemaDict.clear_cache()
+    OutputSchemaDict.clear_cache()
+
+    InputSchemaDict.warmup([MAIN_TEST_VERSION])
+    OutputSchemaDict.warmup([MAIN_TEST_VERSION, (MAIN_TEST_VERSION, '0.33')])
+
+    assert set(InputSchemaDict.cache_info()['keys']) == {MAIN_TEST_VERSION, '0.33'}
+    assert OutputSchemaDict.cache_info()['keys'] == [(MAIN_TEST_VERSION, MAIN_TEST_VERSION),
+                                                     (MAIN_TEST_VERSION, '0.33')]
+
+    hits = OutputSchemaDict.cache_info()['hits']
+    schema_dict = OutputSchemaDict.fromVersion(MAIN_TEST_VERSION, inp_version='0.33')
+    assert schema_dict['inp_version'] == '0.33'
+    assert OutputSchemaDict.cache_info()['hits'] == hits + 1
+
+
 def clean_for_reg_dump(value_to_clean):
     """
     Clean for data regression converts CaseInsensitiveFrozenSet to set
@@ -199,6 +199,34 @@ class Test_kkr_parser_functions:
         assert not success
         assert msg_list == ['Error parsing output of KKR: spin moment per atom']
 
+    def test_scan_outfile(self):
+        """
+        Check that the single pass scan collects the same lines as separate searches
+        """
+        from masci_tools.io.parsers.kkrparser_functions import scan_outfile, parse_array_float
+        from masci_tools.io.common_functions import get_outfile_txt
+
+        searchstrings = ['TOTAL ENERGY in ryd.', 'E FERMI', 'not in the file']
+        lines = scan_outfile(self.outfile, searchstrings)
+        alltxt = get_outfile_txt(self.outfile)
+        for searchstring in searchstrings:
+            assert lines[searchstring] == [line for line in alltxt if searchstring in line]
+        assert len(lines['TOTAL ENERGY in ryd.']) > 0
+        assert len(lines['not in the file']) == 0
+
+        etot = parse_array_float(self.outfile, 'TOTAL ENERGY in ryd.', [1, ':', 1])
+        assert list(etot) == [float(line.split(':')[1]) for line in lines['TOTAL ENERGY in ryd.']]
+
+    def test_extract_timings_no_timings(self):
+        """
+        Check that extract_timings raises an IndexError (like before the single pass scan)
+        if no timings are found
+        """
+        from masci_tools.io.parsers.kkrparser_functions import extract_timings
+
+        with pytest.raises(IndexError, match='No timings found'):
+            extract_timings(self.outfile_0init)
+
     def test_check_error_category(self):
         """
         Check check_error_category function used in parser after parse_kkr_outputfile is used
@@ -136,6 +136,21 @@ def test_list_elements(test_file):
     ]
 
 
+def test_list_elements_any_extension(test_file, tmp_path):
+    """
+    Test of the listElements function with a file without a .hdf extension
+    """
+    import shutil
+    from masci_tools.tools.greensfunction import listElements
+
+    shutil.copy(test_file('fleur/greensf/greensf_sphavg.hdf'), tmp_path / 'greensf.dat')
+
+    elem = listElements(tmp_path / 'greensf.dat')
+    reference = listElements(test_file('fleur/greensf/greensf_sphavg.hdf'))
+    assert len(elem) == len(reference) > 0
+    assert [e.l for e in elem] == [e.l for e in reference]
+
+
 def test_print_elements(test_file, capsys):
     """
     Test of the printElements function
@@ -350,3 +365,34 @@ def test_greensfunction_moment(test_file):
                          [[[0.148914, 0.], [0., -0.381151]], [[0., 0.], [0., 0.]], [[0., 0.], [0., 0.]],
                           [[0., 0.], [0., 0.]], [[3.323959, 0.], [0., 1.506008]]]])
     assert np.allclose(first_moment, expected, atol=1e-6)
+
+
+def test_greensfunction_file(test_file):
+    """
+    Test of reading multiple elements from one opened file
+    """
+    from masci_tools.tools.greensfunction import GreensFunctionFile, listElements
+
+    gf_file = GreensFunctionFile(test_file('fleur/greensf/greensf_sphavg.hdf'))
+    with gf_file:
+        assert gf_file.version == 7
+        assert gf_file.num_elements == 1
+        elements = gf_file.elements
+
+        gfs = gf_file.read_elements([1, 1], max_workers=2)
+        assert gfs[0] is gfs[1]
+
+        #Nested usage keeps the file opened
+        gf = GreensFunction.fromFile(gf_file, index=1)
+        assert gf_file.file
+
+        with pytest.raises(ValueError, match='Invalid element index'):
+            gf_file.read_element(2)
+
+    with pytest.raises(ValueError, match='not opened'):
+        gf_file.file  #pylint: disable=pointless-statement
+
+    assert [elem.l for elem in elements] == [elem.l for elem in listElements(gf_file)]
+    reference = GreensFunction.fromFile(test_file('fleur/greensf/greensf_sphavg.hdf'), index=1)
+    assert gf.element._replace(atomDiff=None) == reference.element._replace(atomDiff=None)
+    assert np.allclose(gfs[0].energy_dependence(spin=1), reference.energy_dependence(spin=1))
@@ -46,3 +46,46 @@ def test_calculate_expression_errors():
         calculate_expression('1..09', FLEUR_DEFINED_CONSTANTS)
     with pytest.raises(ValueError, match=r'Invalid Expression: Unbalanced parentheses'):
         calculate_expression('(1.04+7.89*(6.3/Pi)', FLEUR_DEFINED_CONSTANTS)
+
+
+def test_compile_expression():
+    """
+    Test that compiled expressions are reused and can be evaluated with different constants
+    """
+    from masci_tools.util.fleur_calculate_expression import compile_expression, CompiledExpression
+
+    compiled = compile_expression('2*A+Pi/2')
+    assert isinstance(compiled, CompiledExpression)
+    assert compile_expression('2*A+Pi/2') is compiled
+    assert compiled.constants == ('A', 'Pi')
+
+    assert pytest.approx(compiled.evaluate({**FLEUR_DEFINED_CONSTANTS, 'A': 1.0})) == 2.0 + 1.5707963268
+    assert pytest.approx(compiled.evaluate({**FLEUR_DEFINED_CONSTANTS, 'A': 2.0})) == 4.0 + 1.5707963268
+    with pytest.raises(MissingConstant, match=r'A'):
+        compiled.evaluate(FLEUR_DEFINED_CONSTANTS)
+
+    assert calculate_expression('2*A', {'A': 2}) == 4
+    assert isinstance(calculate_expression('2*A', {'A': 2}), float)
+    assert calculate_expression('A', {'A': 2}) == 2
+    assert isinstance(calculate_expression('A', {'A': 2}), int)
+    assert isinstance(calculate_expression('A', {'A': 2.0}), float)
+
+    #Errors are raised in the order in which the expression is evaluated
+    with pytest.raises(ValueError, match=r'Undefined Expression: Division by zero'):
+        calculate_expression('1/0+&', FLEUR_DEFINED_CONSTANTS)
+    with pytest.raises(MissingConstant, match=r'A'):
+        calculate_expression('A+log(0.0)', FLEUR_DEFINED_CONSTANTS)
+    with pytest.raises(ValueError, match=r'Invalid expression: log\(x\), x\<\=0'):
+        calculate_expression('log(0.0)+A', FLEUR_DEFINED_CONSTANTS)
+
+
+def test_calculate_expressions():
+    """
+    Test of the evaluation of multiple expressions
+    """
+    from masci_tools.util.fleur_calculate_expression import calculate_expressions
+
+    assert pytest.approx(calculate_expressions(['1/3', 'Pi/2', 0.5, '1/3'],
+                                               FLEUR_DEFINED_CONSTANTS)) == [1 / 3, 1.5707963268, 0.5, 1 / 3]
+    with pytest.raises(MissingConstant, match=r'A'):
+        calculate_expressions(['1/3', 'A'], FLEUR_DEFINED_CONSTANTS)
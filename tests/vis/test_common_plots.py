@@ -207,3 +207,89 @@ def test_convergence_bokeh(check_bokeh_plot):
     p = gridplot([p1, p2], ncols=1)
 
     check_bokeh_plot(p)
+
+
+def test_lttb_indices():
+    """
+    Test of the lttb_indices function
+    """
+    from masci_tools.vis.common import lttb_indices
+
+    x = np.linspace(0, 10, 1000)
+    y = np.sin(x)
+    y[437] = 5.0
+
+    indices = lttb_indices(x, y, 50)
+    assert len(indices) == 50
+    assert indices[0] == 0
+    assert indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+    assert 437 in indices
+
+    np.testing.assert_array_equal(lttb_indices(x[:20], y[:20], 50), np.arange(20))
+
+
+def test_downsample_bands():
+    """
+    Test of the downsample_bands function
+    """
+    from masci_tools.vis.common import downsample_bands
+
+    nkpts, nbands = 400, 3
+    kpath = np.repeat(np.linspace(0, 4, nkpts), nbands)
+    band_index = np.tile(np.arange(nbands), nkpts)
+    eigenvalues = band_index + np.sin(5 * kpath) + 0.01 * kpath
+    weights = np.where(band_index == 1, 0.01, 1.0)
+    special_kpoints = [('$\\Gamma$', 0.0), ('X', 1.2345), ('M', 4.0)]
+
+    indices = downsample_bands(kpath, eigenvalues, band_index, max_points=40, special_kpoints=special_kpoints)
+    assert len(indices) < len(kpath) / 5
+    assert np.all(np.diff(indices) > 0)
+
+    for band in range(nbands):
+        mask = band_index == band
+        band_indices = np.nonzero(mask)[0]
+        selected = indices[band_index[indices] == band]
+        assert band_indices[np.argmin(eigenvalues[mask])] in selected
+        assert band_indices[np.argmax(eigenvalues[mask])] in selected
+        for _, position in special_kpoints:
+            assert band_indices[np.argmin(np.abs(kpath[mask] - position))] in selected
+
+    culled = downsample_bands(kpath, eigenvalues, band_index, max_points=40, weights=weights, weight_threshold=0.1)
+    assert set(band_index[culled]) == {0, 2}
+
+    np.testing.assert_array_equal(downsample_bands(kpath, eigenvalues, band_index, max_points=1000),
+                                  np.arange(len(kpath)))
+
+
+def test_bands_level_of_detail():
+    """
+    Test of the level_of_detail argument of the bands function
+    """
+    import pandas as pd
+    from masci_tools.vis.common import bands
+
+    nkpts, nbands = 2000, 4
+    kpath = np.repeat(np.linspace(0, 4, nkpts), nbands)
+    band_index = np.tile(np.arange(nbands), nkpts)
+    data = pd.DataFrame({'kpath': kpath, 'eig': band_index + np.sin(5 * kpath), 'band_index': band_index})
+
+    ax = bands('kpath',
+               'eig',
+               data=data,
+               band_index='band_index',
+               level_of_detail={
+                   'max_points': 100,
+                   'rasterize_threshold': 10
+               },
+               show=False)
+    n_points = sum(len(line.get_xdata()) for line in ax.get_lines())
+    assert n_points < 5 * nbands * 100
+    assert all(line.get_rasterized() for line in ax.get_lines() if len(line.get_xdata()) > 2)
+    plt.close('all')
+
+    with pytest.raises(ValueError, match='Unknown options'):
+        bands('kpath', 'eig', data=data, band_index='band_index', level_of_detail={'points': 100}, show=False)
+    with pytest.raises(ValueError, match='band_index'):
+        bands('kpath', 'eig', data=data, level_of_detail=True, show=False)
+    plt.close('all')
@@ -865,3 +865,43 @@ def test_plot_bands_weighted_spinpol_force_non_spinpol_custom_weight_mpl():
     plot_fleur_bands(data, attributes, show=False, spinpol=False, weight='Custom')
 
     return gcf()
+
+
+def test_prepare_bands_data():
+    """
+    Test the preparation of the bandstructure data (band indices and stacking of spins)
+    """
+    import numpy as np
+    import pandas as pd
+    from masci_tools.io.parsers.hdf5 import HDF5Reader
+    from masci_tools.io.parsers.hdf5.recipes import FleurBands
+    from masci_tools.vis.fleur import _prepare_bands_data
+
+    TEST_BANDDOS_FILE = os.path.join(HDFTEST_DIR, 'banddos_spinpol_bands.hdf')
+
+    with HDF5Reader(TEST_BANDDOS_FILE) as h5reader:
+        data, attributes = h5reader.read(recipe=FleurBands)
+
+    nbands = attributes['nbands']
+    nrows = len(data['kpath'])
+
+    prepared, special_kpoints, spinpol_data = _prepare_bands_data(data, attributes)
+    assert spinpol_data
+    assert prepared['eigenvalues_up'] is data['eigenvalues_up']
+    np.testing.assert_array_equal(prepared['band_index'][:2 * nbands], list(range(nbands)) * 2)
+    assert [label for label, _ in special_kpoints] == list(attributes['special_kpoint_labels'])
+    assert special_kpoints[1][1] == data['kpath'][attributes['special_kpoint_indices'][1] * nbands + 1]
+
+    stacked, _, _ = _prepare_bands_data(pd.DataFrame(data=data), attributes, spinpol=False)
+    assert len(stacked['kpath']) == 2 * nrows
+    assert not any(key.endswith('_down') for key in stacked)
+    np.testing.assert_array_equal(stacked['eigenvalues_up'][nrows:], data['eigenvalues_down'])
+    np.testing.assert_array_equal(stacked['band_index'][nrows:], prepared['band_index'] + nbands + 1)
+
+    only_down, _, spinpol_data = _prepare_bands_data(data, attributes, only_spin='down')
+    assert not spinpol_data
+    assert only_down['eigenvalues_up'] is data['eigenvalues_down']
+    assert 'eigenvalues_down' not in only_down
+
+    with pytest.raises(ValueError, match='Invalid value for only spin'):
+        _prepare_bands_data(data, attributes, only_spin='both')
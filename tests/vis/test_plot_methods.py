@@ -1658,3 +1658,56 @@ def test_lattice_constant_defaults_multi_fit(lattice_constant_data):
     plot_lattice_constant(scaling, energy_data, fit_data=fit, show=False)
 
     return gcf()
+
+
+@pytest.mark.parametrize(
+    'peakfunction', ['gaus', 'voigt', 'pseudo-voigt', 'lorentz', 'doniach-sunjic', 'asymmetric_lorentz_gauss_conv'])
+def test_construct_corelevel_spectrum(peakfunction):
+    """
+    Test of the construction of corelevel spectra with the different methods
+    """
+    from masci_tools.vis.plot_methods import construct_corelevel_spectrum
+    import numpy as np
+
+    coreleveldict = {'Be': {'1s1/2': [-1.02, -0.32, -0.79]}, 'W': {'4f7/2': [31.3, 31.9], '4f5/2': [33.5]}}
+    natom_typesdict = {'Be': [4, 4, 2], 'W': [1, 2, 1]}
+
+    xdata_spec, ydata_spec, ydata_single_all, xdata_all, ydata_all, xdatalabel = construct_corelevel_spectrum(
+        coreleveldict, natom_typesdict, peakfunction=peakfunction, energy_grid=0.01, chunk_size=2)
+
+    assert xdata_all == [-1.02, -0.32, -0.79, 31.3, 31.9, 33.5]
+    assert ydata_all == [8, 8, 4, 8, 16, 6]
+    assert xdatalabel == ['Be 1s1/2'] * 3 + ['W 4f7/2'] * 2 + ['W 4f5/2']
+    assert len(ydata_single_all) == 6
+    assert all(len(ydata) == len(xdata_spec) for ydata in ydata_single_all)
+    np.testing.assert_allclose(np.sum(ydata_single_all, axis=0), ydata_spec, atol=1e-10)
+
+    _, ydata_spec_fft, ydata_single_fft, _, _, _ = construct_corelevel_spectrum(coreleveldict,
+                                                                                natom_typesdict,
+                                                                                peakfunction=peakfunction,
+                                                                                energy_grid=0.01,
+                                                                                method='fft',
+                                                                                single_peaks=False)
+    assert ydata_single_fft == []
+    assert np.max(np.abs(ydata_spec_fft - ydata_spec)) < 1e-2 * np.max(ydata_spec)
+
+
+def test_construct_corelevel_spectrum_errors():
+    """
+    Test of the errors of construct_corelevel_spectrum
+    """
+    from masci_tools.vis.plot_methods import construct_corelevel_spectrum
+    import numpy as np
+
+    coreleveldict = {'Be': {'1s1/2': [-1.02, -0.32]}}
+    natom_typesdict = {'Be': [4, 4]}
+
+    with pytest.raises(ValueError, match='peakfunction'):
+        construct_corelevel_spectrum(coreleveldict, natom_typesdict, peakfunction='gauss')
+    with pytest.raises(ValueError, match='method'):
+        construct_corelevel_spectrum(coreleveldict, natom_typesdict, method='convolution')
+    with pytest.raises(ValueError, match='equidistant'):
+        construct_corelevel_spectrum(coreleveldict,
+                                     natom_typesdict,
+                                     xspec=np.array([-3.0, -2.0, 0.0, 0.5]),
+                                     method='fft')
@@ -689,6 +689,39 @@ def test_schema_dict_util_filters(load_inpxml):
                         }})
 
 
+def test_schema_dict_util_selection_cache(load_inpxml):
+    """
+    Test that the selected paths are stored on the schema dictionary
+    and give the same results
+    """
+    from masci_tools.util.schema_dict_util import evaluate_attribute, _select_attrib_xpath
+    from masci_tools.util.xml.common_functions import eval_xpath
+
+    xmltree, schema_dict = load_inpxml(TEST_INPXML_PATH, absolute=False)
+    root = xmltree.getroot()
+    schema_dict.selection_cache.clear()
+
+    first = evaluate_attribute(root, schema_dict, 'radius', FLEUR_DEFINED_CONSTANTS, contains='species')
+    assert len(schema_dict.selection_cache) == 1
+    second = evaluate_attribute(root, schema_dict, 'radius', FLEUR_DEFINED_CONSTANTS, contains=['species'])
+    assert len(schema_dict.selection_cache) == 2
+    assert first == second
+    evaluate_attribute(root, schema_dict, 'radius', FLEUR_DEFINED_CONSTANTS, contains='species')
+    assert len(schema_dict.selection_cache) == 2
+
+    #Relative paths are cached separately
+    species = eval_xpath(root, '//species', list_return=True)[0]
+    assert _select_attrib_xpath(species, schema_dict, 'radius') == './mtSphere/@radius'
+    assert _select_attrib_xpath(root, schema_dict, 'radius',
+                                contains='species') == '/fleurInput/atomSpecies/species/mtSphere/@radius'
+
+    #Errors are not cached
+    with pytest.raises(NoUniquePathFound):
+        _select_attrib_xpath(root, schema_dict, 'radius')
+    with pytest.raises(NoUniquePathFound):
+        _select_attrib_xpath(root, schema_dict, 'radius')
+
+
 def test_reverse_xinclude(load_inpxml):
     """
     Test of the reverse_xinclude function
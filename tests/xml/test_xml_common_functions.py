@@ -197,6 +197,49 @@ def test_clear_xml_multiple_comments_outside_root(load_inpxml):
     assert cleared_root.getnext() is None
 
 
+def test_clear_xml_inplace(load_inpxml):
+    """
+    Test of the clear_xml function with inplace=True
+    """
+    from masci_tools.util.xml.common_functions import eval_xpath, clear_xml, requires_clearing
+
+    xmltree, _ = load_inpxml('fleur/test_clear.xml', absolute=False)
+    assert requires_clearing(xmltree)
+
+    cleared_tree, all_include_tags = clear_xml(xmltree, inplace=True)
+
+    assert cleared_tree is xmltree
+    assert all_include_tags == {'symmetryOperations'}
+    assert not requires_clearing(xmltree)
+
+    comments = eval_xpath(xmltree, '//comment()', list_return=True)
+    assert len(comments) == 0
+
+    symmetry_tags = eval_xpath(xmltree, '//symOp', list_return=True)
+    assert len(symmetry_tags) == 16
+
+    #Nothing left to clear so the same tree is returned unchanged
+    content_before = etree.tostring(xmltree)
+    cleared_tree, all_include_tags = clear_xml(xmltree, inplace=True)
+    assert cleared_tree is xmltree
+    assert all_include_tags == set()
+    assert etree.tostring(cleared_tree) == content_before
+
+
+def test_requires_clearing_comments_outside_root(load_inpxml):
+    """
+    Test of the requires_clearing function for comments outside the root
+    """
+    from masci_tools.util.xml.common_functions import clear_xml, requires_clearing
+
+    xmltree, _ = load_inpxml('fleur/test_clear_multiple_comments.xml', absolute=False)
+    assert requires_clearing(xmltree)
+
+    cleared_tree, _ = clear_xml(xmltree)
+    assert not requires_clearing(cleared_tree)
+    assert requires_clearing(xmltree)
+
+
 def test_get_xml_attribute(load_inpxml, caplog):
     """
     Test of the clear_xml function
@@ -167,6 +167,31 @@ def test_convert_from_xml_explicit_warnings(caplog, string_attr, types, results,
             assert expected_warning in caplog.text
 
 
+def test_convert_from_xml_single_values_bulk():
+    """
+    Test of the convert_from_xml_single_values function for lists of values
+    which are converted in one go (fortran exponents and expressions)
+    """
+    import numpy as np
+    from masci_tools.util.xml.converters import convert_from_xml_single_values
+
+    ret_val, suc = convert_from_xml_single_values(['1.0', '-2.5D-1', '3E2', '.5'], ('float',))
+    assert ret_val == [1.0, -0.25, 300.0, 0.5]
+    assert suc
+
+    ret_val, suc = convert_from_xml_single_values(['1.0', 'Pi/2.0', '-0.5'], ('float_expression',),
+                                                  constants=FLEUR_DEFINED_CONSTANTS)
+    assert ret_val == pytest.approx([1.0, np.pi / 2, -0.5])
+    assert suc
+
+    with pytest.raises(ValueError, match='convert'):
+        convert_from_xml_single_values(['1.0', '1e5'], ('float_expression',), constants=FLEUR_DEFINED_CONSTANTS)
+
+    ret_val, suc = convert_from_xml_single_values(['1', 'T', '2', 'F'], ('int', 'switch'))
+    assert ret_val == [1, True, 2, False]
+    assert suc
+
+
 TO_XML_VALUES = [
     1.2134, 'all', ['all', 213, '-12'], ['3.14', 'NOT_PI', 1.2], '1', [False, 'True'], [0.0, 'Pi/4.0', 6.3121],
     [0.0, 'Pi/4.0', 6.3121], [0.0, 'Pi/4.0', 6.3121], [[0.0, 'Pi/4.0', 6.3121], ['Bohr', 'Pi/4.0', 'all']],
@@ -836,3 +836,57 @@ def test_xml_create_tag_misaligned_order(load_inpxml):
     nodes = eval_xpath(root, '/fleurInput/atomSpecies/species')
 
     assert [[child.tag for child in node.iterchildren()] for node in nodes] == tags
+
+
+def test_track_modifications(load_inpxml):
+    """
+    Test that the modified elements are recorded by track_modifications
+    """
+    from masci_tools.util.xml.xml_setters_basic import track_modifications, xml_set_attrib_value_no_create, \
+        xml_delete_tag, xml_create_tag
+    from masci_tools.util.xml.common_functions import eval_xpath
+
+    xmltree, _ = load_inpxml(TEST_INPXML_PATH, absolute=False)
+    root = xmltree.getroot()
+
+    with track_modifications() as outer:
+        xml_set_attrib_value_no_create(xmltree, '/fleurInput/calculationSetup/cutoffs', 'Kmax', '4.0')
+        with track_modifications() as inner:
+            xml_delete_tag(xmltree, '/fleurInput/atomSpecies/species/lo')
+            xml_create_tag(xmltree, '/fleurInput/atomGroups', 'TEST_TAG')
+
+    xml_set_attrib_value_no_create(xmltree, '/fleurInput/calculationSetup/cutoffs', 'Gmax', '12.0')
+
+    cutoffs = eval_xpath(root, '/fleurInput/calculationSetup/cutoffs')
+    species = eval_xpath(root, '/fleurInput/atomSpecies/species')
+    atomgroups = eval_xpath(root, '/fleurInput/atomGroups')
+
+    assert set(inner) == {*species, atomgroups}
+    assert set(outer) == {cutoffs, *species, atomgroups}
+    assert outer[0] is cutoffs
+
+
+def test_deferred_indentation(load_inpxml):
+    """
+    Test that the indentation is done once when leaving deferred_indentation
+    with the same result as indenting after each modification
+    """
+    from lxml import etree
+    from masci_tools.util.xml.xml_setters_basic import deferred_indentation, xml_create_tag, xml_delete_tag
+
+    order = ['mtSphere', 'atomicCutoffs', 'electronConfig', 'energyParameters', 'ldaU', 'lo']
+
+    expected_tree, _ = load_inpxml(TEST_INPXML_PATH, absolute=False)
+    xml_create_tag(expected_tree, '/fleurInput/atomSpecies/species', '<ldaU l="2" U="5.0" J="0.5"/>', tag_order=order)
+    xml_create_tag(expected_tree, '/fleurInput/atomSpecies/species', 'lo', tag_order=order)
+    xml_delete_tag(expected_tree, '/fleurInput/atomSpecies/species/mtSphere')
+
+    xmltree, _ = load_inpxml(TEST_INPXML_PATH, absolute=False)
+    with deferred_indentation():
+        xml_create_tag(xmltree, '/fleurInput/atomSpecies/species', '<ldaU l="2" U="5.0" J="0.5"/>', tag_order=order)
+        with deferred_indentation():
+            xml_create_tag(xmltree, '/fleurInput/atomSpecies/species', 'lo', tag_order=order)
+        xml_delete_tag(xmltree, '/fleurInput/atomSpecies/species/mtSphere')
+        assert etree.tostring(xmltree) != etree.tostring(expected_tree)
+
+    assert etree.tostring(xmltree) == etree.tostring(expected_tree)
@@ -2788,6 +2788,43 @@ def test_set_kpointlist_max5_special_labels_and_type(load_inpxml):
     assert eval_xpath(root, "/fleurInput/cell/bzIntegration/kPointLists/kPointList[@name='second-set']/@type") == 'mesh'
 
 
+def test_set_kpointlist_max5_array(load_inpxml):
+    """
+    Test that kpoints given as arrays produce the same kPointList as
+    converting each kpoint with the FleurElementMaker
+    """
+    from masci_tools.util.xml.xml_setters_names import set_kpointlist
+    from masci_tools.util.xml.common_functions import eval_xpath
+    from masci_tools.util.xml.builder import FleurElementMaker
+    import numpy as np
+
+    xmltree, schema_dict = load_inpxml(TEST_INPXML_PATH, absolute=False)
+    root = xmltree.getroot()
+
+    kpoints = np.array([[0.0, 0.0, 0.0], [0.5, -0.25, 1 / 3], [-0.125, 0.375, 0.0]])
+    weights = np.array([0.25, 0.5, 0.25])
+
+    xmltree = set_kpointlist(xmltree, schema_dict, kpoints, weights, name='second-set', special_labels={1: 'TEST'})
+
+    E = FleurElementMaker(schema_dict)
+    expected = [
+        E.kpoint(kpoint, weight=weight, label='TEST') if indx == 1 else E.kpoint(kpoint, weight=weight)
+        for indx, (kpoint, weight) in enumerate(zip(kpoints, weights))
+    ]
+
+    kpoint_elements = eval_xpath(root,
+                                 "/fleurInput/cell/bzIntegration/kPointLists/kPointList[@name='second-set']/kPoint")
+    assert [etree.tostring(elem, with_tail=False) for elem in kpoint_elements
+            ] == [etree.tostring(elem) for elem in expected]
+    assert eval_xpath(root,
+                      "/fleurInput/cell/bzIntegration/kPointLists/kPointList[@name='second-set']/kPoint/text()") == [
+                          ' 0.0000000000000  0.0000000000000  0.0000000000000',
+                          ' 0.5000000000000 -0.2500000000000  0.3333333333333',
+                          '-0.1250000000000  0.3750000000000  0.0000000000000'
+                      ]
+    assert eval_xpath(root, "/fleurInput/cell/bzIntegration/kPointLists/kPointList[@name='second-set']/@count") == '3'
+
+
 def test_set_kpointlist_max5_default_name(load_inpxml):
     from masci_tools.util.xml.xml_setters_names import set_kpointlist
     from masci_tools.util.xml.common_functions import eval_xpath
@@ -0,0 +1,145 @@
+"""
+Script to compare the benchmarks in the ``benchmarks`` folder between two commits
+
+The benchmarks (always the version of the current working tree) are run against both
+commits (checked out in temporary git worktrees) and the minimum time and peak memory
+(increase of the resident set size) of each benchmark are compared. Benchmarks, which fail
+or are skipped for one of the commits are listed as only present in one run. If any benchmark
+is slower than the given threshold the script exits with a non-zero exit code
+
+Usage::
+
+    python utils/compare_benchmarks.py BASE [TARGET] [--threshold 0.1] [-- PYTEST_ARGS]
+
+If no target is given, the current working tree is compared to the base commit.
+Arguments after ``--`` are passed on to pytest (e.g. ``-- -k outxml`` to select benchmarks)
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from tabulate import tabulate
+
+REPO_PATH = Path(__file__).parent.parent.resolve()
+BENCHMARKS_PATH = REPO_PATH / 'benchmarks'
+
+
+def run_benchmarks(source_path, output_file, pytest_args):
+    """
+    Run the benchmarks with the masci_tools package in the given path and
+    write the results to the given json file
+
+    Failing benchmarks (e.g. for features not available in older commits) do not
+    abort the comparison. They are missing from the results and are reported as only
+    present in one run
+    """
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join([str(source_path), env.get('PYTHONPATH', '')])
+    result = subprocess.run([
+        sys.executable, '-m', 'pytest',
+        str(BENCHMARKS_PATH), '-p', 'no:cacheprovider', '-q', f'--benchmark-json={output_file}', *pytest_args
+    ],
+                            cwd=source_path,
+                            env=env,
+                            check=False)
+
+    if not Path(output_file).exists():
+        print(f'The benchmarks for {source_path} produced no results (exit code {result.returncode})')
+        return {}
+
+    with open(output_file, encoding='utf-8') as file:
+        return {bench['fullname']: bench for bench in json.load(file)['benchmarks']}
+
+
+def run_benchmarks_for_commit(commit, output_file, pytest_args):
+    """
+    Run the benchmarks for the given commit (checked out in a temporary worktree)
+    If commit is None the current working tree is used
+    """
+    if commit is None:
+        return run_benchmarks(REPO_PATH, output_file, pytest_args)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        worktree = Path(tmpdir) / 'worktree'
+        subprocess.run(['git', 'worktree', 'add', '--detach', str(worktree), commit], cwd=REPO_PATH, check=True)
+        try:
+            return run_benchmarks(worktree, output_file, pytest_args)
+        finally:
+            subprocess.run(['git', 'worktree', 'remove', '--force', str(worktree)], cwd=REPO_PATH, check=True)
+
+
+def compare_results(base, target, threshold):
+    """
+    Compare the benchmark results of the base and target
+
+    :returns: list of rows for the table and list of the names of the slower benchmarks
+    """
+    rows = []
+    regressions = []
+    for name in sorted(base.keys() & target.keys()):
+        base_time = base[name]['stats']['min']
+        target_time = target[name]['stats']['min']
+        time_ratio = target_time / base_time
+
+        base_memory = base[name]['extra_info'].get('peak_memory')
+        target_memory = target[name]['extra_info'].get('peak_memory')
+        memory_ratio = None
+        if base_memory and target_memory:
+            memory_ratio = target_memory / base_memory
+
+        status = ''
+        if time_ratio > 1 + threshold:
+            status = 'SLOWER'
+            regressions.append(name)
+        elif time_ratio < 1 - threshold:
+            status = 'faster'
+        if memory_ratio is not None and memory_ratio > 1 + threshold:
+            status = f'{status} MORE MEMORY'.strip()
+            if name not in regressions:
+                regressions.append(name)
+
+        rows.append([
+            name.replace('benchmarks/', ''), f'{base_time*1000:.3f}', f'{target_time*1000:.3f}', f'{time_ratio:.2f}',
+            f'{memory_ratio:.2f}' if memory_ratio is not None else '-', status
+        ])
+
+    for name in sorted(base.keys() ^ target.keys()):
+        rows.append([name.replace('benchmarks/', ''), '-', '-', '-', '-', 'only in one run'])
+
+    return rows, regressions
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Compare the masci-tools benchmarks between two commits')
+    parser.add_argument('base', help='Commit to compare against')
+    parser.add_argument('target', nargs='?', default=None, help='Commit to compare (default: current working tree)')
+    parser.add_argument('--threshold',
+                        type=float,
+                        default=0.1,
+                        help='Relative change of the minimum time/peak memory counted as a regression (default: 0.1)')
+
+    script_args, pytest_args = sys.argv[1:], []
+    if '--' in script_args:
+        pytest_args = script_args[script_args.index('--') + 1:]
+        script_args = script_args[:script_args.index('--')]
+    args = parser.parse_args(script_args)
+
+    with tempfile.TemporaryDirectory() as results_dir:
+        base_results = run_benchmarks_for_commit(args.base, Path(results_dir) / 'base.json', pytest_args)
+        target_results = run_benchmarks_for_commit(args.target, Path(results_dir) / 'target.json', pytest_args)
+
+    table, slower = compare_results(base_results, target_results, args.threshold)
+    print(
+        tabulate(table,
+                 headers=['Benchmark', 'Base min [ms]', 'Target min [ms]', 'Time ratio', 'Memory ratio', 'Status']))
+
+    if slower:
+        print(f'\n{len(slower)} benchmark(s) got slower by more than {args.threshold:.0%}:')
+        for bench_name in slower:
+            print(f'  - {bench_name}')
+        sys.exit(1)